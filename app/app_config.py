@@ -39,6 +39,93 @@ class Settings(BaseSettings):
 
     TEST_SQLALCHEMY_DATABASE_URL: str
 
+    # True 면 asyncpg / aiosqlite 기반 AsyncSession 위에서 async 라우트의 DB 작업을 수행
+    DB_ASYNC_MODE: bool = False
+
+    # 커넥션 풀 설정
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30  # 커넥션을 얻기까지 최대 대기 시간 (초)
+    DB_POOL_RECYCLE: int = 1800  # 이 시간(초)보다 오래된 커넥션은 재연결, -1 이면 사용 안함
+    DB_POOL_PRE_PING: bool = True  # checkout 시 커넥션 유효성 검사
+
+    # 요청별 SQL 개수/시간 응답 헤더 (X-DB-Query-Count, X-DB-Query-Time), N+1 의심 로그
+    DB_QUERY_STATS: bool = True
+    DB_N_PLUS_ONE_THRESHOLD: int = 5  # 같은 SQL 이 이 횟수 이상 반복되면 경고
+
+    # 느린 쿼리 로그, 0 이하면 사용 안함
+    DB_SLOW_QUERY_MS: float = 500
+    DB_SLOW_QUERY_EXPLAIN: bool = True  # postgres 에서 느린 SELECT 의 EXPLAIN (ANALYZE, BUFFERS) 수집
+    DB_SLOW_QUERY_EXPLAIN_PATH: str = "logs/slow_query_explain.jsonl"
+
+    # 이미지 서명 url 캐시
+    SIGNED_URL_EXPIRATION_MINUTES: int = 60
+    SIGNED_URL_REFRESH_MINUTES: int = 10  # 만료 이 시간(분) 전부터는 새로 서명
+    SIGNED_URL_CACHE_SIZE: int = 10000
+
+    BLOB_DELETE_WORKERS: int = 8  # storage 사진 동시 삭제 개수
+
+    # 음식 카탈로그 메모리 캐시, 다른 worker 에서 다시 넣은 데이터는 이 주기(초)로 반영
+    FOOD_CATALOG_REFRESH_SECONDS: float = 300
+    FOOD_NUTRIENT_MATRIX_PATH: str = "data/food_nutrients.npy"  # worker 들이 mmap 으로 공유하는 영양성분 행렬
+    FOOD_SEARCH_BACKEND: str = "auto"  # auto / pg_trgm / ngram (auto: postgres 면 pg_trgm, 아니면 메모리 n-gram 색인)
+    FOOD_MATCH_THRESHOLD: float = 0.8  # 자유 입력 음식 이름을 카탈로그 음식으로 대응할 최소 유사도
+
+    # 업로드 사진 정규화 (EXIF 제거, 크기 제한, 작은/중간 크기 생성)
+    IMAGE_PROCESS_WORKERS: int = 2  # 프로세스 개수
+    IMAGE_MAX_DIMENSION: int = 2048
+    IMAGE_SMALL_SIZE: int = 320
+    IMAGE_MEDIUM_SIZE: int = 1024
+    IMAGE_JPEG_QUALITY: int = 85
+
+    # storage/FCM 작업 outbox
+    OUTBOX_WORKER_ENABLED: bool = True  # 앱 프로세스 안에서 worker 실행 (별도 프로세스로 돌리면 false)
+    OUTBOX_BATCH_SIZE: int = 100
+    OUTBOX_WORKERS: int = 8  # batch 안의 작업 동시 실행 개수
+    OUTBOX_POLL_SECONDS: float = 1.0
+    OUTBOX_LEASE_SECONDS: float = 60  # 가져간 작업이 이 시간 안에 끝나지 않으면 다시 처리
+    OUTBOX_MAX_ATTEMPTS: int = 8
+
+    # storage orphan 사진 정리 (매일 IMAGE_GC_HOUR 시)
+    IMAGE_GC_ENABLED: bool = True
+    IMAGE_GC_DRY_RUN: bool = False  # 삭제하지 않고 로그/리포트만
+    IMAGE_GC_HOUR: int = 4
+    IMAGE_GC_TEMP_TTL_HOURS: int = 24  # 이 시간이 지난 temp/ 사진만 정리
+    IMAGE_GC_MEAL_TTL_HOURS: int = 72
+    IMAGE_GC_PAGE_SIZE: int = 500
+
+    # 클라이언트 직접 업로드 (서명된 PUT url)
+    UPLOAD_URL_EXPIRATION_MINUTES: int = 15
+    UPLOAD_MAX_BYTES: int = 10 * 1024 * 1024
+    UPLOAD_FINALIZE_GRACE_MINUTES: int = 60  # url 만료 후 확정을 허용하는 시간, 이후 확정되지 않은 사진은 image GC 대상
+
+    # YOLO 추론 서버
+    YOLO_SERVER_URL: str = "http://110.8.6.21"
+    YOLO_CONNECT_TIMEOUT: float = 3
+    YOLO_READ_TIMEOUT: float = 30
+    YOLO_MAX_RETRIES: int = 2
+    YOLO_MAX_CONCURRENCY: int = 8
+    YOLO_BREAKER_FAILURES: int = 5  # 연속 실패 이 횟수면 circuit open
+    YOLO_BREAKER_RESET_SECONDS: float = 30
+    # 추론 요청 micro-batching (YOLO 서버에 POST /yolo/batch 가 있어야 함)
+    YOLO_BATCH_ENABLED: bool = False
+    YOLO_BATCH_WINDOW_MS: float = 20  # 첫 요청 후 이 시간(ms) 동안 모아서 전송
+    YOLO_BATCH_MAX_SIZE: int = 8
+
+    # moose 비동기 작업 (job 모드)
+    MOOSE_JOB_STORE: str = "memory"  # memory / redis
+    MOOSE_JOB_WORKERS: int = 4
+    MOOSE_JOB_QUEUE_SIZE: int = 100
+    MOOSE_JOB_TTL_SECONDS: int = 600  # 작업 결과 보관 시간
+    MOOSE_JOB_SSE_TIMEOUT_SECONDS: float = 60
+    REDIS_URL: str = "redis://localhost:6379/0"
+
+    # moose 결과 캐시 (사진 hash -> 인식 결과)
+    MOOSE_CACHE_SIZE: int = 1000
+    MOOSE_CACHE_TTL_SECONDS: int = 3600
+    MOOSE_CACHE_PERCEPTUAL: bool = False  # Pillow 가 설치된 경우 dhash 로 비슷한 사진도 적중
+    MOOSE_CACHE_PHASH_DISTANCE: int = 4
+
 
 @lru_cache
 def get_settings():
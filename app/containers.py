@@ -1,17 +1,49 @@
+from datetime import timedelta
+from functools import partial
+
 from dependency_injector import containers, providers
 import ulid
 
-from app.database import get_db, SessionLocal
+from app.app_config import get_settings
+from app.core.signed_url import SignedUrlService
+from app.core.blob_deleter import BlobDeleter
+from app.core.image_processor import ImageProcessor
+from app.modules.mealday.infra.yolo_client import YoloClient
+from app.modules.mealday.infra.yolo_batcher import YoloBatcher
+from app.modules.mealday.infra.moose_result_cache import MooseResultCache
+
+from app.database import UnitOfWork
 from app.modules.track.application.track_service import TrackService
 from app.modules.track.infra.repository.track_repo_impl import TrackRepository
 from app.modules.user.application.user_service import UserService
 from app.modules.user.infra.user_repo_impl import UserRepository
 from app.modules.mealday.infra.mealday_repo_impl import MealDayRepository
 from app.modules.mealday.application.mealday_service import MealDayService
+from app.modules.mealday.application.async_mealday_service import AsyncMealDayService
+from app.modules.mealday.application.moose_job_runner import MooseJobRunner
+from app.modules.mealday.application.image_gc_service import ImageGarbageCollector
+from app.modules.mealday.infra.moose_job_store_impl import InMemoryMooseJobStore, RedisMooseJobStore
 from app.modules.food.infra.food_repo_impl import FoodRepository
+from app.modules.food.infra.food_catalog import FoodCatalog
+from app.modules.food.infra.nutrient_matrix import NutrientMatrix
+from app.modules.food.infra.food_search_index import FoodSearchIndex
+from app.modules.food.infra.food_autocomplete import FoodAutocomplete
+from app.modules.food.infra.catalog_food_repo_impl import CatalogFoodRepository
 from app.modules.food.application.food_service import FoodService
+from app.modules.upload.infra.upload_repo_impl import UploadRepository
+from app.modules.upload.application.upload_service import UploadService
+from app.modules.outbox.infra.outbox_repo_impl import OutboxRepository
+from app.modules.outbox.infra.outbox_handler import FirebaseOutboxHandler
+from app.modules.outbox.application.outbox_service import OutboxService
+from app.modules.outbox.application.outbox_worker import OutboxWorker
+from app.modules.admin.application.monitoring_service import MonitoringService
 
+from app.utils.circuit_breaker import CircuitBreaker
 from app.utils.crypto import Crypto
+from app.utils.metrics import StageMetrics
+from app.utils.advisory_lock import try_advisory_lock
+
+settings = get_settings()
 
 
 class Container(containers.DeclarativeContainer):
@@ -21,11 +53,69 @@ class Container(containers.DeclarativeContainer):
             "app.modules.track",
             "app.modules.mealday",
             "app.modules.food",
+            "app.modules.admin",
+            "app.modules.upload",
         ]
     )
 
     # 의존성 정의
-    # db = providers.Resource(get_db)
+    unit_of_work = providers.Factory(UnitOfWork)  # 요청마다 새로 생성 (app.core.unit_of_work)
+    signed_url_service = providers.Singleton(
+        SignedUrlService,
+        expiration=timedelta(minutes=settings.SIGNED_URL_EXPIRATION_MINUTES),
+        refresh_before=timedelta(minutes=settings.SIGNED_URL_REFRESH_MINUTES),
+        max_entries=settings.SIGNED_URL_CACHE_SIZE,
+    )
+    blob_deleter = providers.Singleton(BlobDeleter, max_workers=settings.BLOB_DELETE_WORKERS)
+    image_processor = providers.Singleton(
+        ImageProcessor,
+        max_workers=settings.IMAGE_PROCESS_WORKERS,
+        max_dimension=settings.IMAGE_MAX_DIMENSION,
+        sizes=providers.Dict(small=settings.IMAGE_SMALL_SIZE, medium=settings.IMAGE_MEDIUM_SIZE),
+        quality=settings.IMAGE_JPEG_QUALITY,
+    )
+    yolo_client = providers.Singleton(
+        YoloClient,
+        base_url=settings.YOLO_SERVER_URL,
+        connect_timeout=settings.YOLO_CONNECT_TIMEOUT,
+        read_timeout=settings.YOLO_READ_TIMEOUT,
+        max_retries=settings.YOLO_MAX_RETRIES,
+        max_concurrency=settings.YOLO_MAX_CONCURRENCY,
+        breaker=providers.Singleton(
+            CircuitBreaker,
+            failure_threshold=settings.YOLO_BREAKER_FAILURES,
+            reset_timeout=settings.YOLO_BREAKER_RESET_SECONDS,
+        ),
+    )
+    yolo_inference = providers.Selector(
+        lambda: "batch" if settings.YOLO_BATCH_ENABLED else "single",
+        single=yolo_client,
+        batch=providers.Singleton(
+            YoloBatcher,
+            client=yolo_client,
+            window_ms=settings.YOLO_BATCH_WINDOW_MS,
+            max_batch_size=settings.YOLO_BATCH_MAX_SIZE,
+        ),
+    )
+    moose_metrics = providers.Singleton(StageMetrics)
+    moose_result_cache = providers.Singleton(
+        MooseResultCache,
+        max_entries=settings.MOOSE_CACHE_SIZE,
+        ttl=settings.MOOSE_CACHE_TTL_SECONDS,
+        perceptual=settings.MOOSE_CACHE_PERCEPTUAL,
+        max_distance=settings.MOOSE_CACHE_PHASH_DISTANCE,
+    )
+    moose_job_store = providers.Selector(
+        lambda: settings.MOOSE_JOB_STORE,
+        memory=providers.Singleton(InMemoryMooseJobStore, ttl=settings.MOOSE_JOB_TTL_SECONDS),
+        redis=providers.Singleton(RedisMooseJobStore, url=settings.REDIS_URL, ttl=settings.MOOSE_JOB_TTL_SECONDS),
+    )
+    moose_job_runner = providers.Singleton(
+        MooseJobRunner,
+        job_store=moose_job_store,
+        workers=settings.MOOSE_JOB_WORKERS,
+        queue_size=settings.MOOSE_JOB_QUEUE_SIZE,
+    )
     user_repo = providers.Factory(UserRepository)
     crypto = providers.Factory(Crypto)
     user_service = providers.Factory(
@@ -34,11 +124,58 @@ class Container(containers.DeclarativeContainer):
         crypto=crypto
     )
 
-    food_repo = providers.Factory(FoodRepository)
+    food_db_repo = providers.Factory(FoodRepository)
+    nutrient_matrix = providers.Singleton(NutrientMatrix, path=settings.FOOD_NUTRIENT_MATRIX_PATH)
+    food_search_index = providers.Singleton(FoodSearchIndex)
+    food_autocomplete = providers.Singleton(FoodAutocomplete)
+    food_catalog = providers.Singleton(
+        FoodCatalog,
+        loader=providers.Callable(lambda repo: repo.find_all_foods, food_db_repo),
+        refresh_interval=settings.FOOD_CATALOG_REFRESH_SECONDS,
+        listeners=providers.List(
+            nutrient_matrix.provided.on_catalog_reload,
+            food_search_index.provided.on_catalog_reload,
+            food_autocomplete.provided.on_catalog_reload,
+        ),
+    )
+    food_repo = providers.Factory(
+        CatalogFoodRepository,
+        food_repo=food_db_repo,
+        catalog=food_catalog,
+        search_index=food_search_index,
+        search_backend=settings.FOOD_SEARCH_BACKEND,
+    )
     food_service = providers.Factory(
         FoodService,
         food_repo=food_repo,
-        crypto=crypto
+        crypto=crypto,
+        nutrient_matrix=nutrient_matrix,
+        food_search_index=food_search_index,
+        food_autocomplete=food_autocomplete,
+        match_threshold=settings.FOOD_MATCH_THRESHOLD
+    )
+
+    outbox_repo = providers.Factory(OutboxRepository)
+    outbox_service = providers.Factory(OutboxService, outbox_repo=outbox_repo)
+    outbox_worker = providers.Singleton(
+        OutboxWorker,
+        outbox_repo=outbox_repo,
+        handler=providers.Singleton(FirebaseOutboxHandler),
+        batch_size=settings.OUTBOX_BATCH_SIZE,
+        max_workers=settings.OUTBOX_WORKERS,
+        poll_interval=settings.OUTBOX_POLL_SECONDS,
+        lease=settings.OUTBOX_LEASE_SECONDS,
+        max_attempts=settings.OUTBOX_MAX_ATTEMPTS,
+    )
+
+    upload_repo = providers.Factory(UploadRepository)
+    upload_service = providers.Factory(
+        UploadService,
+        upload_repo=upload_repo,
+        outbox_service=outbox_service,
+        expiration=timedelta(minutes=settings.UPLOAD_URL_EXPIRATION_MINUTES),
+        max_bytes=settings.UPLOAD_MAX_BYTES,
+        finalize_grace=timedelta(minutes=settings.UPLOAD_FINALIZE_GRACE_MINUTES),
     )
 
     track_repo = providers.Factory(TrackRepository)
@@ -56,5 +193,41 @@ class Container(containers.DeclarativeContainer):
         user_service=user_service,
         track_service=track_service,
         food_service=food_service,
-        crypto=crypto
+        crypto=crypto,
+        signed_url_service=signed_url_service,
+        moose_result_cache=moose_result_cache,
+        upload_service=upload_service,
+        outbox_service=outbox_service,
+        image_processor=image_processor
+    )
+    image_gc = providers.Singleton(
+        ImageGarbageCollector,
+        mealday_repo=mealday_repo,
+        upload_repo=upload_repo,
+        blob_deleter=blob_deleter,
+        ttl=providers.Dict({
+            "temp/": timedelta(hours=settings.IMAGE_GC_TEMP_TTL_HOURS),
+            "meal/": timedelta(hours=settings.IMAGE_GC_MEAL_TTL_HOURS),
+        }),
+        page_size=settings.IMAGE_GC_PAGE_SIZE,
+        upload_grace=timedelta(minutes=settings.UPLOAD_FINALIZE_GRACE_MINUTES),
+        run_guard=providers.Object(partial(try_advisory_lock, "image_gc")),  # worker 마다 스케줄러가 돌아도 하나만 실행
+    )
+    async_mealday_service = providers.Factory(
+        AsyncMealDayService,
+        mealday_service=mealday_service,
+        yolo_client=yolo_inference,
+        moose_metrics=moose_metrics,
+        moose_job_runner=moose_job_runner,
+        moose_sse_timeout=settings.MOOSE_JOB_SSE_TIMEOUT_SECONDS
+    )
+
+    monitoring_service = providers.Singleton(
+        MonitoringService,
+        signed_url_service=signed_url_service,
+        yolo_inference=yolo_inference,
+        moose_metrics=moose_metrics,
+        moose_job_runner=moose_job_runner,
+        moose_result_cache=moose_result_cache,
+        image_gc=image_gc
     )
@@ -0,0 +1,36 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+logger = logging.getLogger(__name__)
+
+
+class BlobDeleter:
+    """
+    firebase storage blob 정리를 제한된 스레드풀에서 동시에 수행
+     - delete_many: 고아 사진 정리(image GC, 중복 사진 정리 스크립트)용
+    """
+
+    def __init__(self, max_workers: int = 8, bucket=None):
+        self.max_workers = max_workers
+        self._bucket = bucket
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="blob-delete")
+
+    @property
+    def bucket(self):
+        if self._bucket is not None:
+            return self._bucket
+        from app.core import fcm  # firebase 초기화는 실제로 사용할 때
+        return fcm.bucket
+
+    def delete_many(self, paths: List[str]):
+        """best-effort 삭제 (실패는 로그만)"""
+        bucket = self.bucket
+
+        def delete(path: str):
+            try:
+                bucket.blob(path).delete()
+            except Exception as e:
+                logger.warning("blob 삭제 실패 %s: %s", path, e)
+
+        list(self._executor.map(delete, paths))
@@ -58,3 +58,16 @@ def send_fcm_data_noti(fcm_token, title, body, data):
         except Exception as e:
             print('Fail send msg:',e)
 
+
+
+def send_fcm_message(fcm_token, title, body, data=None):
+    """outbox worker 용, 실패하면 예외 (재시도)"""
+    message = messaging.Message(
+        notification=messaging.Notification(
+            title=title,
+            body=body,
+        ),
+        data=data,
+        token=fcm_token,
+    )
+    return messaging.send(message)
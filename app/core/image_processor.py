@@ -0,0 +1,110 @@
+import asyncio
+import io
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+ORIGINAL = "original"
+VARIANTS = ("small", "medium")
+
+
+def variant_path(image_path: str | None, variant: str) -> str | None:
+    """처리된 사진(.../original.jpg)의 다른 크기 경로, 처리되지 않은 사진은 None"""
+    if not image_path or not image_path.endswith(f"/{ORIGINAL}.jpg"):
+        return None
+    return f"{image_path[:-len(ORIGINAL) - 4]}{variant}.jpg"
+
+
+def base_image_path(path: str) -> str:
+    """variant 경로면 원본(.../original.jpg) 경로, 아니면 그대로"""
+    for variant in VARIANTS:
+        if path.endswith(f"/{variant}.jpg"):
+            return f"{path[:-len(variant) - 4]}{ORIGINAL}.jpg"
+    return path
+
+
+def render_variants(data: bytes, max_dimension: int, sizes: dict[str, int], quality: int) -> dict[str, bytes]:
+    """
+    (프로세스풀에서 실행) 방향 보정 후 EXIF 제거, 최대 크기 제한, JPEG 재인코딩
+     - 반환: {"original": ..., "small": ..., "medium": ...} (sizes 에 있는 것만)
+    """
+    from PIL import Image, ImageOps
+
+    with Image.open(io.BytesIO(data)) as image:
+        image = ImageOps.exif_transpose(image)  # 회전 정보 반영 (저장할 때 EXIF 는 넣지 않음)
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        image.thumbnail((max_dimension, max_dimension), Image.LANCZOS)
+        results = {ORIGINAL: image}
+        for variant, size in sizes.items():
+            resized = image.copy()
+            resized.thumbnail((size, size), Image.LANCZOS)
+            results[variant] = resized
+
+        encoded = {}
+        for variant, img in results.items():
+            buffer = io.BytesIO()
+            img.save(buffer, format="JPEG", quality=quality, optimize=True, progressive=True)
+            encoded[variant] = buffer.getvalue()
+        return encoded
+
+
+class ImageProcessor:
+    """
+    업로드 사진 정규화 (EXIF 제거, 크기 제한, 재인코딩) 와 작은/중간 크기 사진 생성
+     - 요청 스레드의 GIL 을 잡지 않도록 프로세스풀에서 실행
+     - Pillow 가 없거나 읽을 수 없는 사진(HEIC 등)이면 None (원본을 그대로 사용)
+    """
+
+    def __init__(self, max_workers: int = 2, max_dimension: int = 2048, sizes: dict[str, int] = None,
+                 quality: int = 85):
+        self.max_workers = max_workers
+        self.max_dimension = max_dimension
+        self.sizes = sizes or {"small": 320, "medium": 1024}
+        self.quality = quality
+        self._executor: ProcessPoolExecutor | None = None
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # 멀티스레드 서버에서 fork 하지 않도록 spawn
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                                 mp_context=multiprocessing.get_context("spawn"))
+        return self._executor
+
+    @staticmethod
+    def available() -> bool:
+        try:
+            import PIL  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def _submit(self, data: bytes, variants: bool):
+        sizes = self.sizes if variants else {}
+        return self.executor.submit(render_variants, data, self.max_dimension, sizes, self.quality)
+
+    def process(self, data: bytes, variants: bool = True) -> dict[str, bytes] | None:
+        if not self.available():
+            return None
+        try:
+            return self._submit(data, variants).result()
+        except Exception as e:
+            logger.info("사진 변환 실패, 원본 사용: %s", e)
+            return None
+
+    async def aprocess(self, data: bytes, variants: bool = True) -> dict[str, bytes] | None:
+        if not self.available():
+            return None
+        try:
+            return await asyncio.wrap_future(self._submit(data, variants))
+        except Exception as e:
+            logger.info("사진 변환 실패, 원본 사용: %s", e)
+            return None
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
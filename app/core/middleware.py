@@ -0,0 +1,35 @@
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Receive, Scope, Send, Message
+
+from app.utils.query_stats import track_queries, log_n_plus_one
+
+
+class QueryStatsMiddleware:
+    """
+    요청마다 실행된 SQL 개수와 총 시간을 응답 헤더로 전달
+     - X-DB-Query-Count, X-DB-Query-Time(ms)
+     - 같은 모양의 SQL 이 n_plus_one_threshold 번 이상 반복되면 N+1 의심으로 로그
+    """
+
+    def __init__(self, app: ASGIApp, n_plus_one_threshold: int = 5):
+        self.app = app
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        route = f"{scope['method']} {scope['path']}"
+        with track_queries(route) as stats:
+            async def send_wrapper(message: Message):
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers["X-DB-Query-Count"] = str(stats.count)
+                    headers["X-DB-Query-Time"] = f"{stats.total_ms:.2f}"
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                log_n_plus_one(stats, self.n_plus_one_threshold, route)
@@ -0,0 +1,102 @@
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Iterable
+
+from app.utils.metrics import Counter, WindowedHistogram
+
+
+class SignedUrlService:
+    """
+    firebase storage 이미지 서명 url 캐시
+     - blob 경로별로 서명 url 을 보관하고 만료 refresh_before 전까지 같은 url 반환 (클라이언트 이미지 캐시 적중)
+     - 캐시에 없는 경로는 한번에 모아서 서명
+     - max_entries 를 넘으면 가장 오래 사용하지 않은 항목부터 제거 (LRU)
+    """
+
+    def __init__(
+            self,
+            expiration: timedelta = timedelta(hours=1),
+            refresh_before: timedelta = timedelta(minutes=10),
+            max_entries: int = 10000,
+            bucket=None,
+    ):
+        self.expiration = expiration
+        self.refresh_before = refresh_before
+        self.max_entries = max_entries
+        self._bucket = bucket
+        self._cache: OrderedDict[str, tuple[str, float]] = OrderedDict()  # path -> (url, 재서명 시각)
+        self._lock = threading.Lock()
+        self.hits = Counter()
+        self.misses = Counter()
+        self.sign_ms = WindowedHistogram()
+
+    @property
+    def bucket(self):
+        if self._bucket is not None:
+            return self._bucket
+        from app.core import fcm  # firebase 초기화는 실제로 사용할 때
+        return fcm.bucket
+
+    def get(self, path: str | None) -> str | None:
+        if not path:
+            return None
+        return self.get_many([path]).get(path)
+
+    def get_many(self, paths: Iterable[str | None]) -> dict[str, str]:
+        """
+        경로 -> 서명 url (빈 경로는 제외)
+        """
+        now = time.time()
+        result = {}
+        missing = []
+        with self._lock:
+            for path in dict.fromkeys(p for p in paths if p):
+                cached = self._cache.get(path)
+                if cached is not None and cached[1] > now:
+                    self._cache.move_to_end(path)
+                    result[path] = cached[0]
+                else:
+                    missing.append(path)
+        self.hits.inc(len(result))
+        if not missing:
+            return result
+
+        self.misses.inc(len(missing))
+        signed = self._sign(missing)
+        refresh_at = now + (self.expiration - self.refresh_before).total_seconds()
+        with self._lock:
+            for path, url in signed.items():
+                self._cache[path] = (url, refresh_at)
+                self._cache.move_to_end(path)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        result.update(signed)
+        return result
+
+    def _sign(self, paths: list[str]) -> dict[str, str]:
+        bucket = self.bucket
+        signed = {}
+        for path in paths:
+            start = time.perf_counter()
+            signed[path] = bucket.blob(path).generate_signed_url(expiration=self.expiration)
+            self.sign_ms.observe((time.perf_counter() - start) * 1000)
+        return signed
+
+    def invalidate(self, path: str | None):
+        """blob 삭제/교체시 캐시에서 제거"""
+        if not path:
+            return
+        with self._lock:
+            self._cache.pop(path, None)
+
+    def stats(self) -> dict:
+        hits, misses = self.hits.value, self.misses.value
+        return {
+            "entries": len(self._cache),
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else None,
+            "sign_ms": self.sign_ms.summary(),
+        }
@@ -0,0 +1,22 @@
+from fastapi import Request
+from starlette.concurrency import run_in_threadpool
+
+
+async def request_unit_of_work(request: Request):
+    """
+    요청 단위 트랜잭션
+     - 요청 처리 동안 repository 들은 같은 세션/트랜잭션을 사용
+     - 정상 종료시 한번 commit, 예외(HTTPException 포함) 발생시 rollback
+     - @inject 로 감싸면 FastAPI 가 async generator 로 인식하지 못하므로 컨테이너에서 직접 생성
+    """
+    uow = request.app.container.unit_of_work()
+    with uow.bind_scope():
+        try:
+            yield uow
+        except Exception:
+            await run_in_threadpool(uow.rollback)
+            raise
+        else:
+            await run_in_threadpool(uow.commit)
+        finally:
+            await run_in_threadpool(uow.close)
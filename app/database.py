@@ -1,18 +1,50 @@
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable
+
 from sqlalchemy import create_engine, MetaData
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, Session
+from starlette.concurrency import run_in_threadpool
+
 from app.app_config import get_settings
+from app.utils.db_pool import MeteredQueuePool
+from app.utils.query_stats import install_query_listeners
+from app.utils.slow_query import SlowQueryLogger, ExplainWorker
+
+logger = logging.getLogger(__name__)
 
 settings = get_settings()
 SQLALCHEMY_DATABASE_URL = settings.SQLALCHEMY_DATABASE_URL
 
+pool_options = dict(
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+)
+
 if SQLALCHEMY_DATABASE_URL.startswith("sqlite"):
+    # 메모리 DB 는 커넥션마다 DB가 달라지므로 기본 풀 유지
+    sqlite_pool_options = {} if ":memory:" in SQLALCHEMY_DATABASE_URL \
+        else dict(poolclass=MeteredQueuePool, **pool_options)
     engine = create_engine(
-        SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
+        SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}, **sqlite_pool_options
     )
 else:
-    engine = create_engine(SQLALCHEMY_DATABASE_URL)
+    engine = create_engine(SQLALCHEMY_DATABASE_URL, poolclass=MeteredQueuePool, **pool_options)
+
+install_query_listeners(engine)
+
+if settings.DB_SLOW_QUERY_MS > 0:
+    explain_worker = None
+    if settings.DB_SLOW_QUERY_EXPLAIN and engine.dialect.name == "postgresql":
+        explain_worker = ExplainWorker(engine, settings.DB_SLOW_QUERY_EXPLAIN_PATH)
+    SlowQueryLogger(settings.DB_SLOW_QUERY_MS, explain_worker).install(engine)
 
 # autocommit=False로 설정하면 데이터를 변경했을때 commit 이라는 사인을 주어야만 실제 저장이 된다.
 # 데이터를 잘못 저장했을 경우 rollback 사인으로 되돌리는 것이 가능
@@ -31,15 +63,184 @@ naming_convertion = {
 Base.metadata = MetaData(naming_convention=naming_convertion)
 
 
+def to_async_database_url(url: str) -> str:
+    """
+    동기 드라이버 URL을 비동기 드라이버 URL로 변환
+     - postgresql(psycopg2) -> postgresql+asyncpg
+     - sqlite -> sqlite+aiosqlite
+    """
+    url_obj = make_url(url)
+    backend = url_obj.get_backend_name()
+    if backend == "postgresql":
+        return url_obj.set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+    if backend == "sqlite":
+        return url_obj.set(drivername="sqlite+aiosqlite").render_as_string(hide_password=False)
+    raise ValueError(f"async 드라이버를 지원하지 않는 DB 입니다: {backend}")
+
+
+# DB_ASYNC_MODE=True 일때만 비동기 엔진 생성 (asyncpg / aiosqlite 필요)
+if settings.DB_ASYNC_MODE:
+    # aiosqlite 는 NullPool 을 사용하므로 풀 설정은 postgres 에만 적용
+    async_engine = create_async_engine(
+        to_async_database_url(SQLALCHEMY_DATABASE_URL),
+        **({} if SQLALCHEMY_DATABASE_URL.startswith("sqlite") else pool_options)
+    )
+    # commit 이후에도 응답 직렬화에서 속성을 읽을 수 있도록 expire_on_commit=False
+    AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False,
+                                           join_transaction_mode="rollback_only")
+    install_query_listeners(async_engine.sync_engine)
+    if settings.DB_SLOW_QUERY_MS > 0:
+        # asyncpg 문은 paramstyle 이 달라 EXPLAIN 수집은 동기 엔진에서만
+        SlowQueryLogger(settings.DB_SLOW_QUERY_MS).install(async_engine.sync_engine)
+else:
+    async_engine = None
+    AsyncSessionLocal = None
+
+# 현재 실행 흐름(요청)에 묶인 세션 제공자, repository 는 session_scope()로 가져다 쓴다
+_session_provider: ContextVar[Callable[[], Session] | None] = ContextVar("session_provider", default=None)
+# 현재 흐름의 트랜잭션이 commit 된 뒤 실행할 callback 목록 (묶인 트랜잭션이 없으면 None)
+_after_commit: ContextVar[list | None] = ContextVar("after_commit", default=None)
+
+
+@contextmanager
+def session_scope():
+    """
+    repository 에서 사용할 세션을 반환
+     - 현재 흐름에 묶인 세션(UnitOfWork 등)이 있으면 그대로 사용 (닫지 않음)
+     - 없으면 SessionLocal()을 새로 열고 끝나면 닫음
+    """
+    provider = _session_provider.get()
+    if provider is not None:
+        yield provider()
+        return
+    with SessionLocal() as db:
+        yield db
+
+
+def after_commit(callback: Callable[[], None]):
+    """
+    현재 요청 트랜잭션이 commit 된 뒤 callback 실행, rollback 되면 실행하지 않음
+     - 메모리 캐시처럼 commit 되지 않은 데이터를 밖으로 내보내면 안 되는 작업용
+     - 묶인 트랜잭션이 없으면(repository 가 직접 commit) 바로 실행
+    """
+    hooks = _after_commit.get()
+    if hooks is None:
+        callback()
+    else:
+        hooks.append(callback)
+
+
+def _run_after_commit(hooks: list):
+    token = _session_provider.set(None)  # 끝난 요청 세션 대신 새 세션 사용
+    try:
+        for callback in hooks:
+            try:
+                callback()
+            except Exception:  # 이미 commit 되었으므로 요청은 성공으로 처리
+                logger.exception("commit 후 작업 실패: %r", callback)
+    finally:
+        _session_provider.reset(token)
+
+
+class UnitOfWork:
+    """
+    요청 단위 Unit of Work
+     - 요청 동안 하나의 세션, 하나의 트랜잭션을 사용하고 마지막에 한번만 commit
+     - repository 의 db.commit()은 바깥 트랜잭션을 commit 하지 않고 flush 만 수행 (join_transaction_mode="rollback_only")
+     - 세션은 처음 사용할 때 생성하므로 DB를 쓰지 않는 요청은 커넥션을 점유하지 않음
+    """
+
+    def __init__(self, bind=engine):
+        self.bind = bind
+        self._connection = None
+        self._transaction = None
+        self._session: Session | None = None
+        self._after_commit: list = []
+
+    @property
+    def session(self) -> Session:
+        if self._session is None:
+            self._connection = self.bind.connect()
+            self._transaction = self._connection.begin()
+            self._session = Session(bind=self._connection, autoflush=False, expire_on_commit=False,
+                                    join_transaction_mode="rollback_only")
+        return self._session
+
+    @contextmanager
+    def bind_scope(self):
+        """with 블록 안의 session_scope()가 이 UnitOfWork 의 세션을 사용하도록 묶음"""
+        token = _session_provider.set(lambda: self.session)
+        hooks_token = _after_commit.set(self._after_commit)
+        try:
+            yield self
+        finally:
+            _after_commit.reset(hooks_token)
+            _session_provider.reset(token)
+
+    def commit(self):
+        if self._session is not None:
+            self._session.flush()
+            if self._transaction.is_active:
+                self._transaction.commit()
+        hooks = self._after_commit[:]
+        self._after_commit.clear()
+        _run_after_commit(hooks)
+
+    def rollback(self):
+        self._after_commit.clear()
+        if self._session is None:
+            return
+        if self._transaction.is_active:
+            self._transaction.rollback()
+
+    def close(self):
+        if self._session is None:
+            return
+        self._session.close()
+        self._connection.close()
+        self._session = None
+
+
+async def run_db_bound(fn, *args, **kwargs):
+    """
+    동기 서비스 로직을 이벤트 루프를 막지 않고 실행
+     - DB_ASYNC_MODE: AsyncSession(asyncpg/aiosqlite) 위에서 run_sync로 실행, 하나의 트랜잭션으로 묶고 끝날 때 한번 commit
+     - 그 외: 스레드풀에서 기존 동기 스택(요청 UnitOfWork)으로 실행
+    """
+    if AsyncSessionLocal is None:
+        return await run_in_threadpool(fn, *args, **kwargs)
+
+    hooks = []
+
+    def call(db: Session):
+        token = _session_provider.set(lambda: db)
+        hooks_token = _after_commit.set(hooks)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _after_commit.reset(hooks_token)
+            _session_provider.reset(token)
+
+    async with async_engine.connect() as connection:
+        async with connection.begin():
+            async with AsyncSessionLocal(bind=connection) as session:
+                result = await session.run_sync(call)
+                await session.flush()
+    if hooks:
+        await run_in_threadpool(_run_after_commit, hooks)
+    return result
+
+
 # db_model 세션 객체를 리턴하는 제너레이터인 get_db함수 추가
 # db를 안전하게 열고 닫을 수 있음
 
-# async def get_db():
-#     async with SessionLocal() as db:
-#         try:
-#             yield db  # 컨넥션 풀에 db세션 반환
-#         finally:
-#             await db.close()  # 데이터 베이스 자원을 해제하고 연결을 안전하게 닫음
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db  # 컨넥션 풀에 db세션 반환
+        finally:
+            await db.close()  # 데이터 베이스 자원을 해제하고 연결을 안전하게 닫음
+
 
 def get_db():
     db = SessionLocal()
@@ -4,3 +4,5 @@ import app.modules.mealday.infra.db_models.mealday
 import app.modules.track.infra.db_models.track_participant
 import app.modules.track.infra.db_models.track_routine_food
 import app.modules.food.infra.db_models.food
+import app.modules.upload.infra.db_models.upload
+import app.modules.outbox.infra.db_models.outbox
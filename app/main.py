@@ -1,15 +1,24 @@
+import logging
+
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Depends
 from starlette.middleware.cors import CORSMiddleware
 
+from app.app_config import get_settings
 from app.containers import Container
+from app.core.middleware import QueryStatsMiddleware
+from app.core.unit_of_work import request_unit_of_work
 from app.modules.user.interface.controller.v1 import user_controller as user_router
 from app.modules.mealday.interface.controller.v1 import mealday_controller as mealday_router
 from app.modules.track.interface.controller.v1 import track_controller as track_router
 from app.modules.food.interface.controller.v1 import food_controller as food_router
-from app.utils.scheduler import start_track_scheduler
+from app.modules.admin.interface.controller.v1 import admin_controller as admin_router
+from app.modules.upload.interface.controller.v1 import upload_controller as upload_router
+from app.utils.scheduler import start_track_scheduler, start_image_gc_scheduler
+
+logger = logging.getLogger(__name__)
 
-app = FastAPI()
+app = FastAPI(dependencies=[Depends(request_unit_of_work)])  # 요청 단위 트랜잭션
 app.container = Container()
 
 app.include_router(user_router.router)
@@ -19,6 +28,8 @@ app.include_router(track_router.track_router)
 app.include_router(track_router.routine_router)
 app.include_router(track_router.routine_food_router)
 app.include_router(food_router.router)
+app.include_router(admin_router.router)
+app.include_router(upload_router.router)
 
 
 origins = [
@@ -34,6 +45,11 @@ app.add_middleware(
 )
 
 
+settings = get_settings()
+if settings.DB_QUERY_STATS:
+    app.add_middleware(QueryStatsMiddleware, n_plus_one_threshold=settings.DB_N_PLUS_ONE_THRESHOLD)
+
+
 @app.get("/health-check")
 def hello():
     return "Hello World!"
@@ -42,6 +58,23 @@ def hello():
 @app.on_event("startup")
 async def startup_event():
     start_track_scheduler()
+    try:
+        app.container.food_catalog().reload()  # 음식 카탈로그 미리 로드
+    except Exception as e:  # 실패하면 첫 조회 때 다시 읽음
+        logger.warning("음식 카탈로그 미리 로드 실패: %s", e)
+    if settings.IMAGE_GC_ENABLED:
+        start_image_gc_scheduler(app.container.image_gc(), hour=settings.IMAGE_GC_HOUR, dry_run=settings.IMAGE_GC_DRY_RUN)
+    if settings.OUTBOX_WORKER_ENABLED:
+        app.container.outbox_worker().start()
+    app.container.moose_job_runner().start()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await app.container.yolo_inference().aclose()
+    await app.container.moose_job_runner().stop()
+    app.container.outbox_worker().stop()
+    app.container.image_processor().shutdown()
 
 if __name__ == "__main__":
     uvicorn.run("main:app", host="localhost", port=8000)
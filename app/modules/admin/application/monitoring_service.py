@@ -0,0 +1,70 @@
+from dependency_injector.wiring import inject
+
+from app.core.signed_url import SignedUrlService
+from app.database import engine, async_engine
+from app.modules.mealday.application.image_gc_service import ImageGarbageCollector
+from app.modules.mealday.application.moose_job_runner import MooseJobRunner
+from app.modules.mealday.infra.moose_result_cache import MooseResultCache
+from app.modules.mealday.infra.yolo_batcher import YoloBatcher
+from app.modules.mealday.infra.yolo_client import YoloClient
+from app.utils.db_pool import pool_metrics, pool_status
+from app.utils.metrics import StageMetrics
+
+
+class MonitoringService:
+    """
+    운영 지표 조회 (관리자용)
+    """
+    @inject
+    def __init__(
+            self,
+            signed_url_service: SignedUrlService,
+            yolo_inference: YoloClient | YoloBatcher,
+            moose_metrics: StageMetrics,
+            moose_job_runner: MooseJobRunner,
+            moose_result_cache: MooseResultCache,
+            image_gc: ImageGarbageCollector,
+    ):
+        self.signed_url_service = signed_url_service
+        self.yolo_inference = yolo_inference
+        self.moose_metrics = moose_metrics
+        self.moose_job_runner = moose_job_runner
+        self.moose_result_cache = moose_result_cache
+        self.image_gc = image_gc
+
+    def get_db_pool_stats(self, history: bool = False) -> dict:
+        stats = {
+            "pool": pool_status(engine.pool),
+            "async_pool": pool_status(async_engine.pool) if async_engine is not None else None,
+            "checkouts": pool_metrics.checkouts.value,
+            "timeouts": pool_metrics.timeouts.value,
+            "checkout_wait_ms": pool_metrics.checkout_wait_ms.summary(),
+            "checked_out": pool_metrics.checked_out.summary(),
+        }
+        if history:
+            # 1분 단위 추이
+            stats["history"] = {
+                "checkout_wait_ms": pool_metrics.checkout_wait_ms.history(),
+                "checked_out": pool_metrics.checked_out.history(),
+            }
+        return stats
+
+    def get_signed_url_stats(self) -> dict:
+        return self.signed_url_service.stats()
+
+    def get_moose_stats(self) -> dict:
+        batching = isinstance(self.yolo_inference, YoloBatcher)
+        client = self.yolo_inference.client if batching else self.yolo_inference  # 배치를 쓰면 batcher 가 감싼 client
+        return {
+            "breaker": client.stats(),
+            "stages": self.moose_metrics.summary(),
+            "jobs": self.moose_job_runner.stats(),
+            "cache": self.moose_result_cache.stats(),
+            "batch": self.yolo_inference.stats() if batching else None,
+        }
+
+    def get_image_gc_stats(self) -> dict:
+        return self.image_gc.stats()
+
+    def sweep_images(self, dry_run: bool = True) -> dict:
+        return self.image_gc.sweep(dry_run=dry_run)
@@ -0,0 +1,81 @@
+from typing import Annotated
+
+from dependency_injector.wiring import inject, Provide
+from fastapi import APIRouter, Depends, Query
+
+from app.containers import Container
+from app.core.auth import CurrentUser, get_admin_user
+from app.modules.admin.application.monitoring_service import MonitoringService
+from app.modules.admin.interface.schema.admin_schema import DBPoolStats, SignedUrlStats, MooseStats, ImageGcStats, \
+    ImageGcReport
+
+router = APIRouter(prefix="/api/v1/admin", tags=["Admin"])
+
+
+@router.get("/db/pool", response_model=DBPoolStats)
+@inject
+def get_db_pool_stats(
+    admin_user: Annotated[CurrentUser, Depends(get_admin_user)],
+    history: bool = Query(False, description="1분 단위 추이 포함 여부"),
+    monitoring_service: MonitoringService = Depends(Provide[Container.monitoring_service]),
+):
+    """
+    커넥션 풀 상태 조회
+     - 사용중/오버플로우 커넥션 수, checkout 대기시간 백분위(ms)
+    """
+    return monitoring_service.get_db_pool_stats(history=history)
+
+
+@router.get("/signed-urls", response_model=SignedUrlStats)
+@inject
+def get_signed_url_stats(
+    admin_user: Annotated[CurrentUser, Depends(get_admin_user)],
+    monitoring_service: MonitoringService = Depends(Provide[Container.monitoring_service]),
+):
+    """
+    이미지 서명 url 캐시 상태 조회
+     - 캐시 적중률, 서명 소요시간 백분위(ms)
+    """
+    return monitoring_service.get_signed_url_stats()
+
+
+@router.get("/moose", response_model=MooseStats)
+@inject
+def get_moose_stats(
+    admin_user: Annotated[CurrentUser, Depends(get_admin_user)],
+    monitoring_service: MonitoringService = Depends(Provide[Container.monitoring_service]),
+):
+    """
+    moose(YOLO 추론) 상태 조회
+     - circuit breaker 상태, 단계별(hash/upload/sign/infer) 소요시간 백분위(ms)와 실패 횟수
+     - 작업 큐 길이, 결과 캐시 적중률
+    """
+    return monitoring_service.get_moose_stats()
+
+
+@router.get("/image-gc", response_model=ImageGcStats)
+@inject
+def get_image_gc_stats(
+    admin_user: Annotated[CurrentUser, Depends(get_admin_user)],
+    monitoring_service: MonitoringService = Depends(Provide[Container.monitoring_service]),
+):
+    """
+    storage orphan 사진 정리 상태 조회
+     - 누적 삭제 개수/용량, 마지막 실행 결과
+    """
+    return monitoring_service.get_image_gc_stats()
+
+
+@router.post("/image-gc", response_model=ImageGcReport)
+@inject
+def sweep_images(
+    admin_user: Annotated[CurrentUser, Depends(get_admin_user)],
+    dry_run: bool = Query(True, description="삭제하지 않고 결과만 조회"),
+    monitoring_service: MonitoringService = Depends(Provide[Container.monitoring_service]),
+):
+    """
+    storage orphan 사진 정리 바로 실행
+     - temp/, meal/ 중 dish/업로드 대기에서 사용하지 않고 ttl 이 지난 사진
+     - 처리량(blobs/s), prefix 별 orphan 개수/용량과 일부 경로
+    """
+    return monitoring_service.sweep_images(dry_run=dry_run)
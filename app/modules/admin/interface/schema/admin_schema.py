@@ -0,0 +1,111 @@
+from datetime import datetime
+from typing import Optional, List, Dict
+
+from pydantic import BaseModel
+
+
+class PoolStatus(BaseModel):
+    pool_class: str
+    size: Optional[int] = None
+    checked_in: Optional[int] = None
+    checked_out: Optional[int] = None
+    overflow: Optional[int] = None
+    max_overflow: Optional[int] = None
+    timeout: Optional[float] = None
+
+
+class LatencySummary(BaseModel):
+    count: int
+    avg: Optional[float] = None
+    max: Optional[float] = None
+    p50: Optional[float] = None
+    p90: Optional[float] = None
+    p99: Optional[float] = None
+
+
+class LatencyBucket(LatencySummary):
+    start: int  # bucket 시작 시각 (unix timestamp)
+
+
+class PoolHistory(BaseModel):
+    checkout_wait_ms: List[LatencyBucket]
+    checked_out: List[LatencyBucket]
+
+
+class DBPoolStats(BaseModel):
+    pool: PoolStatus
+    async_pool: Optional[PoolStatus] = None
+    checkouts: int
+    timeouts: int
+    checkout_wait_ms: LatencySummary
+    checked_out: LatencySummary
+    history: Optional[PoolHistory] = None
+
+
+class SignedUrlStats(BaseModel):
+    entries: int
+    hits: int
+    misses: int
+    hit_rate: Optional[float] = None
+    sign_ms: LatencySummary
+
+
+class BreakerStatus(BaseModel):
+    state: str  # closed / open / half_open
+    consecutive_failures: int
+
+
+class StageSummary(LatencySummary):
+    errors: int
+
+
+class MooseJobQueueStats(BaseModel):
+    workers: int
+    queued: int
+
+
+class MooseCacheStats(BaseModel):
+    entries: int
+    hits: int
+    perceptual_hits: int
+    misses: int
+    evictions: int
+    hit_rate: Optional[float] = None
+
+
+class MooseBatchStats(BaseModel):
+    batches: int
+    batch_size: LatencySummary  # 배치 크기 분포
+
+
+class MooseStats(BaseModel):
+    breaker: BreakerStatus
+    stages: Dict[str, StageSummary]  # upload / sign / infer
+    jobs: MooseJobQueueStats
+    cache: MooseCacheStats
+    batch: Optional[MooseBatchStats] = None  # YOLO_BATCH_ENABLED 일 때
+
+
+class ImageGcPrefixReport(BaseModel):
+    prefix: str  # temp/ / meal/
+    pages: int
+    scanned: int
+    orphans: int
+    orphan_bytes: int
+    samples: List[str]  # orphan 경로 일부
+
+
+class ImageGcReport(BaseModel):
+    dry_run: bool
+    started_at: datetime
+    prefixes: List[ImageGcPrefixReport]
+    elapsed_seconds: float
+    blobs_per_second: Optional[float] = None
+    skipped: bool = False  # 이미 실행중이라 이전 결과 반환
+
+
+class ImageGcStats(BaseModel):
+    runs: int
+    deleted: int
+    deleted_bytes: int
+    last_report: Optional[ImageGcReport] = None
@@ -5,6 +5,9 @@ from app.core.auth import Role, get_admin_user
 from app.modules.food.domain.food import Food
 from app.modules.user.domain.repository.user_repo import IUserRepository
 from app.modules.food.domain.repository.food_repo import IFoodRepository
+from app.modules.food.infra.nutrient_matrix import NutrientMatrix
+from app.modules.food.infra.food_search_index import FoodSearchIndex
+from app.modules.food.infra.food_autocomplete import FoodAutocomplete
 from app.utils.crypto import Crypto
 from app.utils.exceptions.error_code import ErrorCode
 from app.utils.exceptions.handlers import raise_error
@@ -16,21 +19,55 @@ class FoodService:
             self,
             food_repo: IFoodRepository,
             crypto: Crypto,
+            nutrient_matrix: NutrientMatrix,
+            food_search_index: FoodSearchIndex,
+            food_autocomplete: FoodAutocomplete,
+            match_threshold: float = 0.8,
     ):
         self.food_repo = food_repo
         self.crypto = crypto
+        self.nutrient_matrix = nutrient_matrix
+        self.food_search_index = food_search_index
+        self.food_autocomplete = food_autocomplete
+        self.match_threshold = match_threshold
 
-    def search_food_data(self, name: str):
+    def search_food_data(self, name: str, limit: int = 20):
         if len(name) < 2:
             raise raise_error(ErrorCode.REQUIRE_2LETTER)
-        food = self.food_repo.find_food_by_name(name=name)
+        food = self.food_repo.find_food_by_name(name=name, limit=limit)
         if not food:
             raise raise_error(ErrorCode.NO_FOOD)
         return food
 
+    def autocomplete_food(self, prefix: str, limit: int = 10) -> list[Food]:
+        if not self.food_autocomplete.ready:
+            self.food_repo.find_all_foods()  # 카탈로그를 처음 읽으면서 색인 작성
+        return self.food_autocomplete.complete(prefix, limit=limit)
+
     def get_food_data(self, food_label: int):
         return self.food_repo.find_food_by_label(label=food_label)
 
+    def match_foods(self, name: str, k: int = 5) -> list[tuple[Food, float]]:
+        """자유 입력 음식 이름과 비슷한 카탈로그 음식 상위 k 개와 점수(0~1)"""
+        if not self.food_search_index.ready:
+            self.food_repo.find_all_foods()  # 카탈로그를 처음 읽으면서 색인 작성
+        return self.food_search_index.match(name, k=k)
+
+    def resolve_food(self, name: str | None) -> Food | None:
+        """자유 입력 음식 이름 -> 카탈로그 음식 (match_threshold 이상 비슷한 음식이 없으면 None)"""
+        if not name:
+            return None
+        matches = self.match_foods(name, k=1)
+        if not matches or matches[0][1] < self.match_threshold:
+            return None
+        return matches[0][0]
+
+    def get_total_calorie(self, labels: list[int | None], quantities: list[float], default_calorie: float) -> float:
+        """음식들의 칼로리 합 (카탈로그에 없는 음식은 default_calorie), 영양성분 행렬로 한번에 계산"""
+        if not self.nutrient_matrix.ready:
+            self.food_repo.find_all_foods()  # 카탈로그를 처음 읽으면서 행렬 파일 작성
+        return self.nutrient_matrix.total(labels, quantities, default_calorie=default_calorie)
+
     def insert_food_data(self):
         df = pd.read_excel('food_data.xlsx')
 
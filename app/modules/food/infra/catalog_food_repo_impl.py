@@ -0,0 +1,40 @@
+from abc import ABC
+
+from app.database import engine, after_commit
+from app.modules.food.domain.repository.food_repo import IFoodRepository
+from app.modules.food.infra.food_catalog import FoodCatalog
+from app.modules.food.infra.food_search_index import FoodSearchIndex
+
+
+class CatalogFoodRepository(IFoodRepository, ABC):
+    """
+    label 조회는 메모리 카탈로그, 그 외는 DB repository 사용
+     - 이름 검색: search_backend 가 ngram 이면 메모리 색인, pg_trgm 이면 DB (auto: postgres 면 pg_trgm)
+     - 음식 데이터를 넣으면 요청 트랜잭션이 commit 된 뒤 카탈로그도 다시 읽음
+    """
+
+    def __init__(self, food_repo: IFoodRepository, catalog: FoodCatalog, search_index: FoodSearchIndex,
+                 search_backend: str = "auto"):
+        self.food_repo = food_repo
+        self.catalog = catalog
+        self.search_index = search_index
+        if search_backend == "auto":
+            search_backend = "pg_trgm" if engine.dialect.name == "postgresql" else "ngram"
+        self.search_backend = search_backend
+
+    def find_food_by_name(self, name: str, limit: int = 20):
+        if self.search_backend == "ngram":
+            self.catalog.snapshot  # 처음/오래된 경우 카탈로그를 읽으면서 색인도 갱신
+            return self.search_index.search(name, limit=limit)
+        return self.food_repo.find_food_by_name(name=name, limit=limit)
+
+    def find_food_by_label(self, label: int):
+        return self.catalog.get(label)
+
+    def find_all_foods(self):
+        return list(self.catalog.snapshot.foods)
+
+    def insert_food_data(self, food_vo_list):
+        self.food_repo.insert_food_data(food_vo_list)
+        # commit 전에 읽으면 rollback 되어도 카탈로그/색인/행렬 파일에 남으므로 commit 후에
+        after_commit(self.catalog.reload)
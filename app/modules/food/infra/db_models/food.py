@@ -29,3 +29,9 @@ class Food(Base):
     routine_foods: Mapped[list["RoutineFood"]] = relationship(
         back_populates="food", cascade="all, delete-orphan"
     )
+
+    __table_args__ = (
+        # 이름 검색 (pg_trgm 유사도, LIKE '%이름%'), postgres 전용
+        Index('ix_food_name_trgm', 'name', postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+        .ddl_if(dialect='postgresql'),
+    )
@@ -0,0 +1,73 @@
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from heapq import merge
+from typing import Dict, List
+
+from app.modules.food.domain.food import Food
+from app.utils.hangul import decompose, normalize
+
+_MAX_JAMO = "\U0010ffff"
+
+
+def prefix_keys(name: str) -> set[str]:
+    """이름 전체와 띄어쓴 단어마다 시작하는 자모열 ('김치 찌개' -> 김치찌개, 찌개)"""
+    words = (name or "").split()
+    return {decompose(normalize("".join(words[i:]))) for i in range(len(words))}
+
+
+@dataclass(frozen=True)
+class _Entries:
+    keys: tuple = ()  # 정렬된 자모열
+    labels: tuple = ()  # keys 와 같은 순서의 음식 label
+    names: Dict[int, str] = field(default_factory=dict)  # label -> 색인한 이름 (다음 갱신 때 비교)
+    foods: Dict[int, Food] = field(default_factory=dict)
+    version: int = 0
+
+
+class FoodAutocomplete:
+    """
+    음식 이름 접두어 자동완성 (정렬된 자모열 배열 + 이진 탐색)
+     - 자모 단위로 비교하므로 입력 중인 음절('김ㅊ', '닭갈ㅂ')도 일치
+     - 결과는 자모열 순 (입력한 이름 그대로인 음식이 먼저), 상위 k 개는 O(log n + k)
+     - 카탈로그를 다시 읽으면 이름이 바뀐 음식만 분해해서 기존 배열과 병합
+    """
+
+    def __init__(self):
+        self._entries = _Entries()
+
+    @property
+    def ready(self) -> bool:
+        return bool(self._entries.keys)
+
+    def on_catalog_reload(self, snapshot, previous):
+        entries = self._entries
+        if previous is None or previous.version != entries.version:
+            entries = _Entries()  # 처음이거나 중간 snapshot 을 놓친 경우 전체 작성
+        names = {food.label: food.name for food in snapshot.foods if food.name}
+        changed = {label for label in entries.names.keys() | names.keys() if entries.names.get(label) != names.get(label)}
+        kept = ((key, label) for key, label in zip(entries.keys, entries.labels) if label not in changed)
+        added = sorted((key, label) for label in changed if label in names for key in prefix_keys(names[label]))
+        pairs = list(merge(kept, added))
+        self._entries = _Entries(
+            keys=tuple(key for key, _ in pairs),
+            labels=tuple(label for _, label in pairs),
+            names=names,
+            foods=snapshot.by_label,
+            version=snapshot.version,
+        )
+
+    def complete(self, prefix: str, limit: int = 10) -> List[Food]:
+        entries = self._entries
+        key = decompose(normalize(prefix))
+        if not key:
+            return []
+        start = bisect_left(entries.keys, key)
+        end = bisect_left(entries.keys, key + _MAX_JAMO, lo=start)
+        result = {}
+        for i in range(start, end):
+            label = entries.labels[i]
+            if label not in result:  # 같은 음식이 이름 전체/단어로 여러번 일치
+                result[label] = entries.foods[label]
+                if len(result) == limit:
+                    break
+        return list(result.values())
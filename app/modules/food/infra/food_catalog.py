@@ -0,0 +1,102 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from app.modules.food.domain.food import Food
+from app.utils.metrics import Counter
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class FoodCatalogSnapshot:
+    """한번 만들면 바뀌지 않는 카탈로그 (교체만 함)"""
+    foods: tuple = ()
+    by_label: Dict[int, Food] = field(default_factory=dict)
+    version: int = 0
+    loaded_at: float = 0.0
+
+
+class FoodCatalog:
+    """
+    음식 카탈로그(Food 테이블) 메모리 캐시, label -> Food
+     - 시작할 때 한번 읽고, reload() 는 새 snapshot 을 만든 뒤 참조만 교체 (읽는 쪽은 lock 없음)
+     - 다른 프로세스(uvicorn worker)에서 갱신한 내용은 refresh_interval 마다 백그라운드 스레드에서 다시 읽어서 반영
+       (다시 읽는 동안에도 요청은 기다리지 않고 이전 snapshot 사용)
+     - 반환하는 Food 는 여러 요청이 공유하므로 읽기 전용
+    """
+
+    def __init__(self, loader: Callable[[], List[Food]], refresh_interval: float = 300, listeners: List = None):
+        self.loader = loader
+        self.refresh_interval = refresh_interval
+        self._snapshot: FoodCatalogSnapshot | None = None
+        self._reload_lock = threading.Lock()
+        self._refresh_thread: threading.Thread | None = None
+        self.reloads = Counter()
+        self._listeners: List[Callable[[FoodCatalogSnapshot, FoodCatalogSnapshot | None], None]] = list(listeners or [])
+
+    def add_listener(self, listener: Callable[[FoodCatalogSnapshot, FoodCatalogSnapshot | None], None]):
+        """snapshot 교체시 (새 snapshot, 이전 snapshot) 으로 호출 (검색 색인 등 파생 데이터 갱신용)"""
+        self._listeners.append(listener)
+        if self._snapshot is not None:
+            listener(self._snapshot, None)
+
+    @property
+    def snapshot(self) -> FoodCatalogSnapshot:
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._reload_lock:  # 처음에는 다 읽을 때까지 대기
+                if self._snapshot is None:
+                    self._load()
+            return self._snapshot
+        if self.refresh_interval and time.monotonic() - snapshot.loaded_at > self.refresh_interval:
+            if self._reload_lock.acquire(blocking=False):  # 갱신은 한번에 하나만
+                try:
+                    self._refresh_thread = threading.Thread(target=self._refresh, name="food-catalog-refresh",
+                                                            daemon=True)
+                    self._refresh_thread.start()
+                except Exception:
+                    self._reload_lock.release()
+                    raise
+        return snapshot
+
+    def _refresh(self):
+        """백그라운드 갱신, _reload_lock 을 잡은 상태로 시작"""
+        try:
+            self._load()
+        except Exception as e:
+            logger.warning("음식 카탈로그 갱신 실패: %s", e)
+        finally:
+            self._reload_lock.release()
+
+    def _load(self):
+        foods = tuple(self.loader())
+        previous = self._snapshot
+        snapshot = FoodCatalogSnapshot(
+            foods=foods,
+            by_label={food.label: food for food in foods},
+            version=(previous.version + 1) if previous else 1,
+            loaded_at=time.monotonic(),
+        )
+        for listener in self._listeners:
+            listener(snapshot, previous)
+        self._snapshot = snapshot  # 참조 교체 (원자적)
+        self.reloads.inc()
+        logger.info("음식 카탈로그 %d개 로드 (version %d)", len(foods), snapshot.version)
+
+    def reload(self):
+        with self._reload_lock:
+            self._load()
+
+    def get(self, label: int) -> Optional[Food]:
+        return self.snapshot.by_label.get(label)
+
+    def stats(self) -> dict:
+        snapshot = self._snapshot
+        return {
+            "foods": len(snapshot.foods) if snapshot else 0,
+            "version": snapshot.version if snapshot else 0,
+            "reloads": self.reloads.value,
+        }
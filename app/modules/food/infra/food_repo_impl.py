@@ -1,8 +1,9 @@
 from abc import ABC
 
+from sqlalchemy import or_, func
 from sqlalchemy.exc import IntegrityError
 
-from app.database import SessionLocal
+from app.database import session_scope
 from app.modules.food.domain.repository.food_repo import IFoodRepository
 from app.modules.food.domain.food import Food as FoodVO
 from app.modules.food.infra.db_models.food import Food
@@ -13,19 +14,34 @@ from app.utils.exceptions.handlers import raise_error
 
 class FoodRepository(IFoodRepository, ABC):
 
-    def find_food_by_name(self, name: str):
-        with SessionLocal() as db:
-            return db.query(Food).filter(Food.name.like(f"%{name}%")).all()
+    def find_food_by_name(self, name: str, limit: int = 20):
+        """
+        postgres 는 pg_trgm 유사도 순 (GIN 색인), 그 외는 LIKE 후 짧은 이름 순
+         - 이름에 검색어가 그대로 들어있는 음식이 먼저
+        """
+        with session_scope() as db:
+            contains = Food.name.icontains(name, autoescape=True)
+            if db.get_bind().dialect.name == "postgresql":
+                query = (db.query(Food)
+                         .filter(or_(Food.name.op("%")(name), contains))
+                         .order_by(contains.desc(), func.similarity(Food.name, name).desc(), Food.label))
+            else:
+                query = db.query(Food).filter(contains).order_by(func.length(Food.name), Food.label)
+            return [FoodVO(**row_to_dict(food)) for food in query.limit(limit)]
 
     def find_food_by_label(self, label: int):
-        with SessionLocal() as db:
+        with session_scope() as db:
             food = db.query(Food).filter(Food.label == label).first()
             if food is None:
                 return None
             return FoodVO(**row_to_dict(food))
 
+    def find_all_foods(self):
+        with session_scope() as db:
+            return [FoodVO(**row_to_dict(food)) for food in db.query(Food).order_by(Food.label)]
+
     def insert_food_data(self, food_vo_list):
-        with SessionLocal() as db:
+        with session_scope() as db:
             food_list = []
             for food_vo in food_vo_list:
                 food_list.append(Food(
@@ -0,0 +1,99 @@
+from dataclasses import dataclass
+from typing import List
+
+import numpy as np
+
+from app.modules.food.domain.food import Food
+from app.utils.hangul import decompose, normalize, grams
+
+
+@dataclass(frozen=True)
+class _Index:
+    foods: tuple
+    names: tuple  # 자모로 분해한 이름
+    gram_ids: dict  # gram -> id
+    postings: tuple  # gram id -> 음식 번호 배열 (np.int32)
+    gram_counts: np.ndarray  # 음식별 gram 개수
+    name_lengths: np.ndarray
+
+
+class FoodSearchIndex:
+    """
+    음식 이름 n-gram 역색인 (sqlite/테스트, 혹은 FOOD_SEARCH_BACKEND=ngram)
+     - 점수: 겹치는 gram 비율(jaccard, pg_trgm similarity 와 같은 방식), 이름에 검색어가(자모 단위로) 들어있으면 우선
+     - match: 자유 입력 이름(루틴 음식, dish)을 카탈로그 음식에 대응 (dice 계수, hangul.similarity 와 같은 값)
+     - 카탈로그를 다시 읽으면 새 색인을 만든 뒤 교체
+    """
+
+    def __init__(self, threshold: float = 0.2):
+        self.threshold = threshold
+        self._index = self.build(())
+
+    @staticmethod
+    def build(foods) -> _Index:
+        foods = tuple(food for food in foods if food.name)
+        gram_ids, postings = {}, []
+        counts = np.zeros(len(foods), dtype=np.int32)
+        for i, food in enumerate(foods):
+            food_grams = grams(food.name)
+            counts[i] = len(food_grams)
+            for gram in food_grams:
+                gram_id = gram_ids.setdefault(gram, len(gram_ids))
+                if gram_id == len(postings):
+                    postings.append([])
+                postings[gram_id].append(i)
+        return _Index(
+            foods=foods,
+            names=tuple(decompose(normalize(food.name)) for food in foods),
+            gram_ids=gram_ids,
+            postings=tuple(np.array(p, dtype=np.int32) for p in postings),
+            gram_counts=counts,
+            name_lengths=np.array([len(food.name) for food in foods], dtype=np.int32),
+        )
+
+    @property
+    def ready(self) -> bool:
+        return bool(self._index.foods)
+
+    def on_catalog_reload(self, snapshot, previous):
+        self._index = self.build(snapshot.foods)
+
+    @staticmethod
+    def _shared(index: _Index, query_grams: set) -> tuple[np.ndarray, np.ndarray]:
+        """gram 이 하나라도 겹치는 음식 번호와 겹치는 gram 수 (전체 음식을 한번에 계산)"""
+        hits = [index.postings[index.gram_ids[gram]] for gram in query_grams if gram in index.gram_ids]
+        if not hits:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        shared = np.bincount(np.concatenate(hits), minlength=len(index.foods))
+        candidates = np.nonzero(shared)[0]
+        return candidates, shared[candidates]
+
+    @staticmethod
+    def _top(candidates: np.ndarray, score: np.ndarray, index: _Index, limit: int) -> tuple[np.ndarray, np.ndarray]:
+        """점수, 짧은 이름 순 상위 limit 개"""
+        if len(candidates) > limit:
+            top = np.argpartition(-score, limit - 1)[:limit]
+            candidates, score = candidates[top], score[top]
+        order = np.lexsort((index.name_lengths[candidates], -score))
+        return candidates[order], score[order]
+
+    def match(self, name: str, k: int = 5, threshold: float = 0.0) -> List[tuple[Food, float]]:
+        """name 과 비슷한 음식 상위 k 개와 점수(0~1)"""
+        index = self._index
+        query_grams = grams(name)
+        candidates, shared = self._shared(index, query_grams)
+        score = 2 * shared / (len(query_grams) + index.gram_counts[candidates])
+        keep = score >= threshold
+        candidates, score = self._top(candidates[keep], score[keep], index, k)
+        return [(index.foods[i], float(s)) for i, s in zip(candidates, score)]
+
+    def search(self, query: str, limit: int = 20) -> List[Food]:
+        index = self._index
+        query_grams = grams(query)
+        candidates, shared = self._shared(index, query_grams)
+        similarity = shared / (len(query_grams) + index.gram_counts[candidates] - shared)
+        jamo = decompose(normalize(query))  # '김ㅊ' 처럼 입력 중인 음절도 포함 검색
+        contains = np.fromiter((jamo in index.names[i] for i in candidates), dtype=bool, count=len(candidates))
+        keep = contains | (similarity >= self.threshold)
+        candidates, _ = self._top(candidates[keep], similarity[keep] + contains[keep], index, limit)
+        return [index.foods[i] for i in candidates]
@@ -0,0 +1,123 @@
+import logging
+import os
+import threading
+import time
+from typing import Iterable, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+NUTRIENT_COLUMNS = (
+    "size", "calorie", "carb", "sugar", "fat", "protein", "calcium", "phosphorus", "sodium",
+    "potassium", "magnesium", "iron", "zinc", "cholesterol", "trans_fat",
+)
+COLUMN_INDEX = {name: i for i, name in enumerate(NUTRIENT_COLUMNS)}
+
+
+class NutrientMatrix:
+    """
+    음식 영양성분 행렬 파일 (.npy), worker 프로세스들이 읽기 전용 mmap 으로 공유
+     - float64 (DB Float 값 그대로, 저장하는 칼로리 합계에 오차가 생기지 않도록)
+     - 0번 열은 label, 나머지는 NUTRIENT_COLUMNS 순서, 행은 label 순 정렬 (label -> 행은 searchsorted)
+     - 카탈로그를 다시 읽으면 publish() 로 새 파일을 쓰고 os.replace 로 교체
+     - 다른 worker 가 교체한 파일은 check_interval 마다 파일 변경을 확인해서 다시 mmap
+     - 파일을 쓸 수 없으면 이 프로세스 메모리에만 두고 사용
+    """
+
+    def __init__(self, path: str, check_interval: float = 5.0):
+        self.path = path
+        self.check_interval = check_interval
+        self._matrix: np.ndarray | None = None
+        self._stat_key = None
+        self._checked_at = 0.0
+        self._local = False  # 파일 대신 메모리 행렬 사용중
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def compile(foods: Iterable) -> np.ndarray:
+        foods = sorted(foods, key=lambda food: food.label)
+        matrix = np.zeros((len(foods), 1 + len(NUTRIENT_COLUMNS)), dtype=np.float64)
+        for row, food in enumerate(foods):
+            matrix[row, 0] = food.label
+            matrix[row, 1:] = [getattr(food, name) or 0.0 for name in NUTRIENT_COLUMNS]
+        return matrix
+
+    def publish(self, foods: Iterable):
+        """카탈로그로 행렬 파일 작성, 내용이 같으면 쓰지 않고 mmap 만"""
+        matrix = self.compile(foods)
+        with self._lock:
+            current = self._load()
+            if current is None or current.shape != matrix.shape or not np.array_equal(current, matrix):
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                tmp_path = f"{self.path}.{os.getpid()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    np.save(f, matrix)
+                os.replace(tmp_path, self.path)  # 읽는 쪽은 이전 파일 mmap 을 그대로 사용
+                logger.info("영양성분 행렬 %s 작성 (%d개)", self.path, len(matrix))
+                self._stat_key = None
+            self._local = False
+            self._load()
+
+    def on_catalog_reload(self, snapshot, previous):
+        try:
+            self.publish(snapshot.foods)
+        except Exception:
+            # 파일 작성 실패로 카탈로그 로드(서버 시작)가 막히지 않도록
+            logger.exception("영양성분 행렬 %s 작성 실패, 메모리 행렬 사용", self.path)
+            with self._lock:
+                self._matrix, self._local = self.compile(snapshot.foods), True
+
+    @property
+    def ready(self) -> bool:
+        return self.matrix is not None
+
+    def _load(self) -> np.ndarray | None:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if key != self._stat_key:
+            self._matrix = np.load(self.path, mmap_mode="r")
+            self._stat_key = key
+        self._checked_at = time.monotonic()
+        return self._matrix
+
+    @property
+    def matrix(self) -> np.ndarray | None:
+        if self._local:
+            return self._matrix
+        if self._matrix is None or time.monotonic() - self._checked_at > self.check_interval:
+            with self._lock:
+                return self._load()
+        return self._matrix
+
+    def rows(self, labels: Sequence[int | None]) -> tuple[np.ndarray, np.ndarray]:
+        """label 들의 행 번호와 카탈로그에 있는지 여부"""
+        matrix = self.matrix
+        keys = np.array([-1 if label is None else label for label in labels], dtype=np.float64)
+        if matrix is None or len(matrix) == 0:
+            return np.zeros(len(keys), dtype=np.intp), np.zeros(len(keys), dtype=bool)
+        index = np.minimum(np.searchsorted(matrix[:, 0], keys), len(matrix) - 1)
+        return index, matrix[index, 0] == keys
+
+    def portions(self, labels: Sequence[int | None], quantities: Sequence[float],
+                 default_calorie: float = 0.0) -> np.ndarray:
+        """
+        (음식 개수, 영양성분) 행렬 = 1인분 영양성분 * 수량
+         - 카탈로그에 없는 음식은 칼로리만 default_calorie * 수량
+        """
+        index, found = self.rows(labels)
+        quantities = np.asarray(quantities, dtype=np.float64)
+        values = np.zeros((len(index), len(NUTRIENT_COLUMNS)), dtype=np.float64)
+        if found.any():
+            values[found] = self.matrix[index[found], 1:]
+        values[~found, COLUMN_INDEX["calorie"]] = default_calorie
+        return values * quantities[:, None]
+
+    def total(self, labels: Sequence[int | None], quantities: Sequence[float], column: str = "calorie",
+              default_calorie: float = 0.0) -> float:
+        if not len(labels):
+            return 0.0
+        return float(self.portions(labels, quantities, default_calorie)[:, COLUMN_INDEX[column]].sum())
@@ -7,7 +7,7 @@ from typing import List, Annotated
 
 from app.core.auth import CurrentUser, get_current_user, get_admin_user
 from app.modules.food.application.food_service import FoodService
-from app.modules.food.interface.schema.food_schema import FoodData
+from app.modules.food.interface.schema.food_schema import FoodData, FoodSuggestion
 from app.utils.responses.response import APIResponse
 
 router = APIRouter(prefix="/api/v1/foods", tags=["Food"])
@@ -17,12 +17,29 @@ router = APIRouter(prefix="/api/v1/foods", tags=["Food"])
 @inject
 def search_food_data(
     name: str = Query(..., description="조회할 음식명"),
+    limit: int = Query(20, ge=1, le=100, description="최대 개수"),
     food_service: FoodService = Depends(Provide[Container.food_service])
 ):
     """
     음식명 입력후 칼로리 조회
+     - 유사도 순 상위 limit 개 (이름에 검색어가 그대로 들어있는 음식이 먼저)
     """
-    return food_service.search_food_data(name)
+    return food_service.search_food_data(name, limit=limit)
+
+
+@router.get("/autocomplete", response_model=List[FoodSuggestion])
+@inject
+def autocomplete_food(
+    q: str = Query("", description="입력 중인 음식명"),
+    limit: int = Query(10, ge=1, le=50, description="최대 개수"),
+    food_service: FoodService = Depends(Provide[Container.food_service])
+):
+    """
+    음식명 자동완성 (입력할 때마다 호출)
+     - 음식명(혹은 띄어쓴 단어)이 q 로 시작하는 음식, 한 글자나 입력 중인 음절('김ㅊ')도 가능
+     - 일치하는 음식이 없으면 빈 배열
+    """
+    return food_service.autocomplete_food(q, limit=limit)
 
 
 @router.get("/{food_label}", response_model=FoodData)
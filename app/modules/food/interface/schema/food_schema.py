@@ -22,3 +22,9 @@ class FoodData(BaseModel):
     cholesterol: Optional[float] = 0.0
     trans_fat: Optional[float] = 0.0
     image_url: Optional[str] = ""
+
+
+class FoodSuggestion(BaseModel):
+    label: int
+    name: str
+    calorie: Optional[float] = 0.0
@@ -0,0 +1,177 @@
+import asyncio
+import json
+import time
+from functools import partial
+from typing import List, AsyncIterator
+
+from dependency_injector.wiring import inject
+from fastapi import UploadFile
+from fastapi.concurrency import run_in_threadpool
+from ulid import ULID
+
+from app.database import run_db_bound
+from app.modules.mealday.application.mealday_service import MealDayService
+from app.modules.mealday.application.moose_job_runner import MooseJobRunner
+from app.modules.mealday.domain.moose_job import MooseJob
+from app.modules.mealday.infra.moose_result_cache import MooseImageKey
+from app.modules.mealday.infra.yolo_batcher import YoloBatcher
+from app.modules.mealday.infra.yolo_client import YoloClient
+from app.modules.mealday.interface.schema.mealday_schema import CreateDishBody
+from app.modules.upload.domain.upload import UploadPurpose
+from app.utils.exceptions.error_code import ErrorCode
+from app.utils.exceptions.handlers import raise_error
+from app.utils.metrics import StageMetrics
+
+
+class AsyncMealDayService:
+    """
+    async 라우트용 MealDayService
+     - 로직은 MealDayService 를 그대로 사용하고, DB 작업은 run_db_bound 로 이벤트 루프 밖(AsyncSession 혹은 스레드풀)에서 수행
+    """
+    @inject
+    def __init__(
+            self,
+            mealday_service: MealDayService,
+            yolo_client: YoloClient | YoloBatcher,
+            moose_metrics: StageMetrics,
+            moose_job_runner: MooseJobRunner,
+            moose_sse_timeout: float = 60,
+    ):
+        self.mealday_service = mealday_service
+        self.yolo_client = yolo_client
+        self.moose_metrics = moose_metrics
+        self.moose_job_runner = moose_job_runner
+        self.moose_sse_timeout = moose_sse_timeout
+
+    async def moose(self, user_id: str, file: UploadFile):
+        """사진 음식인식, 결과가 나올 때까지 대기"""
+        return await self.recognize(user_id, await file.read(), file.content_type)
+
+    async def recognize(self, user_id: str, data: bytes, content_type: str, suffix: str = None) -> dict:
+        """
+        사진 정규화 -> 임시 업로드 -> 서명 url -> YOLO 추론 (단계별 소요시간은 moose_metrics 에 기록)
+         - 추론 실패시 임시 사진은 삭제
+         - 같은 사진을 다시 올리면 moose_result_cache 의 결과를 그대로 반환 (업로드/추론 생략)
+        """
+        metrics = self.moose_metrics
+        cache = self.mealday_service.moose_result_cache
+        with metrics.measure("hash"):
+            key = await run_in_threadpool(cache.key, user_id, data)
+        cached = cache.get(key)
+        if cached is not None:
+            if cached.file_path is None:
+                raise raise_error(ErrorCode.NO_FOOD)
+            url = await run_in_threadpool(self.mealday_service.signed_url_service.get, cached.file_path)
+            return {"file_path": cached.file_path, "food_info": cached.food_info, "image_url": url}
+
+        with metrics.measure("normalize"):  # EXIF 제거, 크기 제한 (YOLO 가 받는 사진도 작아짐)
+            normalized = await self.mealday_service.image_processor.aprocess(data, variants=False)
+        if normalized is not None:
+            data, content_type = normalized["original"], "image/jpeg"
+        with metrics.measure("upload"):
+            file_path = await run_in_threadpool(self.mealday_service.upload_temp_image,
+                                                user_id, data, content_type, suffix)
+        return await self._infer_temp_image(file_path, key)
+
+    async def recognize_upload(self, user_id: str, upload_id: str) -> dict:
+        """클라이언트가 직접 올린 사진(upload_id, MOOSE)을 확인 후 음식인식"""
+        upload = await run_db_bound(self.mealday_service.upload_service.finalize_upload,
+                                    user_id, upload_id, UploadPurpose.MOOSE)
+        return await self._infer_temp_image(upload.file_path)
+
+    async def _infer_temp_image(self, file_path: str, key: MooseImageKey = None) -> dict:
+        """임시 사진 서명 url -> YOLO 추론, 실패하면 임시 사진 삭제 (key 가 있으면 결과 캐시)"""
+        metrics = self.moose_metrics
+        cache = self.mealday_service.moose_result_cache
+        try:
+            with metrics.measure("sign"):
+                url = await run_in_threadpool(self.mealday_service.signed_url_service.get, file_path)
+            with metrics.measure("infer"):
+                food_info = await self.yolo_client.infer(url)
+        except Exception:
+            await run_in_threadpool(self.mealday_service.discard_temp_image, file_path)
+            raise
+        if not food_info.get("is_success", False):
+            await run_in_threadpool(self.mealday_service.discard_temp_image, file_path)
+            if key is not None:
+                cache.put(key, None, food_info)
+            raise raise_error(ErrorCode.NO_FOOD)
+        if key is not None:
+            cache.put(key, file_path, food_info)
+        return {"file_path": file_path, "food_info": food_info, "image_url": url}  ## 임시파일이름, food정보, url 반환
+
+    async def submit_moose_job(self, user_id: str, file: UploadFile) -> MooseJob:
+        """
+        사진 음식인식 작업 등록, 바로 작업 반환 (결과는 get_moose_job / stream_moose_job 으로 확인)
+        """
+        data = await file.read()  # 요청이 끝나면 UploadFile 이 닫히므로 미리 읽어둠
+        job = MooseJob(id=str(ULID()), user_id=user_id)
+        await self.moose_job_runner.submit(
+            job, partial(self.recognize, user_id, data, file.content_type, job.id))
+        return job
+
+    async def get_moose_job(self, user_id: str, job_id: str) -> MooseJob:
+        job = await self.moose_job_runner.job_store.find(job_id)
+        if job is None or job.user_id != user_id:
+            raise raise_error(ErrorCode.MOOSE_JOB_NOT_FOUND)
+        return job
+
+    async def stream_moose_job(self, user_id: str, job_id: str, poll_interval: float = 0.5) -> AsyncIterator[str]:
+        """
+        작업 상태가 바뀔 때마다 SSE 이벤트(event: status) 전송, 완료/실패 혹은 moose_sse_timeout 초가 지나면 종료
+        """
+        job = await self.get_moose_job(user_id, job_id)  # 스트림 시작 전에 권한 확인
+
+        async def events():
+            current, last_sent = job, None
+            deadline = time.monotonic() + self.moose_sse_timeout
+            while True:
+                if current is not None and (current.status, current.updated_at) != last_sent:
+                    last_sent = (current.status, current.updated_at)
+                    yield f"event: status\ndata: {json.dumps(current.to_dict(), ensure_ascii=False)}\n\n"
+                if current is None or current.finished:
+                    return
+                if time.monotonic() >= deadline:
+                    yield "event: timeout\ndata: {}\n\n"
+                    return
+                await asyncio.sleep(poll_interval)
+                current = await self.moose_job_runner.job_store.find(job_id)
+
+        return events()
+
+    async def register_dish_v1(self, user_id: str, daytime: str, routine_id: str):
+        return await run_db_bound(self.mealday_service.register_dish_v1, user_id, daytime, routine_id)
+
+    async def register_dish_v2(self, user_id: str, daytime: str, routine_food_id: str, picture: UploadFile):
+        """
+        사진 변환(프로세스 풀)과 storage 저장은 이벤트 루프 밖에서 먼저 하고 DB 작업은 run_db_bound
+         - 등록에 실패하면 저장한 사진 삭제
+        """
+        service = self.mealday_service
+        data = await picture.read()
+        variants = await service.image_processor.aprocess(data)
+        image_path = await run_in_threadpool(service.store_dish_image, user_id, data, picture.content_type, variants)
+        try:
+            return await run_db_bound(service.register_dish_v2_image, user_id, daytime, routine_food_id, image_path)
+        except BaseException:
+            await run_in_threadpool(service.discard_dish_image, image_path)
+            raise
+
+    async def register_dish_v2_upload(self, user_id: str, daytime: str, routine_food_id: str, upload_id: str):
+        return await run_db_bound(self.mealday_service.register_dish_v2_upload, user_id, daytime, routine_food_id,
+                                  upload_id)
+
+    async def register_dish_v3(self, user_id: str, daytime: str, routine_food_ids: List[str]):
+        return await run_db_bound(self.mealday_service.register_dish_v3, user_id, daytime, routine_food_ids)
+
+    async def register_dish_v4(self, user_id: str, daytime: str, body: CreateDishBody):
+        return await run_db_bound(self.mealday_service.register_dish_v4, user_id, daytime, body)
+
+    async def find_dish(self, user_id: str, dish_id: str):
+        return await run_db_bound(self.mealday_service.find_dish, user_id, dish_id)
+
+    async def get_dish_not_routine(self, user_id: str, track_id: str):
+        return await run_db_bound(self.mealday_service.get_dish_not_routine, user_id, track_id)
+
+    async def remove_dish(self, user_id: str, dish_id: str):
+        return await run_db_bound(self.mealday_service.remove_dish, user_id, dish_id)
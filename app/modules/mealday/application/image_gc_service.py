@@ -0,0 +1,120 @@
+import logging
+import threading
+import time
+from contextlib import nullcontext
+from datetime import datetime, timedelta, timezone
+
+from dependency_injector.wiring import inject
+
+from app.core.blob_deleter import BlobDeleter
+from app.core.image_processor import base_image_path
+from app.modules.mealday.domain.repository.mealday_repo import IMealDayRepository
+from app.modules.upload.domain.repository.upload_repo import IUploadRepository
+from app.utils.metrics import Counter
+
+logger = logging.getLogger(__name__)
+
+
+class ImageGarbageCollector:
+    """
+    storage 에 남은 orphan 사진 정리 (temp/ : moose 후 방치된 임시 사진, meal/ : dish 가 없는 사진)
+     - blob 목록을 page 단위로 읽고, page 마다 dish/참조 카운트, 업로드 대기 경로를 조회해서 사용중인 경로를 제외
+       (url 만료 후 upload_grace 가 지나도록 확정되지 않은 업로드는 버려진 것으로 보고 정리)
+     - 만든지 ttl 이 지나지 않은 사진은 업로드 직후일 수 있으므로 제외
+     - dry_run 이면 삭제하지 않고 결과만 보고
+     - 이미 실행중이면(이 프로세스, 혹은 run_guard 로 다른 worker) 실행하지 않고 skipped 결과 반환
+    """
+    @inject
+    def __init__(
+            self,
+            mealday_repo: IMealDayRepository,
+            upload_repo: IUploadRepository,
+            blob_deleter: BlobDeleter,
+            ttl: dict[str, timedelta] = None,
+            page_size: int = 500,
+            upload_grace: timedelta = timedelta(hours=1),
+            bucket=None,
+            run_guard=None,
+    ):
+        self.mealday_repo = mealday_repo
+        self.upload_repo = upload_repo
+        self.blob_deleter = blob_deleter
+        self.ttl = ttl or {"temp/": timedelta(hours=24), "meal/": timedelta(hours=72)}
+        self.page_size = page_size
+        self.upload_grace = upload_grace  # 업로드 url 만료 후 이 시간까지 확정되지 않으면 버려진 업로드
+        self._bucket = bucket
+        self._lock = threading.Lock()  # 동시에 두번 실행하지 않음
+        self.run_guard = run_guard or (lambda: nullcontext(True))  # worker 간 실행 lock (획득 여부를 yield)
+        self.runs = Counter()
+        self.deleted = Counter()
+        self.deleted_bytes = Counter()
+        self.last_report: dict | None = None
+
+    @property
+    def bucket(self):
+        if self._bucket is not None:
+            return self._bucket
+        from app.core import fcm  # firebase 초기화는 실제로 사용할 때
+        return fcm.bucket
+
+    def sweep(self, dry_run: bool = False, sample_size: int = 20) -> dict:
+        if not self._lock.acquire(blocking=False):
+            return self._skipped(dry_run)
+        try:
+            with self.run_guard() as acquired:
+                if not acquired:
+                    return self._skipped(dry_run)  # 다른 worker 가 실행중
+                return self._sweep(dry_run, sample_size)
+        finally:
+            self._lock.release()
+
+    def _skipped(self, dry_run: bool) -> dict:
+        """이미 실행중일 때 결과 (이전 결과가 있으면 그 내용)"""
+        report = self.last_report or {"dry_run": dry_run, "started_at": datetime.utcnow(), "prefixes": [],
+                                      "elapsed_seconds": 0.0, "blobs_per_second": None}
+        return {**report, "skipped": True}
+
+    def _sweep(self, dry_run: bool, sample_size: int) -> dict:
+        start = time.perf_counter()
+        report = {"dry_run": dry_run, "started_at": datetime.utcnow(),
+                  "prefixes": [self._sweep_prefix(prefix, ttl, dry_run, sample_size)
+                               for prefix, ttl in self.ttl.items()]}
+        elapsed = time.perf_counter() - start
+        scanned = sum(p["scanned"] for p in report["prefixes"])
+        report["elapsed_seconds"] = round(elapsed, 3)
+        report["blobs_per_second"] = round(scanned / elapsed, 1) if elapsed > 0 else None
+        self.runs.inc()
+        self.last_report = report
+        logger.info("orphan 사진 정리%s: %s", " (dry-run)" if dry_run else "",
+                    {p["prefix"]: (p["scanned"], p["orphans"]) for p in report["prefixes"]})
+        return report
+
+    def _sweep_prefix(self, prefix: str, ttl: timedelta, dry_run: bool, sample_size: int) -> dict:
+        result = {"prefix": prefix, "pages": 0, "scanned": 0, "orphans": 0, "orphan_bytes": 0, "samples": []}
+        cutoff = datetime.now(timezone.utc) - ttl
+        for page in self.bucket.list_blobs(prefix=prefix, page_size=self.page_size).pages:
+            blobs = list(page)
+            old = {blob.name: blob.size or 0 for blob in blobs
+                   if blob.time_created is not None and blob.time_created < cutoff}
+            result["pages"] += 1
+            result["scanned"] += len(blobs)
+            if not old:
+                continue
+            bases = {path: base_image_path(path) for path in old}  # 작은/중간 사진은 원본이 사용중이면 유지
+            paths = list(set(bases.values()))
+            pending = self.upload_repo.find_pending_paths(paths, expires_after=datetime.utcnow() - self.upload_grace)
+            referenced = self.mealday_repo.find_referenced_images(paths) | pending
+            orphans = sorted(path for path in old if bases[path] not in referenced)
+            size = sum(old[path] for path in orphans)
+            result["orphans"] += len(orphans)
+            result["orphan_bytes"] += size
+            result["samples"].extend(orphans[:sample_size - len(result["samples"])])
+            if orphans and not dry_run:
+                self.blob_deleter.delete_many(orphans)
+                self.deleted.inc(len(orphans))
+                self.deleted_bytes.inc(size)
+        return result
+
+    def stats(self) -> dict:
+        return {"runs": self.runs.value, "deleted": self.deleted.value, "deleted_bytes": self.deleted_bytes.value,
+                "last_report": self.last_report}
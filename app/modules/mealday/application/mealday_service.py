@@ -1,15 +1,17 @@
 from fastapi import HTTPException, File, Form, UploadFile
 import os, json
+from collections import Counter
 from typing import List
 from ulid import ULID
-from urllib.parse import quote
 from dependency_injector.wiring import inject
 from calendar import monthrange
 from datetime import date, datetime, timedelta, time
 from app.core.fcm import bucket
+from app.core.signed_url import SignedUrlService
+from app.core.image_processor import ImageProcessor, VARIANTS, variant_path
+from app.modules.mealday.infra.moose_result_cache import MooseResultCache
 
 import app.modules.user.application.user_service
-import requests
 
 from app.utils.parser import weekday_parse, time_parse, mealtime_parse
 
@@ -18,14 +20,18 @@ from app.modules.user.application.user_service import UserService
 from app.modules.mealday.domain.repository.mealday_repo import IMealDayRepository
 from app.modules.track.application.track_service import TrackService
 from app.modules.food.application.food_service import FoodService
+from app.modules.upload.application.upload_service import UploadService
+from app.modules.outbox.application.outbox_service import OutboxService
+from app.modules.upload.domain.upload import UploadPurpose
 from app.modules.mealday.domain.mealday import MealDay as MealDayV0
-from app.modules.track.interface.schema.track_schema import MealTime
+from app.modules.track.interface.schema.track_schema import MealTime, FlagStatus
 from app.modules.mealday.interface.schema.mealday_schema import CreateDishBody, \
-    UpdateMealDayBody, UpdateDishBody, DishImageUrl, DishResponse, DishGroupResponse, MealdayResponseFull
+    UpdateMealDayBody, UpdateDishBody, DishImageUrl, DishResponse, DishGroupResponse, MealdayResponseFull, DishFull
 from app.utils.crypto import Crypto
 from app.utils.db_utils import orm_to_pydantic, dataclass_to_pydantic
 from app.utils.exceptions.error_code import ErrorCode
 from app.utils.exceptions.handlers import raise_error
+from app.utils.hangul import normalize
 
 
 class MealDayService:
@@ -37,12 +43,22 @@ class MealDayService:
             track_service: TrackService,
             food_service: FoodService,
             crypto: Crypto,
+            signed_url_service: SignedUrlService,
+            moose_result_cache: MooseResultCache,
+            upload_service: UploadService,
+            outbox_service: OutboxService,
+            image_processor: ImageProcessor,
     ):
         self.mealday_repo = mealday_repo
         self.user_servcie = user_service
         self.track_service = track_service
         self.food_service = food_service
         self.crypto = crypto
+        self.signed_url_service = signed_url_service
+        self.moose_result_cache = moose_result_cache
+        self.upload_service = upload_service
+        self.outbox_service = outbox_service
+        self.image_processor = image_processor
 
     def invert_daytime_to_date(self, daytime: str) -> date:
         try:
@@ -102,6 +118,16 @@ class MealDayService:
                                                     last_day=track.finish_date)
         return count
 
+    def create_mealday_by_track_participants(self, user_id: str, track_id: str):
+        """
+        트랙 참여자(종료 제외) 전원의 트랙 기간 MealDay 를 한번에 생성
+        """
+        track = self.track_service.validate_track(track_id=track_id, user_id=user_id)
+        participants = self.track_service.get_track_participants(track_id=track_id)
+        user_ids = list({part.user_id for part in participants if part.status != FlagStatus.TERMINATED})
+        return self.mealday_repo.save_many_mealday_batch(user_ids=user_ids, track_id=track_id,
+                                                         first_day=track.start_date, last_day=track.finish_date)
+
     def find_mealday_by_date(self, user_id: str, daytime: str):
         record_date = self.invert_daytime_to_date(daytime)
         mealday = self.mealday_repo.find_by_date(user_id=user_id, record_date=record_date)
@@ -134,43 +160,83 @@ class MealDayService:
         filename = f"{user_id}_{time}"
         return filename
 
-    def moose(self, user_id: str, file: File(...)):
-        # 고유한 파일 이름 생성
-        file_id = self.create_file_name(user_id=user_id)
-
-        # Firebase Storage에 파일 업로드
-        temp_blob = bucket.blob(f"temp/{file_id}")
-        temp_blob.upload_from_file(file.file, content_type=file.content_type)
-
-        # Yolov 서버로 파일 전송(yolov 서버가 firebase 사진에 접근)
-        url = temp_blob.generate_signed_url(expiration=timedelta(hours=1))  # 60분 유효url
-        print(url)
-        encoded_url = quote(url, safe='')
-
-        # YOLO 서버에 POST 요청을 보내고, 응답 받기
-        #response = requests.post(f"https://hamster-delicate-sparrow.ngrok-free.app/yolo/?url={encoded_url}",
-        #                         headers={'accept': 'application/json', 'ngrok-skip-browser-warning': 'hello'})
-        response = requests.post(f"http://110.8.6.21/yolo/?url={encoded_url}", headers={'accept': 'application/json'})
-        print(response.status_code)
-        # Yolov 서버 응답 확인 - 실패시 0 출력
-        if response.status_code != 201:
-            temp_blob.delete()  # firebase에 저장된 임시파일삭제
-            raise ErrorCode.YOLO_FAILED
+    @staticmethod
+    def catalog_image_path(food) -> str | None:
+        """dish 가 참조할 음식 카탈로그 사진 경로 (복사하지 않음)"""
+        if food is None or not food.image_url:
+            return None
+        return food.image_url
+
+    def acquire_catalog_images(self, image_paths):
+        """카탈로그 사진 참조 카운트 증가 (경로별로 한번에)"""
+        for path, count in Counter(path for path in image_paths if path).items():
+            self.mealday_repo.acquire_image(path, count=count, pinned=True)
+
+    def release_dish_image(self, image_path: str | None):
+        """dish 가 더 이상 쓰지 않는 사진 참조 해제, 참조가 모두 없어지면 storage 에서 삭제"""
+        if not image_path or not self.mealday_repo.release_image(image_path):
             return
-        # Yolov 서버에서 반환된 정보
-        food_info = response.json()
-        print(food_info)
-        is_success = bool(food_info.get("is_success", False))
-        if is_success is False:
-            return ErrorCode.NO_FOOD
-        return {"file_path": temp_blob.name, "food_info": food_info, "image_url": url}  ## 임시파일이름, food정보, url 반환
+        for path in [image_path, *filter(None, (variant_path(image_path, v) for v in VARIANTS))]:
+            self.outbox_service.delete_blob(path)  # dish 삭제와 같은 트랜잭션, 실제 삭제는 outbox worker
+            self.signed_url_service.invalidate(path)
+
+    def upload_dish_image(self, user_id: str, data: bytes, content_type: str) -> str:
+        """
+        dish 사진 업로드, 경로 반환
+         - 변환 가능하면 meal/{id}/original.jpg 와 small/medium 크기를 함께 저장
+         - 변환할 수 없는 사진은 meal/{id} 에 원본 그대로
+        """
+        return self.store_dish_image(user_id, data, content_type, self.image_processor.process(data))
+
+    def store_dish_image(self, user_id: str, data: bytes, content_type: str, variants: dict | None) -> str:
+        """변환된 사진(variants, 실패시 None)을 storage 에 저장, 경로 반환 (async 라우트는 변환을 먼저 await)"""
+        file_id = self.create_file_name(user_id=user_id)
+        if variants is None:
+            blob = bucket.blob(f"meal/{file_id}")
+            blob.upload_from_string(data, content_type=content_type)
+            return blob.name
+        for variant, variant_data in variants.items():
+            bucket.blob(f"meal/{file_id}/{variant}.jpg").upload_from_string(variant_data, content_type="image/jpeg")
+        return f"meal/{file_id}/original.jpg"
+
+    def sign_dish_images(self, image_paths) -> dict:
+        """dish 사진 경로 -> {"image_url", "image_small_url", "image_medium_url"} (변환되지 않은 사진은 작은 사진 None)"""
+        image_paths = {path for path in image_paths if path}
+        variant_paths = {path: {f"image_{v}_url": variant_path(path, v) for v in VARIANTS} for path in image_paths}
+        urls = self.signed_url_service.get_many(
+            [*image_paths, *(p for variants in variant_paths.values() for p in variants.values() if p)])
+        return {
+            path: {"image_url": urls.get(path),
+                   **{key: urls.get(p) if p else None for key, p in variant_paths[path].items()}}
+            for path in image_paths
+        }
+
+    def discard_dish_image(self, image_path: str):
+        """dish 등록에 실패한 사진 삭제 (요청은 실패로 끝나므로 outbox 에 별도 저장)"""
+        for path in [image_path, *filter(None, (variant_path(image_path, v) for v in VARIANTS))]:
+            self.outbox_service.delete_blob(path, detached=True)
+
+    def upload_temp_image(self, user_id: str, data: bytes, content_type: str, suffix: str = None) -> str:
+        """moose 용 임시 사진 업로드, 경로 반환 (suffix: 같은 초에 여러장 올릴 때 구분용)"""
+        file_name = self.create_file_name(user_id=user_id)
+        if suffix:
+            file_name = f"{file_name}-{suffix}"
+        temp_blob = bucket.blob(f"temp/{file_name}")
+        temp_blob.upload_from_string(data, content_type=content_type)
+        return temp_blob.name
+
+    def discard_temp_image(self, file_path: str):
+        """moose 실패시 임시 사진 삭제 (요청은 실패로 끝나므로 outbox 에 별도 저장)"""
+        self.outbox_service.delete_blob(file_path, detached=True)
+        self.signed_url_service.invalidate(file_path)
+        self.moose_result_cache.invalidate_path(file_path)
 
     def remove_moose(self, file_path: Form):
-        temp_blob = bucket.blob(file_path)
-        if temp_blob.exists():
-            temp_blob.delete()
-            return {"detail": "Temporary file removed"}
-        return {"detail": "No Temporary file here"}
+        self.moose_result_cache.invalidate_path(file_path)
+        if not file_path.startswith("temp/"):
+            return {"detail": "No Temporary file here"}
+        self.outbox_service.delete_blob(file_path)
+        return {"detail": "Temporary file removed"}
 
     ########################################################################
     ############## Dish ##################################################
@@ -183,30 +249,54 @@ class MealDayService:
         if mealday is None:
             raise raise_error(ErrorCode.MEALDAY_NOT_FOUND)
         track_part = self.track_service.get_track_part_by_user_track_id(user_id=user_id, track_id=mealday.track_id)
+        # 1) 등록할 dish 결정 (조회만), 음식 사진은 카탈로그 사진을 그대로 참조
+        plans = []
         for track_routine in track_routine_foods:
             for rf in track_routine.routine_foods:
                 routine_food_check = self.track_service.get_routine_food_check_by_routine_food_id(routine_food_id=rf.id,
                                                                                                   user_id=user_id)
                 if routine_food_check:
                     raise raise_error(ErrorCode.DISH_ALREADY_EXIST)
-                image_path = None
-                label = rf.food_label if rf.food_label is not None else None
-                if rf.food_label is not None and rf.food is not None:
-                    file_id = self.create_file_name(user_id=user_id)
-                    dish_path = f"meal/{file_id}"
-                    food_blob = bucket.blob(rf.food.image_url if rf.food.image_url is not None else dish_path)
-                    dish_blob = bucket.blob(dish_path)
-                    bucket.copy_blob(food_blob, bucket, dish_blob.name)
-                    image_path = dish_blob.name
-                dish = self.mealday_repo.create_dish_trackroutine(user_id=user_id, mealday_id=mealday.id,
-                                                                  trackroutine=track_routine,
-                                                                  trackpart_id=track_part.id, image_url=image_path,
-                                                                  quantity=rf.quantity, food=rf.food, label=label,
-                                                                  name=rf.food_name)
-                self.track_service.create_routine_food_check(routine_food_id=rf.id, dish_id=dish.id, user_id=user_id)
-                self.track_service.update_routine_check(user_id=user_id, routine_id=routine_id, status=True)
+                plans.append((track_routine, rf, self.catalog_image_path(rf.food)))
+        # 2) DB 저장 (요청 트랜잭션에서 한번에 commit)
+        for track_routine, rf, image_path in plans:
+            dish = self.mealday_repo.create_dish_trackroutine(user_id=user_id, mealday_id=mealday.id,
+                                                              trackroutine=track_routine,
+                                                              trackpart_id=track_part.id, image_url=image_path,
+                                                              quantity=rf.quantity, food=rf.food,
+                                                              label=rf.food_label, name=rf.food_name)
+            self.track_service.create_routine_food_check(routine_food_id=rf.id, dish_id=dish.id, user_id=user_id)
+        self.acquire_catalog_images(image_path for _, _, image_path in plans)
+        if plans:
+            self.track_service.update_routine_check(user_id=user_id, routine_id=routine_id, status=True)
 
     def register_dish_v2(self, user_id: str, daytime: str, routine_food_id: str, picture: UploadFile = File(...)):
+        def upload_picture():
+            image_path = self.upload_dish_image(user_id, picture.file.read(), picture.content_type)
+            self.mealday_repo.acquire_image(image_path)
+            return image_path
+
+        self._register_routine_food_dish(user_id, daytime, routine_food_id, upload_picture)
+
+    def register_dish_v2_image(self, user_id: str, daytime: str, routine_food_id: str, image_path: str):
+        """register_dish_v2 와 같지만 사진은 이미 storage 에 저장된 경로 (async 라우트)"""
+        def acquire_image():
+            self.mealday_repo.acquire_image(image_path)
+            return image_path
+
+        self._register_routine_food_dish(user_id, daytime, routine_food_id, acquire_image)
+
+    def register_dish_v2_upload(self, user_id: str, daytime: str, routine_food_id: str, upload_id: str):
+        """register_dish_v2 와 같지만 사진은 클라이언트가 직접 올린 업로드(upload_id) 사용"""
+        def finalize_upload():
+            file_path = self.upload_service.finalize_upload(user_id, upload_id, UploadPurpose.DISH).file_path
+            self.mealday_repo.acquire_image(file_path)
+            return file_path
+
+        self._register_routine_food_dish(user_id, daytime, routine_food_id, finalize_upload)
+
+    def _register_routine_food_dish(self, user_id: str, daytime: str, routine_food_id: str, get_image_path):
+        """검증이 끝난 뒤 get_image_path() 로 사진 경로를 얻어 루틴푸드 dish 등록"""
         record_date = self.invert_daytime_to_date(daytime)
         routine_food_check = self.track_service.get_routine_food_check_by_routine_food_id(
             routine_food_id=routine_food_id,
@@ -220,10 +310,7 @@ class MealDayService:
             raise raise_error(ErrorCode.MEALDAY_NOT_FOUND)
 
         track_part = self.track_service.get_track_part_by_user_track_id(user_id=user_id, track_id=mealday.track_id)
-        file_id = self.create_file_name(user_id=user_id)
-        blob = bucket.blob(f"meal/{file_id}")
-        blob.upload_from_file(picture.file, content_type=picture.content_type)
-        image_path = blob.name
+        image_path = get_image_path()
         dish = self.mealday_repo.create_dish_trackroutine(user_id=user_id, mealday_id=mealday.id,
                                                           trackroutine=track_routine,
                                                           trackpart_id=track_part.id, image_url=image_path,
@@ -238,6 +325,8 @@ class MealDayService:
         if mealday is None:
             raise raise_error(ErrorCode.MEALDAY_NOT_FOUND)
         track_part = self.track_service.get_track_part_by_user_track_id(user_id=user_id, track_id=mealday.track_id)
+        # 1) 등록할 dish 결정 (조회만), 음식 사진은 카탈로그 사진을 그대로 참조
+        plans = []
         for routine_food_id in routine_food_ids:
             routine_food_check = self.track_service.get_routine_food_check_by_routine_food_id(
                 routine_food_id=routine_food_id,
@@ -246,23 +335,20 @@ class MealDayService:
                 raise raise_error(ErrorCode.DISH_ALREADY_EXIST)
             routine_food = self.track_service.get_routine_food_with_food_by_id(routine_food_id=routine_food_id)
             track_routine = self.track_service.get_routine_by_id(routine_id=routine_food.routine_id, user_id=user_id)
-            image_path = None
-            label = routine_food.food_label if routine_food.food_label is not None else None
-            if routine_food.food_label is not None and routine_food.food is not None:
-                file_id = self.create_file_name(user_id=user_id)
-                dish_path = f"meal/{file_id}"
-                food_blob = bucket.blob(routine_food.food.image_url)
-                dish_blob = bucket.blob(dish_path)
-                bucket.copy_blob(food_blob, bucket, dish_blob.name)
-                image_path = dish_blob.name
+            plans.append((track_routine, routine_food, self.catalog_image_path(routine_food.food)))
+        # 2) DB 저장 (요청 트랜잭션에서 한번에 commit)
+        for track_routine, routine_food, image_path in plans:
             dish = self.mealday_repo.create_dish_trackroutine(user_id=user_id, mealday_id=mealday.id,
                                                               trackroutine=track_routine,
                                                               trackpart_id=track_part.id, image_url=image_path,
                                                               quantity=routine_food.quantity, food=routine_food.food,
-                                                              label=label, name=routine_food.food_name)
+                                                              label=routine_food.food_label,
+                                                              name=routine_food.food_name)
             self.track_service.create_routine_food_check(routine_food_id=routine_food.id, dish_id=dish.id,
                                                          user_id=user_id)
-            self.track_service.update_routine_check(user_id=user_id, routine_id=track_routine.id, status=True)
+        self.acquire_catalog_images(image_path for _, _, image_path in plans)
+        for routine_id in dict.fromkeys(track_routine.id for track_routine, _, _ in plans):
+            self.track_service.update_routine_check(user_id=user_id, routine_id=routine_id, status=True)
 
     def register_dish_v4(self, user_id: str, daytime: str, body: CreateDishBody):
         record_date = self.invert_daytime_to_date(daytime)
@@ -271,76 +357,62 @@ class MealDayService:
             raise raise_error(ErrorCode.MEALDAY_NOT_FOUND)
         trackpart = self.track_service.get_track_part_by_user_track_id(user_id=user_id, track_id=mealday.track_id)
         food = None
-        image_path = None
+        name = None
+        mealtime = time_parse(body.mealtime)
         if body.label is not None:
             food = self.food_service.get_food_data(food_label=body.label)
             if food is None:
                 raise raise_error(ErrorCode.NO_FOOD)
-            mealtime = time_parse(body.mealtime)
-            file_id = self.create_file_name(user_id=user_id)
-            dish_path = f"meal/{file_id}"
-            food_blob = bucket.blob(food.image_url)
-            dish_blob = bucket.blob(dish_path)
-            bucket.copy_blob(food_blob, bucket, dish_blob.name)
-            image_path = dish_blob.name
-        self.mealday_repo.create_dish(user_id=user_id, mealday_id=mealday.id, body=body,
-                                      trackpart_id=trackpart.id, mealtime=mealtime, food=food, image_path=image_path)
+        else:
+            food = self.food_service.resolve_food(body.name)  # 이름만 입력해도 카탈로그 음식이면 영양성분 사용
+            if food is not None and normalize(food.name) != normalize(body.name):
+                name = body.name  # 비슷한 음식은 label, 영양성분만 쓰고 이름은 입력한 그대로
+        image_path = self.catalog_image_path(food)
+        self.mealday_repo.create_dish(user_id=user_id, mealday_id=mealday.id, body=body, trackpart_id=trackpart.id,
+                                      mealtime=mealtime, food=food, image_path=image_path, name=name)
+        self.acquire_catalog_images([image_path])
 
     def find_dish(self, user_id: str, dish_id: str):
         dish = self.mealday_repo.find_dish(user_id=user_id, dish_id=dish_id)
         if dish is None:
             raise raise_error(ErrorCode.DISH_NOT_FOUND)
-        if dish.image_url and dish.image_url is not None:
+        # 세션에 연결된 dish 를 직접 바꾸면 서명 url 이 DB에 저장되므로 응답 객체에 설정
+        response = DishFull.model_validate(dish)
+        if dish.image_url:
             try:
-                # 서명된 URL 생성 (URL은 1시간 동안 유효)
-                blob = bucket.blob(dish.image_url)
-                signed_url = blob.generate_signed_url(expiration=timedelta(hours=1))
+                for key, url in self.sign_dish_images([dish.image_url])[dish.image_url].items():
+                    setattr(response, key, url)
             except Exception:
                 raise raise_error(ErrorCode.DISH_NOT_FOUND)
-            dish.image_url = signed_url
-        return dish
+        return response
 
     def get_dish_not_routine(self, user_id: str, track_id: str):
         track = self.track_service.validate_track(track_id=track_id, user_id=user_id)
-        start_date = track.start_date
-        finish_date = track.finish_date
+        rows = self.mealday_repo.find_dish_timeline(user_id=user_id, first_day=track.start_date,
+                                                    last_day=track.finish_date)
+        image_urls = self.sign_dish_images(row.image_url for row in rows if row.dish_id)
         group_list = []
-        num = 1
-        while finish_date >= start_date:
-            mealday = self.mealday_repo.find_by_date(user_id=user_id, record_date=start_date)
-            if mealday is None:
-                raise raise_error(ErrorCode.MEALDAY_NOT_FOUND)
-            all_dishes = self.mealday_repo.find_dish_all(mealday_id=mealday.id, user_id=user_id)
-            dishes_list = []
-            for dish in all_dishes:
-                routine_food_check = self.track_service.get_routine_food_check_by_dish_id(dish_id=dish.id,
-                                                                                          user_id=user_id)
-                if routine_food_check:
-                    continue
-                else:
-                    image_url = None
-                    if dish.image_url:
-                        dish_blob = bucket.blob(dish.image_url)
-                        image_url = dish_blob.generate_signed_url(expiration=timedelta(hours=1))  # 60분 유효url
-                    dish_response = DishResponse(
-                        id=dish.id,
-                        mealtime=dish.mealtime,
-                        label=dish.label,
-                        name=dish.name,
-                        quantity=dish.quantity,
-                        calorie=dish.calorie,
-                        image_url=image_url
-                    )
-                    dishes_list.append(dish_response)
-                dishes_list = sorted(dishes_list, key=lambda dish: mealtime_parse(dish.mealtime))
-            dish_group_response = DishGroupResponse(
-                record_date=start_date,
-                days=num,
-                total_calorie=mealday.nowcalorie,
-                dishes=dishes_list
-            )
-            group_list.append(dish_group_response)
-            start_date += timedelta(days=1)
+        for row in rows:  # 날짜, 식사시간 순으로 정렬되어 있음
+            if not group_list or group_list[-1].record_date != row.record_date:
+                group_list.append(DishGroupResponse(
+                    record_date=row.record_date,
+                    days=len(group_list) + 1,
+                    total_calorie=row.nowcalorie,
+                    dishes=[]
+                ))
+            if row.dish_id is None:
+                continue
+            group_list[-1].dishes.append(DishResponse(
+                id=row.dish_id,
+                mealtime=row.mealtime,
+                label=row.label,
+                name=row.name,
+                quantity=row.quantity,
+                calorie=row.calorie,
+                **image_urls.get(row.image_url, {})
+            ))
+        if len(group_list) != (track.finish_date - track.start_date).days + 1:
+            raise raise_error(ErrorCode.MEALDAY_NOT_FOUND)
         return group_list
 
     def remove_dish(self, user_id: str, dish_id: str):
@@ -373,12 +445,7 @@ class MealDayService:
                 self.track_service.update_routine_check(user_id=user_id, routine_id=routine_food.routine_id,
                                                         status=False)
         image_url = self.mealday_repo.delete_dish(user_id=user_id, dish_id=dish_id)
-        if image_url is None:
-            return
-        else:
-            blob = bucket.blob(image_url)
-            if blob.exists():
-                blob.delete()
+        self.release_dish_image(image_url)
 
     def apply_update_dish(self, dish, body: UpdateDishBody, status: int):
         """사용자 정보 업데이트 적용"""
@@ -454,7 +521,7 @@ class MealDayService:
                 # 현재 dish 삭제 및 routine_food_check 삭제
                 if current_rf_check:
                     self.track_service.delete_routine_food_check_by_dish_id(dish_id, user_id)
-                self.mealday_repo.delete_dish(user_id=user_id, dish_id=dish_id)
+                self.release_dish_image(self.mealday_repo.delete_dish(user_id=user_id, dish_id=dish_id))
                 return new_dish
             else:
                 # 1-2) routine_food_check가 없는 경우: dish 수정 + routine_food_check 생성
@@ -498,14 +565,25 @@ class MealDayService:
         if dish is None:
             raise raise_error(ErrorCode.DISH_NOT_FOUND)
         food = self.food_service.get_food_data(dish.label)
-        if food is None:
+        if food is None or not food.image_url:
             raise raise_error(ErrorCode.NO_FOOD)
-        file_id = self.create_file_name(user_id=user_id)
-        dish_path = f"meal/{file_id}"
-        food_blob = bucket.blob(food.image_url)
-        dish_blob = bucket.blob(dish_path)
-        bucket.copy_blob(food_blob, bucket, dish_blob.name)
-        image_path = dish_blob.name
-        self.mealday_repo.update_dish_image(dish.id, image_path)
-        url = dish_blob.generate_signed_url(expiration=timedelta(hours=1))  # 60분 유효url
-        return DishImageUrl(image_url=url)
+        old_image = dish.image_url
+        if old_image != food.image_url:
+            self.mealday_repo.update_dish_image(dish.id, food.image_url)
+            self.acquire_catalog_images([food.image_url])
+            self.release_dish_image(old_image)
+        return DishImageUrl(image_url=self.signed_url_service.get(food.image_url))
+
+    def update_dish_image_upload(self, user_id: str, dish_id: str, upload_id: str):
+        """
+        클라이언트가 직접 올린 사진(upload_id)을 확인 후 dish 사진으로 교체, 이전 사진은 삭제
+        """
+        dish = self.mealday_repo.find_dish(user_id=user_id, dish_id=dish_id)
+        if dish is None:
+            raise raise_error(ErrorCode.DISH_NOT_FOUND)
+        old_image = dish.image_url
+        upload = self.upload_service.finalize_upload(user_id, upload_id, UploadPurpose.DISH)
+        self.mealday_repo.update_dish_image(dish.id, upload.file_path)
+        self.mealday_repo.acquire_image(upload.file_path)
+        self.release_dish_image(old_image)
+        return DishImageUrl(image_url=self.signed_url_service.get(upload.file_path))
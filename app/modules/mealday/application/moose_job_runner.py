@@ -0,0 +1,91 @@
+import asyncio
+import contextvars
+import logging
+from datetime import datetime
+from typing import Awaitable, Callable
+
+from fastapi import HTTPException
+
+from app.modules.mealday.domain.moose_job import MooseJob, MooseJobStatus
+from app.modules.mealday.domain.repository.moose_job_store import IMooseJobStore
+from app.utils.exceptions.error_code import ErrorCode
+from app.utils.exceptions.handlers import raise_error
+
+logger = logging.getLogger(__name__)
+
+
+class MooseJobRunner:
+    """
+    moose 작업 워커 풀
+     - submit 된 작업을 큐에 넣고 workers 개의 asyncio task 가 꺼내서 실행
+     - 상태(PENDING -> RUNNING -> DONE/FAILED)와 결과는 job_store 에 저장, 큐가 가득 차면 MOOSE_QUEUE_FULL
+     - 워커는 앱 시작시 start(), 요청 안에서 처음 시작되더라도 요청의 contextvars(세션, SQL 집계)는 물려받지 않음
+    """
+
+    def __init__(self, job_store: IMooseJobStore, workers: int = 4, queue_size: int = 100):
+        self.job_store = job_store
+        self.workers = workers
+        self.queue_size = queue_size
+        self._queue: asyncio.Queue | None = None
+        self._tasks: list[asyncio.Task] = []
+
+    def start(self):
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        # 빈 context 에서 생성 (요청이 끝나면 닫히는 UnitOfWork 세션, 요청 SQL 집계가 워커로 넘어오지 않도록)
+        context = contextvars.Context()
+        self._tasks = [context.run(asyncio.create_task, self._worker(), name=f"moose-worker-{i}")
+                       for i in range(self.workers)]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+        await self.job_store.close()
+
+    async def submit(self, job: MooseJob, work: Callable[[], Awaitable[dict]]):
+        """work 의 반환값(file_path, image_url, food_info)이 작업 결과가 됨"""
+        self.start()
+        if self._queue.full():
+            raise raise_error(ErrorCode.MOOSE_QUEUE_FULL)
+        await self.job_store.save(job)
+        self._queue.put_nowait((job, work))
+
+    async def _worker(self):
+        while True:
+            job, work = await self._queue.get()
+            try:
+                await self._run(job, work)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: MooseJob, work: Callable[[], Awaitable[dict]]):
+        await self._update(job, status=MooseJobStatus.RUNNING)
+        try:
+            result = await work()
+        except HTTPException as e:
+            await self._update(job, status=MooseJobStatus.FAILED, error=e.detail)
+        except Exception:
+            logger.exception("moose 작업 실패 job=%s", job.id)
+            await self._update(job, status=MooseJobStatus.FAILED,
+                               error={"status_code": 500, "message": "음식 인식에 실패했습니다."})
+        else:
+            await self._update(job, status=MooseJobStatus.DONE, **result)
+
+    async def _update(self, job: MooseJob, **fields):
+        for key, value in fields.items():
+            setattr(job, key, value)
+        job.updated_at = datetime.utcnow()
+        try:
+            await self.job_store.save(job)
+        except Exception:
+            logger.exception("moose 작업 상태 저장 실패 job=%s", job.id)
+
+    def stats(self) -> dict:
+        return {
+            "workers": len(self._tasks),
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+        }
@@ -4,6 +4,40 @@ from typing import List, Optional
 from app.modules.track.interface.schema.track_schema import MealTime
 
 
+@dataclass(frozen=True)
+class Nutrition:
+    """
+    칼로리/탄단지 묶음, MealDay 합계의 변화량(delta)이나 합계 자체로 사용
+    """
+    calorie: float = 0.0
+    carb: float = 0.0
+    protein: float = 0.0
+    fat: float = 0.0
+
+    @classmethod
+    def of(cls, obj) -> "Nutrition":
+        """Dish(ORM/VO) 등 calorie, carb, protein, fat 속성을 가진 객체에서 생성 (None 은 0)"""
+        return cls(
+            calorie=obj.calorie or 0.0,
+            carb=obj.carb or 0.0,
+            protein=obj.protein or 0.0,
+            fat=obj.fat or 0.0,
+        )
+
+    def __add__(self, other: "Nutrition") -> "Nutrition":
+        return Nutrition(self.calorie + other.calorie, self.carb + other.carb,
+                         self.protein + other.protein, self.fat + other.fat)
+
+    def __neg__(self) -> "Nutrition":
+        return Nutrition(-self.calorie, -self.carb, -self.protein, -self.fat)
+
+    def __sub__(self, other: "Nutrition") -> "Nutrition":
+        return self + (-other)
+
+    def is_zero(self) -> bool:
+        return not (self.calorie or self.carb or self.protein or self.fat)
+
+
 @dataclass
 class Dish:  # 식단등록
     id: str
@@ -0,0 +1,46 @@
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+
+
+class MooseJobStatus(Enum):
+    PENDING = "PENDING"  # 큐 대기
+    RUNNING = "RUNNING"  # 업로드/서명/추론 중
+    DONE = "DONE"
+    FAILED = "FAILED"
+
+
+@dataclass
+class MooseJob:
+    """
+    moose(사진 음식인식) 비동기 작업
+    """
+    id: str
+    user_id: str
+    status: MooseJobStatus = MooseJobStatus.PENDING
+    file_path: Optional[str] = None  # 임시 저장 사진 경로
+    image_url: Optional[str] = None
+    food_info: Optional[dict] = None
+    error: Optional[dict] = None  # 실패시 {"status_code", "message"}
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    updated_at: datetime = field(default_factory=datetime.utcnow)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (MooseJobStatus.DONE, MooseJobStatus.FAILED)
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["status"] = self.status.value
+        data["created_at"] = self.created_at.isoformat()
+        data["updated_at"] = self.updated_at.isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "MooseJob":
+        data = dict(data)
+        data["status"] = MooseJobStatus(data["status"])
+        data["created_at"] = datetime.fromisoformat(data["created_at"])
+        data["updated_at"] = datetime.fromisoformat(data["updated_at"])
+        return cls(**data)
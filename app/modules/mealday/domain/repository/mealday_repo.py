@@ -19,6 +19,10 @@ class IMealDayRepository(metaclass=ABCMeta):
     def save_many_mealday(self, user_id: str, track_id: str, first_day: date, last_day: date):
         raise NotImplementedError
 
+    @abstractmethod
+    def save_many_mealday_batch(self, user_ids: List[str], track_id: str, first_day: date, last_day: date):
+        raise NotImplementedError
+
     @abstractmethod
     def find_by_date(self, user_id: str, record_date: date) -> MealDay:
         raise NotImplementedError
@@ -31,6 +35,10 @@ class IMealDayRepository(metaclass=ABCMeta):
     ##############  Dish##################################################
     ########################################################################
 
+    @abstractmethod
+    def find_dish_timeline(self, user_id: str, first_day: date, last_day: date):
+        raise NotImplementedError
+
     @abstractmethod
     def create_dish_trackroutine(self, user_id: str, mealday_id: str, trackroutine: TrackRoutine,
                                  trackpart_id: str, image_url: str, quantity: int | None, food: Food | None, label: int | None, name: str | None):
@@ -38,7 +46,7 @@ class IMealDayRepository(metaclass=ABCMeta):
 
     @abstractmethod
     def create_dish(self, user_id: str, mealday_id: str, body: CreateDishBody,
-                    trackpart_id: str, mealtime: MealTime, food: Food, image_path: str):
+                    trackpart_id: str, mealtime: MealTime, food: Food, image_path: str, name: str | None = None):
         raise NotImplementedError
 
     @abstractmethod
@@ -71,4 +79,16 @@ class IMealDayRepository(metaclass=ABCMeta):
 
     @abstractmethod
     def update_dish_image(self, dish_id: str, image_path: str):
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    @abstractmethod
+    def acquire_image(self, path: str, count: int = 1, pinned: bool = False):
+        raise NotImplementedError
+
+    @abstractmethod
+    def release_image(self, path: str) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_referenced_images(self, paths: List[str]) -> set[str]:
+        raise NotImplementedError
@@ -0,0 +1,21 @@
+from abc import ABCMeta, abstractmethod
+from typing import Optional
+
+from app.modules.mealday.domain.moose_job import MooseJob
+
+
+class IMooseJobStore(metaclass=ABCMeta):
+    """
+    moose 작업 상태 저장소 (메모리 / redis)
+    """
+    @abstractmethod
+    async def save(self, job: MooseJob):
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find(self, job_id: str) -> Optional[MooseJob]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def close(self):
+        raise NotImplementedError
@@ -16,7 +16,7 @@ class MealDay(Base):
         DateTime,
         nullable=False,
         default=datetime.utcnow,
-        server_default=sqlalchemy.text('now()')  # alembic용
+        server_default=sqlalchemy.func.now()  # alembic용 (postgres now(), sqlite CURRENT_TIMESTAMP)
     )
     water: Mapped[float] = mapped_column(Float, nullable=True, default=0.0)
     coffee: Mapped[float] = mapped_column(Float, nullable=True, default=0.0)
@@ -45,7 +45,7 @@ class Dish(Base):
 
     id: Mapped[str] = mapped_column(String(length=26), primary_key=True, nullable=False, default=lambda: str(ulid.ULID()))
     user_id: Mapped[str] = mapped_column(String(length=26), ForeignKey("User.id"), nullable=False)
-    mealday_id: Mapped[str] = mapped_column(String(length=26), ForeignKey("MealDay.id"), nullable=False)
+    mealday_id: Mapped[str] = mapped_column(String(length=26), ForeignKey("MealDay.id"), nullable=False, index=True)
     mealtime: Mapped[MealTime] = mapped_column(Enum(MealTime), nullable=False) #LUNCH, DINNER 등
     days: Mapped[int] = mapped_column(Integer, nullable=False, default=0) #일차
     name: Mapped[str] = mapped_column(String(length=255), nullable=False, default="새로운 식단 등록")
@@ -65,3 +65,17 @@ class Dish(Base):
     label: Mapped[int] = mapped_column(Integer, ForeignKey("Food.label"), nullable=True, default=None)  ## label 필요유무 검토필요
     trackpart_id: Mapped[str] = mapped_column(String(length=26), ForeignKey("TrackParticipant.id"), nullable=True)
     mealday: Mapped["MealDay"] = relationship("MealDay", back_populates="dishes")
+
+
+class ImageRef(Base):
+    """
+    dish 사진 참조 카운트 - 음식 카탈로그 사진은 복사하지 않고 여러 dish 가 같은 경로를 공유
+     - ref_count 가 0 이 되면 사진 삭제, pinned(카탈로그 사진)는 삭제하지 않음
+    """
+    __tablename__ = "ImageRef"
+
+    path: Mapped[str] = mapped_column(String(length=255), primary_key=True, nullable=False)  # storage 경로
+    content_hash: Mapped[str] = mapped_column(String(length=64), nullable=True, index=True)  # storage md5 (중복 정리용)
+    ref_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    pinned: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    created_at: Mapped[DateTime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
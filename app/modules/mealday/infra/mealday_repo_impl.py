@@ -2,29 +2,36 @@ from abc import ABC
 from ulid import ULID
 from typing import List
 from fastapi import HTTPException, Depends
+from sqlalchemy import insert, update, delete, func, case, exists, and_, select, union
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session, joinedload
 from datetime import date, datetime, timedelta
 from calendar import monthrange
-from app.database import SessionLocal, get_db
+from app.database import session_scope
 from app.modules.mealday.domain.repository.mealday_repo import IMealDayRepository
 from app.modules.mealday.domain.mealday import MealDay as MealDayVO
 from app.modules.mealday.domain.mealday import Dish as DishVO
-from app.modules.mealday.infra.db_models.mealday import MealDay, Dish
+from app.modules.mealday.domain.mealday import Nutrition as NutritionVO
+from app.modules.mealday.infra.db_models.mealday import MealDay, Dish, ImageRef
 from app.modules.food.infra.db_models.food import Food
 from app.modules.mealday.interface.schema.mealday_schema import DishWithDatetime,DishFull, CreateDishBody
 from app.modules.track.interface.schema.track_schema import MealTime
 from app.modules.track.infra.db_models.track_participant import TrackParticipant
 from app.modules.track.infra.db_models.track import Track, TrackRoutine
+from app.modules.track.infra.db_models.track_routine_food import RoutineFoodCheck
 from app.utils.db_utils import row_to_dict
+from app.utils.parser import MEALTIME_ORDER
 from app.core.fcm import bucket
 from app.utils.exceptions.error_code import ErrorCode
 from app.utils.exceptions.handlers import raise_error
 
 
 class MealDayRepository(IMealDayRepository, ABC):
+    BULK_INSERT_CHUNK = 500  # 한 INSERT 당 행 수 (sqlite 바인드 변수 개수 제한 고려)
 
     def save_mealday(self, mealday: MealDayVO):
-        with SessionLocal() as db:
+        with session_scope() as db:
             new_mealday = MealDay(
                 id=mealday.id,
                 user_id=mealday.user_id,
@@ -52,51 +59,90 @@ class MealDayRepository(IMealDayRepository, ABC):
             return MealDayVO(**row_to_dict(new_mealday))
 
     def save_many_mealday(self, user_id: str, track_id: str, first_day: date, last_day: date):
-        with SessionLocal() as db:
-            date_iter = first_day
+        return self.save_many_mealday_batch(user_ids=[user_id], track_id=track_id,
+                                            first_day=first_day, last_day=last_day)
+
+    def save_many_mealday_batch(self, user_ids: List[str], track_id: str, first_day: date, last_day: date):
+        """
+        user_ids 전원의 first_day ~ last_day MealDay 중 없는 날짜만 한번에 생성, 생성된 개수 반환
+         - 기존 날짜는 SELECT 한번으로 조회, 나머지는 INSERT 한번 (ON CONFLICT DO NOTHING)
+        """
+        if not user_ids or first_day > last_day:
+            return 0
+        with session_scope() as db:
+            existing = set(
+                db.query(MealDay.user_id, MealDay.record_date)
+                .filter(MealDay.user_id.in_(user_ids),
+                        MealDay.record_date >= first_day,
+                        MealDay.record_date <= last_day)
+                .all()
+            )
+            now = datetime.utcnow()
+            rows = []
+            for user_id in user_ids:
+                date_iter = first_day
+                while date_iter <= last_day:
+                    if (user_id, date_iter) not in existing:
+                        rows.append(self._empty_mealday_row(user_id, date_iter, track_id, now))
+                    date_iter += timedelta(days=1)
+            if not rows:
+                return 0
+
             count = 0
-            while date_iter <= last_day:
-                meal = db.query(MealDay).filter(MealDay.user_id == user_id, MealDay.record_date == date_iter).first()
-                if not meal:
-                    new_mealday = MealDay(
-                        id=str(ULID()),
-                        user_id=user_id,
-                        record_date=date_iter,
-                        update_datetime=datetime.utcnow(),
-                        water=0.0,
-                        coffee=0.0,
-                        alcohol=0.0,
-                        carb=0.0,
-                        protein=0.0,
-                        fat=0.0,
-                        cheating=0,
-                        goalcalorie=0.0,
-                        nowcalorie=0.0,
-                        burncalorie=0.0,
-                        gb_carb=None,
-                        gb_protein=None,
-                        gb_fat=None,
-                        weight=0.0,
-                        routine_success_rate=None,
-                        track_id=track_id
-                    )
-                    db.add(new_mealday)
-                    count += 1
-                date_iter += timedelta(days=1)
-            if count>=1:
-                db.commit()
+            for i in range(0, len(rows), self.BULK_INSERT_CHUNK):
+                result = db.execute(self._insert_ignore_conflict(db, rows[i:i + self.BULK_INSERT_CHUNK]))
+                count += result.rowcount
+            db.commit()
             return count
 
+    @staticmethod
+    def _empty_mealday_row(user_id: str, record_date: date, track_id: str, now: datetime) -> dict:
+        return dict(
+            id=str(ULID()),
+            user_id=user_id,
+            record_date=record_date,
+            update_datetime=now,
+            water=0.0,
+            coffee=0.0,
+            alcohol=0.0,
+            carb=0.0,
+            protein=0.0,
+            fat=0.0,
+            cheating=0,
+            goalcalorie=0.0,
+            nowcalorie=0.0,
+            burncalorie=0.0,
+            gb_carb=None,
+            gb_protein=None,
+            gb_fat=None,
+            weight=0.0,
+            routine_success_rate=None,
+            track_id=track_id
+        )
+
+    @staticmethod
+    def _insert_ignore_conflict(db: Session, rows: List[dict]):
+        """
+        (user_id, record_date) 가 이미 있으면 건너뛰는 multi-row INSERT
+         - 동시에 같은 날짜를 만드는 요청이 있어도 _user_date_daily_uc 위반 없이 처리
+        """
+        dialect = db.get_bind().dialect.name
+        if dialect == "postgresql":
+            return postgresql_insert(MealDay).values(rows).on_conflict_do_nothing(constraint="_user_date_daily_uc")
+        if dialect == "sqlite":
+            return sqlite_insert(MealDay).values(rows).on_conflict_do_nothing(index_elements=["user_id", "record_date"])
+        return insert(MealDay).values(rows)
+
     def find_by_date(self, user_id: str, record_date: date) -> MealDayVO:
-        with SessionLocal() as db:
+        with session_scope() as db:
             return db.query(MealDay).filter(MealDay.user_id == user_id, MealDay.record_date == record_date).first()
 
     def find_by_id(self, mealday_id: str) -> MealDayVO:
-        with SessionLocal() as db:
+        with session_scope() as db:
             return db.query(MealDay).filter(MealDay.id == mealday_id).first()
 
     def update_mealday(self, _mealday: MealDay):
-        with SessionLocal() as db:
+        with session_scope() as db:
             mealday = db.query(MealDay).filter(MealDay.id == _mealday.id, MealDay.record_date == _mealday.record_date).first()
             mealday.weight = _mealday.weight
             mealday.burncalorie = _mealday.burncalorie
@@ -111,14 +157,42 @@ class MealDayRepository(IMealDayRepository, ABC):
     ############## Dish ##################################################
     ########################################################################
 
+    @staticmethod
+    def _add_nutrition(db: Session, mealday_id: str, delta: NutritionVO):
+        """
+        UPDATE "MealDay" SET nowcalorie = nowcalorie + :d, ... 한 문장으로 합계 변경
+         - 읽고 더해서 쓰는 방식이 아니므로 같은 날 동시 등록에도 값이 유실되지 않음
+        """
+        if delta.is_zero():
+            return
+        db.execute(
+            update(MealDay)
+            .where(MealDay.id == mealday_id)
+            .values(
+                nowcalorie=func.coalesce(MealDay.nowcalorie, 0.0) + delta.calorie,
+                carb=func.coalesce(MealDay.carb, 0.0) + delta.carb,
+                protein=func.coalesce(MealDay.protein, 0.0) + delta.protein,
+                fat=func.coalesce(MealDay.fat, 0.0) + delta.fat,
+                update_datetime=datetime.utcnow(),
+            )
+            .execution_options(synchronize_session="fetch")  # 세션에 로드된 MealDay 도 갱신
+        )
+
+    @staticmethod
+    def _stored_nutrition(db: Session, dish_id: str) -> NutritionVO | None:
+        """
+        DB에 저장된 dish 영양값 (세션에서 수정중인 객체 값이 아닌 실제 저장값)
+        """
+        row = db.query(Dish.calorie, Dish.carb, Dish.protein, Dish.fat).filter(Dish.id == dish_id).first()
+        return NutritionVO.of(row) if row else None
+
     def create_dish_trackroutine(self, user_id: str, mealday_id: str, trackroutine: TrackRoutine,
                                  trackpart_id: str, image_url: str, quantity: int | None, food: Food | None, label: int | None, name: str | None):
-        with SessionLocal() as db:
-            mealday = db.query(MealDay).filter(MealDay.id == mealday_id).first()
+        with session_scope() as db:
             new_dish = Dish(
                 id=str(ULID()),
                 user_id=user_id,
-                mealday_id=mealday.id,
+                mealday_id=mealday_id,
                 mealtime=trackroutine.mealtime,
                 days=trackroutine.days,
                 name=food.name if food else name,
@@ -139,25 +213,20 @@ class MealDayRepository(IMealDayRepository, ABC):
                 trackpart_id=trackpart_id,
             )
             db.add(new_dish)
-            mealday.nowcalorie += new_dish.calorie
-            mealday.carb += new_dish.carb or 0.0
-            mealday.protein += new_dish.protein or 0.0
-            mealday.fat += new_dish.fat or 0.0
-            db.add(mealday)
+            self._add_nutrition(db, mealday_id, NutritionVO.of(new_dish))
             db.commit()
             return DishVO(**row_to_dict(new_dish))
 
     def create_dish(self, user_id: str, mealday_id: str, body: CreateDishBody,
-                    trackpart_id: str, mealtime: MealTime, food: Food, image_path: str):
-        with SessionLocal() as db:
-            mealday = db.query(MealDay).filter(MealDay.id == mealday_id).first()
+                    trackpart_id: str, mealtime: MealTime, food: Food, image_path: str, name: str | None = None):
+        with session_scope() as db:
             new_dish = Dish(
                 id=str(ULID()),
                 user_id=user_id,
-                mealday_id=mealday.id,
+                mealday_id=mealday_id,
                 mealtime=mealtime,
                 days=body.days,
-                name=food.name if food else body.name,
+                name=name or (food.name if food else body.name),
                 quantity=body.quantity,
                 image_url=image_path,
                 text=None,
@@ -175,66 +244,79 @@ class MealDayRepository(IMealDayRepository, ABC):
                 trackpart_id=trackpart_id,
             )
             db.add(new_dish)
-            mealday.nowcalorie += new_dish.calorie
-            mealday.carb += new_dish.carb
-            mealday.protein += new_dish.protein
-            mealday.fat += new_dish.fat
-            db.add(mealday)
+            self._add_nutrition(db, mealday_id, NutritionVO.of(new_dish))
             db.commit()
             return DishVO(**row_to_dict(new_dish))
 
     def find_dish(self, user_id: str, dish_id: str):
-        with SessionLocal() as db:
+        with session_scope() as db:
             return db.query(Dish).filter(Dish.user_id==user_id, Dish.id == dish_id).first()
 
     def find_dish_all(self, user_id: str, mealday_id: str):
-        with SessionLocal() as db:
+        with session_scope() as db:
             return db.query(Dish).filter(Dish.user_id==user_id,Dish.mealday_id==mealday_id).all()
 
-    def delete_dish(self, user_id: str, dish_id: str):
-        with SessionLocal() as db:
-            mealday = (
-                db.query(MealDay)
-                .join(Dish, Dish.mealday_id == MealDay.id)
-                .filter(Dish.id == dish_id)
-                .first()
+    def find_dish_timeline(self, user_id: str, first_day: date, last_day: date):
+        """
+        first_day ~ last_day 의 MealDay 와 루틴 외 dish(RoutineFoodCheck 없음)를 한번에 조회
+         - dish 가 없는 날도 dish_id=None 인 행으로 포함
+         - 날짜, 식사시간 순서, 등록시간 순으로 정렬
+        """
+        with session_scope() as db:
+            not_routine = ~exists().where(RoutineFoodCheck.dish_id == Dish.id,
+                                          RoutineFoodCheck.user_id == user_id)
+            mealtime_order = case(
+                *[(Dish.mealtime == mealtime, order) for mealtime, order in MEALTIME_ORDER.items()],
+                else_=len(MEALTIME_ORDER)
             )
-            if mealday is None:
-                return None
-            dish = db.query(Dish).filter(Dish.id == dish_id, Dish.user_id==user_id).first()
-            if dish is None:
+            return (
+                db.query(
+                    MealDay.record_date,
+                    MealDay.nowcalorie,
+                    Dish.id.label("dish_id"),
+                    Dish.mealtime,
+                    Dish.label,
+                    Dish.name,
+                    Dish.quantity,
+                    Dish.calorie,
+                    Dish.image_url,
+                )
+                .outerjoin(Dish, and_(Dish.mealday_id == MealDay.id, Dish.user_id == user_id, not_routine))
+                .filter(MealDay.user_id == user_id,
+                        MealDay.record_date >= first_day,
+                        MealDay.record_date <= last_day)
+                .order_by(MealDay.record_date, mealtime_order, Dish.record_datetime)
+                .all()
+            )
+
+    def delete_dish(self, user_id: str, dish_id: str):
+        with session_scope() as db:
+            # 삭제와 동시에 삭제된 값 반환 (조회 없이 한번에)
+            deleted = db.execute(
+                delete(Dish)
+                .where(Dish.id == dish_id, Dish.user_id == user_id)
+                .returning(Dish.mealday_id, Dish.calorie, Dish.carb, Dish.protein, Dish.fat, Dish.image_url)
+                .execution_options(synchronize_session="fetch")
+            ).first()
+            if deleted is None:
                 return None
-            mealday.carb -= dish.carb
-            mealday.protein -= dish.protein
-            mealday.fat -= dish.fat
-            mealday.nowcalorie -= dish.calorie
-            mealday.update_datetime = datetime.utcnow()
-            image_url=dish.image_url
-            db.delete(dish)
+            self._add_nutrition(db, deleted.mealday_id, -NutritionVO.of(deleted))
             db.commit()
-            return image_url
+            return deleted.image_url
 
     def update_dish(self, _dish: Dish, percent: float, image_path: str | None):
-        with SessionLocal() as db:
+        with session_scope() as db:
             dish = db.query(Dish).filter(Dish.id == _dish.id).first()
             if percent > 0:
-                mealday = (
-                    db.query(MealDay)
-                    .join(Dish, Dish.mealday_id == MealDay.id)
-                    .filter(Dish.id == dish.id)
-                    .first()
-                )
-                mealday.carb -= (-_dish.carb + dish.carb)
-                mealday.protein -= (-_dish.protein + dish.protein)
-                mealday.fat -= (-_dish.fat + dish.fat)
-                mealday.nowcalorie -= (-_dish.calorie + dish.calorie)
-                mealday.update_datetime = datetime.utcnow()
+                # _dish 가 세션의 같은 객체일 수 있으므로 기존값은 DB에서 직접 읽음
+                stored = self._stored_nutrition(db, dish.id)
+                self._add_nutrition(db, dish.mealday_id, NutritionVO.of(_dish) - stored)
             dish.heart = _dish.heart
             dish.image_url = image_path
             dish.track_goal = _dish.track_goal
             dish.label = _dish.label
             dish.quantity =  _dish.quantity
-            dish.update_dateime = datetime.utcnow()
+            dish.update_datetime = datetime.utcnow()
             dish.size = _dish.size
             dish.carb = _dish.carb
             dish.protein = _dish.protein
@@ -244,89 +326,113 @@ class MealDayRepository(IMealDayRepository, ABC):
             return DishVO(**row_to_dict(dish))
 
     def update_dish_quantity(self, dish_id: str, quantity: int, food: Food | None, name: str | None):
-        with SessionLocal() as db:
+        with session_scope() as db:
             dish = db.query(Dish).filter(Dish.id == dish_id).first()
-            mealday = (
-                db.query(MealDay)
-                .join(Dish, Dish.mealday_id == MealDay.id)
-                .filter(Dish.id == dish.id)
-                .first()
-            )
+            old = NutritionVO.of(dish)
             if dish.label and name: # 라벨 -> 이름으로 변경시
-                mealday.carb += (-dish.carb + 0.0)
-                mealday.protein += (-dish.protein + 0.0)
-                mealday.fat += (-dish.fat + 0.0)
-                mealday.nowcalorie += (-dish.calorie + 700 * quantity)
-                mealday.update_datetime = datetime.utcnow()
                 dish.quantity = quantity
-                dish.update_dateime = datetime.utcnow()
-                dish.carb = 0
-                dish.protein = 0
-                dish.fat = 0
+                dish.label = None
+                dish.name = name
+                dish.carb = 0.0
+                dish.protein = 0.0
+                dish.fat = 0.0
                 dish.calorie = 700 * quantity
-                db.commit()
             elif dish.label is None and food: # 이름 -> 라벨로 변경시
-                mealday.carb += (-dish.carb + food.carb)
-                mealday.protein += (-dish.protein + food.protein)
-                mealday.fat += (-dish.fat + food.fat)
-                mealday.nowcalorie += (-dish.calorie + food.calorie * quantity)
-                mealday.update_datetime = datetime.utcnow()
                 dish.quantity = quantity
-                dish.update_dateime = datetime.utcnow()
-                dish.carb = 0
-                dish.protein = 0
-                dish.fat = 0
-                dish.calorie = 700 * quantity
-                db.commit()
+                dish.carb = food.carb * quantity
+                dish.protein = food.protein * quantity
+                dish.fat = food.fat * quantity
+                dish.calorie = food.calorie * quantity
+                dish.label = food.label
+                dish.name = food.name
             else: # 이름->이름, 라벨->라벨
                 ratio = (float(quantity) / float(dish.quantity))
-                mealday.carb += dish.carb * ratio
-                mealday.protein += dish.protein * ratio
-                mealday.fat += dish.fat * ratio
-                mealday.nowcalorie += dish.calorie * ratio
-                mealday.update_datetime = datetime.utcnow()
                 dish.quantity += quantity
-                dish.update_dateime = datetime.utcnow()
-                dish.carb = dish.carb + dish.carb * ratio
-                dish.protein = dish.protein + dish.protein * ratio
-                dish.fat = dish.fat + dish.fat * ratio
-                dish.calorie = dish.calorie + dish.calorie * ratio
-                db.commit()
+                dish.carb = old.carb + old.carb * ratio
+                dish.protein = old.protein + old.protein * ratio
+                dish.fat = old.fat + old.fat * ratio
+                dish.calorie = old.calorie + old.calorie * ratio
+            dish.update_datetime = datetime.utcnow()
+            self._add_nutrition(db, dish.mealday_id, NutritionVO.of(dish) - old)
+            db.commit()
             return DishVO(**row_to_dict(dish))
 
     def update_dish_label_or_name(self, dish_id: str, name: str | None, quantity: int, food: Food | None):
-        with SessionLocal() as db:
+        with session_scope() as db:
             dish = db.query(Dish).filter(Dish.id == dish_id).first()
             if dish is None:
                 raise raise_error(ErrorCode.DISH_NOT_FOUND)
-            mealday = (
-                db.query(MealDay)
-                .join(Dish, Dish.mealday_id == MealDay.id)
-                .filter(Dish.id == dish.id)
-                .first()
-            )
-            mealday.carb -= (-food.carb * quantity + dish.carb) if food else mealday.carb
-            mealday.protein -= (-food.protein * quantity + dish.protein) if food else mealday.protein
-            mealday.fat -= (-food.fat * quantity + dish.fat) if food else mealday.fat
-            mealday.nowcalorie -= (-food.calorie * quantity + dish.calorie) if food else (-700 * quantity + dish.calorie)
-            mealday.update_datetime = datetime.utcnow()
+            old = NutritionVO.of(dish)
             dish.quantity = quantity
-            dish.update_dateime = datetime.utcnow()
-            dish.carb = food.carb if food else 0.0
-            dish.protein = food.protein if food else 0.0
-            dish.fat = food.fat if food else 0.0
+            dish.carb = food.carb * quantity if food else 0.0
+            dish.protein = food.protein * quantity if food else 0.0
+            dish.fat = food.fat * quantity if food else 0.0
             dish.size = food.size if food else 100.0
-            dish.label = food.label if food else None,
-            dish.calorie = food.calorie if food else 700 * quantity
+            dish.label = food.label if food else None
+            dish.calorie = food.calorie * quantity if food else 700 * quantity
             dish.name = food.name if food else name
             dish.update_datetime = datetime.utcnow()
+            self._add_nutrition(db, dish.mealday_id, NutritionVO.of(dish) - old)
             db.commit()
             return DishVO(**row_to_dict(dish))
 
     def update_dish_image(self, dish_id: str, image_path: str):
-        with SessionLocal() as db:
+        with session_scope() as db:
             dish = db.query(Dish).filter(Dish.id == dish_id).first()
             if dish is None:
                 return None
             dish.image_url = image_path
-            db.commit()
\ No newline at end of file
+            db.commit()
+
+    def acquire_image(self, path: str, count: int = 1, pinned: bool = False):
+        """사진을 참조하는 dish 가 count 개 늘어남 (없으면 생성)"""
+        with session_scope() as db:
+            values = dict(path=path, ref_count=count, pinned=pinned, created_at=datetime.utcnow())
+            set_ = {"ref_count": ImageRef.ref_count + count}
+            if pinned:
+                set_["pinned"] = True
+            dialect = db.get_bind().dialect.name
+            if dialect in ("postgresql", "sqlite"):
+                dialect_insert = postgresql_insert if dialect == "postgresql" else sqlite_insert
+                db.execute(dialect_insert(ImageRef).values(**values)
+                           .on_conflict_do_update(index_elements=["path"], set_=set_))
+            elif db.execute(update(ImageRef).where(ImageRef.path == path).values(**set_)).rowcount == 0:
+                db.execute(insert(ImageRef).values(**values))
+            db.commit()
+
+    def release_image(self, path: str) -> bool:
+        """
+        사진 참조 하나 해제, 더 이상 참조가 없어 storage 에서 지워도 되면 True
+         - 참조 카운트가 없는 경로(이전 방식으로 복사된 dish 사진)는 meal/ 아래만 삭제 대상
+        """
+        with session_scope() as db:
+            row = db.execute(
+                update(ImageRef)
+                .where(ImageRef.path == path)
+                .values(ref_count=ImageRef.ref_count - 1)
+                .returning(ImageRef.ref_count, ImageRef.pinned)
+                .execution_options(synchronize_session=False)
+            ).first()
+            if row is None:
+                return path.startswith("meal/")
+            if row.ref_count > 0 or row.pinned:
+                db.commit()
+                return False
+            db.execute(delete(ImageRef).where(ImageRef.path == path, ImageRef.ref_count <= 0)
+                       .execution_options(synchronize_session=False))
+            db.commit()
+            return True
+
+    def find_referenced_images(self, paths: List[str]) -> set[str]:
+        """
+        paths 중 아직 사용중인 경로 (orphan 정리용, 쿼리 한번)
+         - dish 사진, 참조 카운트가 있는 사진 (업로드 대기중인 경로는 upload 모듈에서)
+        """
+        if not paths:
+            return set()
+        with session_scope() as db:
+            query = union(
+                select(Dish.image_url).where(Dish.image_url.in_(paths)),
+                select(ImageRef.path).where(ImageRef.path.in_(paths)),
+            )
+            return set(db.scalars(query))
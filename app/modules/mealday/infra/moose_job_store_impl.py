@@ -0,0 +1,66 @@
+import json
+import time
+from typing import Optional
+
+from redis import asyncio as aioredis
+
+from app.modules.mealday.domain.moose_job import MooseJob
+from app.modules.mealday.domain.repository.moose_job_store import IMooseJobStore
+
+
+class InMemoryMooseJobStore(IMooseJobStore):
+    """
+    프로세스 메모리에 작업 보관 (단일 워커 배포/개발용), ttl 초가 지난 작업은 저장시 정리
+    """
+
+    def __init__(self, ttl: int = 600):
+        self.ttl = ttl
+        self._jobs: dict[str, tuple[dict, float]] = {}  # id -> (job, 만료 시각)
+
+    async def save(self, job: MooseJob):
+        now = time.monotonic()
+        expired = [job_id for job_id, (_, expires_at) in self._jobs.items() if expires_at <= now]
+        for job_id in expired:
+            del self._jobs[job_id]
+        self._jobs[job.id] = (job.to_dict(), now + self.ttl)
+
+    async def find(self, job_id: str) -> Optional[MooseJob]:
+        stored = self._jobs.get(job_id)
+        if stored is None or stored[1] <= time.monotonic():
+            return None
+        return MooseJob.from_dict(stored[0])
+
+    async def close(self):
+        self._jobs.clear()
+
+
+class RedisMooseJobStore(IMooseJobStore):
+    """
+    redis 에 작업 보관 (여러 워커 프로세스가 결과를 공유), key 만료는 redis ttl 사용
+    """
+
+    def __init__(self, url: str, ttl: int = 600, prefix: str = "moose:job:"):
+        self.url = url
+        self.ttl = ttl
+        self.prefix = prefix
+        self._redis = None
+
+    @property
+    def redis(self):
+        if self._redis is None:
+            self._redis = aioredis.from_url(self.url, decode_responses=True)
+        return self._redis
+
+    async def save(self, job: MooseJob):
+        await self.redis.set(self.prefix + job.id, json.dumps(job.to_dict(), ensure_ascii=False), ex=self.ttl)
+
+    async def find(self, job_id: str) -> Optional[MooseJob]:
+        data = await self.redis.get(self.prefix + job_id)
+        if data is None:
+            return None
+        return MooseJob.from_dict(json.loads(data))
+
+    async def close(self):
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
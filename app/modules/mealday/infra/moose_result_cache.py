@@ -0,0 +1,127 @@
+import hashlib
+import io
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from app.utils.metrics import Counter
+
+
+def dhash(data: bytes, size: int = 8) -> Optional[int]:
+    """
+    사진의 difference hash (64bit), 재압축/리사이즈된 같은 사진은 hamming 거리가 작음
+     - Pillow 가 없거나 이미지가 아니면 None
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            pixels = list(image.convert("L").resize((size + 1, size)).getdata())
+    except Exception:
+        return None
+    value = 0
+    for row in range(size):
+        for col in range(size):
+            left = pixels[row * (size + 1) + col]
+            right = pixels[row * (size + 1) + col + 1]
+            value = (value << 1) | (left > right)
+    return value
+
+
+@dataclass(frozen=True)
+class MooseImageKey:
+    user_id: str
+    sha256: str
+    phash: Optional[int] = None
+
+
+@dataclass
+class MooseCacheEntry:
+    key: MooseImageKey
+    file_path: Optional[str]  # 인식 실패(NO_FOOD) 결과면 None
+    food_info: dict
+    expires_at: float
+
+
+class MooseResultCache:
+    """
+    사진 내용 hash -> moose 결과(food_info, 임시 사진 경로) 캐시
+     - 같은 사용자가 같은 사진을 다시 올리면 업로드/YOLO 추론 없이 바로 반환
+     - perceptual=True 면 sha256 이 달라도 dhash 거리가 max_distance 이하인 사진을 같은 사진으로 봄
+     - max_entries 를 넘으면 가장 오래 사용하지 않은 항목부터 제거 (LRU), ttl 초가 지나면 만료
+    """
+
+    def __init__(self, max_entries: int = 1000, ttl: float = 3600, perceptual: bool = False, max_distance: int = 4):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.perceptual = perceptual
+        self.max_distance = max_distance
+        self._entries: OrderedDict[MooseImageKey, MooseCacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = Counter()
+        self.perceptual_hits = Counter()
+        self.misses = Counter()
+        self.evictions = Counter()
+
+    def key(self, user_id: str, data: bytes) -> MooseImageKey:
+        return MooseImageKey(
+            user_id=user_id,
+            sha256=hashlib.sha256(data).hexdigest(),
+            phash=dhash(data) if self.perceptual else None,
+        )
+
+    def get(self, key: MooseImageKey) -> Optional[MooseCacheEntry]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            similar = False
+            if entry is None and key.phash is not None:
+                entry = self._find_similar(key)
+                similar = entry is not None
+            if entry is not None and entry.expires_at <= now:
+                del self._entries[entry.key]
+                entry = None
+            if entry is None:
+                self.misses.inc()
+                return None
+            self._entries.move_to_end(entry.key)
+        self.hits.inc()
+        if similar:
+            self.perceptual_hits.inc()
+        return entry
+
+    def _find_similar(self, key: MooseImageKey) -> Optional[MooseCacheEntry]:
+        for entry in reversed(self._entries.values()):
+            if entry.key.user_id == key.user_id and entry.key.phash is not None \
+                    and bin(entry.key.phash ^ key.phash).count("1") <= self.max_distance:
+                return entry
+        return None
+
+    def put(self, key: MooseImageKey, file_path: Optional[str], food_info: dict):
+        with self._lock:
+            self._entries[key] = MooseCacheEntry(key, file_path, food_info, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions.inc()
+
+    def invalidate_path(self, file_path: str):
+        """임시 사진이 삭제되면 그 사진을 가리키는 결과 제거"""
+        with self._lock:
+            for key in [k for k, e in self._entries.items() if e.file_path == file_path]:
+                del self._entries[key]
+
+    def stats(self) -> dict:
+        hits, misses = self.hits.value, self.misses.value
+        return {
+            "entries": len(self._entries),
+            "hits": hits,
+            "perceptual_hits": self.perceptual_hits.value,
+            "misses": misses,
+            "evictions": self.evictions.value,
+            "hit_rate": hits / (hits + misses) if hits + misses else None,
+        }
@@ -0,0 +1,72 @@
+import asyncio
+import logging
+from typing import List
+
+from app.modules.mealday.infra.yolo_client import YoloClient
+from app.utils.metrics import Counter, WindowedHistogram
+
+logger = logging.getLogger(__name__)
+
+
+class YoloBatcher:
+    """
+    YOLO 추론 요청 micro-batching (YoloClient 와 같은 infer 인터페이스)
+     - 첫 요청 후 window_ms 동안 혹은 max_batch_size 개가 모일 때까지 모아서 한번에 infer_batch 호출
+     - 결과는 사진 순서대로 각 요청에 돌려주고, 실패하면 묶인 요청 모두 같은 예외
+    """
+
+    def __init__(self, client: YoloClient, window_ms: float = 20, max_batch_size: int = 8):
+        self.client = client
+        self.window = window_ms / 1000
+        self.max_batch_size = max_batch_size
+        self._pending: List[tuple[str, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self.batches = Counter()
+        self.batch_size = WindowedHistogram()
+
+    async def infer(self, image_url: str) -> dict:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((image_url, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        while self._pending:
+            batch, self._pending = self._pending[:self.max_batch_size], self._pending[self.max_batch_size:]
+            task = asyncio.get_running_loop().create_task(self._send(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: List[tuple[str, asyncio.Future]]):
+        self.batches.inc()
+        self.batch_size.observe(len(batch))
+        urls = [url for url, _ in batch]
+        try:
+            if len(batch) == 1:
+                results = [await self.client.infer(urls[0])]
+            else:
+                results = await self.client.infer_batch(urls)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():  # 요청이 취소된 경우
+                future.set_result(result)
+
+    async def aclose(self):
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self.client.aclose()
+
+    def stats(self) -> dict:
+        return {"batches": self.batches.value, "batch_size": self.batch_size.summary()}
@@ -0,0 +1,116 @@
+import asyncio
+import logging
+import random
+from typing import List
+
+import httpx
+
+from app.utils.circuit_breaker import CircuitBreaker
+from app.utils.exceptions.error_code import ErrorCode
+from app.utils.exceptions.handlers import raise_error
+
+logger = logging.getLogger(__name__)
+
+
+class YoloClient:
+    """
+    YOLO 추론 서버 클라이언트 (httpx.AsyncClient 커넥션 풀 재사용)
+     - connect/read timeout, 지터를 준 지수 백오프 재시도(max_retries)
+     - 동시 요청 수 제한(max_concurrency)
+     - 연속 실패시 circuit breaker 가 열려 서버가 회복될 때까지 바로 YOLO_FAILED
+    """
+
+    def __init__(
+            self,
+            base_url: str,
+            connect_timeout: float = 3.0,
+            read_timeout: float = 30.0,
+            max_retries: int = 2,
+            backoff: float = 0.3,
+            max_concurrency: int = 8,
+            breaker: CircuitBreaker | None = None,
+    ):
+        self.base_url = base_url
+        self.timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_concurrency = max_concurrency
+        self.breaker = breaker or CircuitBreaker()
+        self._client: httpx.AsyncClient | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=self.max_concurrency,
+                                    max_keepalive_connections=self.max_concurrency),
+                headers={"accept": "application/json"},
+            )
+        return self._client
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def infer(self, image_url: str) -> dict:
+        """
+        image_url 의 사진을 추론, 서버 응답(json) 반환
+        """
+        return await self._post("/yolo/", params={"url": image_url})
+
+    async def infer_batch(self, image_urls: List[str]) -> List[dict]:
+        """
+        여러 사진을 한번에 추론, 사진 순서대로 결과 반환
+         - POST /yolo/batch {"urls": [...]} -> {"results": [...]}
+        """
+        response = await self._post("/yolo/batch", json={"urls": image_urls})
+        results = response.get("results")
+        if not isinstance(results, list) or len(results) != len(image_urls):
+            raise raise_error(ErrorCode.YOLO_FAILED)
+        return results
+
+    async def _post(self, path: str, **kwargs) -> dict:
+        if not self.breaker.allow():
+            raise raise_error(ErrorCode.YOLO_FAILED)
+
+        settled = False  # breaker 에 결과를 기록했는지
+        try:
+            async with self.semaphore:
+                for attempt in range(self.max_retries + 1):
+                    try:
+                        response = await self.client.post(path, **kwargs)
+                    except httpx.HTTPError as e:  # 연결 실패, timeout 등
+                        logger.warning("YOLO 요청 실패 (%d회): %r", attempt + 1, e)
+                    else:
+                        if response.status_code == 201:
+                            result = response.json()
+                            self.breaker.record_success()
+                            settled = True
+                            return result
+                        logger.warning("YOLO 응답 %d (%d회)", response.status_code, attempt + 1)
+                        if response.status_code < 500 and response.status_code != 429:
+                            # 서버는 정상, 요청이 거절된 경우 재시도하지 않음
+                            self.breaker.record_success()
+                            settled = True
+                            raise raise_error(ErrorCode.YOLO_FAILED)
+                    if attempt < self.max_retries:
+                        await asyncio.sleep(self.backoff * (2 ** attempt) * random.uniform(0.5, 1.5))
+            raise raise_error(ErrorCode.YOLO_FAILED)
+        finally:
+            if not settled:
+                # 재시도 소진, 잘못된 응답, 취소(연결 끊김/timeout) 모두 실패로 기록
+                # (half_open 시험 요청이 끝나지 않은 채로 남으면 breaker 가 계속 거절)
+                self.breaker.record_failure()
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def stats(self) -> dict:
+        return self.breaker.stats()
@@ -1,19 +1,118 @@
 from typing import Annotated
 from datetime import date
 from fastapi import APIRouter, Depends, Query, Path, UploadFile, File, Form
+from fastapi.responses import StreamingResponse
 from typing import List, Optional
 from dependency_injector.wiring import inject, Provide
 from starlette import status
 from app.containers import Container
 from app.core.auth import CurrentUser, get_current_user
 from app.modules.mealday.application.mealday_service import MealDayService
+from app.modules.mealday.application.async_mealday_service import AsyncMealDayService
 from app.modules.mealday.interface.schema.mealday_schema import MealdayResponseDate, MealdayResponseFull, \
-    DishFull, UpdateDishBody, UpdateMealDayBody, CreateDishBody, DishImageUrl, DishGroupResponse
+    DishFull, UpdateDishBody, UpdateMealDayBody, CreateDishBody, DishImageUrl, DishGroupResponse, \
+    MooseJobResponse
 from app.utils.responses.response import APIResponse
 
 mealday_router = APIRouter(prefix="/api/v1/meal-days", tags=["MealDay"])
 
 
+######################################## 무스 ########################################
+
+@mealday_router.post("/moose")
+@inject
+async def moose(
+        current_user: Annotated[CurrentUser, Depends(get_current_user)],
+        file: Annotated[UploadFile, File((...), description="사진파일")],
+        async_mealday_service: AsyncMealDayService = Depends(Provide[Container.async_mealday_service])
+):
+    """
+    사진입력시 해당 사진 moose 제공
+     - 입력예시 : 사진파일
+     - 출력 : file_path, food_info, image_url
+     - 기능명세서 :
+    """
+    return await async_mealday_service.moose(current_user.id, file)
+
+
+@mealday_router.post("/moose/uploads/{upload_id}")
+@inject
+async def moose_upload(
+        current_user: Annotated[CurrentUser, Depends(get_current_user)],
+        upload_id: Annotated[str, Path(description="POST /api/v1/uploads (purpose=MOOSE) 로 받은 upload_id")],
+        async_mealday_service: AsyncMealDayService = Depends(Provide[Container.async_mealday_service])
+):
+    """
+    storage 에 직접 올린 사진으로 moose 제공 (api 서버로 사진을 보내지 않음)
+     - 출력 : file_path, food_info, image_url
+    """
+    return await async_mealday_service.recognize_upload(current_user.id, upload_id)
+
+
+@mealday_router.post("/moose/jobs", response_model=MooseJobResponse, status_code=status.HTTP_202_ACCEPTED)
+@inject
+async def create_moose_job(
+        current_user: Annotated[CurrentUser, Depends(get_current_user)],
+        file: Annotated[UploadFile, File((...), description="사진파일")],
+        async_mealday_service: AsyncMealDayService = Depends(Provide[Container.async_mealday_service])
+):
+    """
+    moose 작업 등록 (업로드/인식은 백그라운드에서 수행)
+     - 입력예시 : 사진파일
+     - 출력 : 작업 id, status(PENDING)
+     - 결과는 GET /moose/jobs/{job_id} (polling) 혹은 /moose/jobs/{job_id}/events (SSE) 로 확인
+    """
+    job = await async_mealday_service.submit_moose_job(current_user.id, file)
+    return MooseJobResponse(**job.to_dict())
+
+
+@mealday_router.get("/moose/jobs/{job_id}", response_model=MooseJobResponse)
+@inject
+async def get_moose_job(
+        current_user: Annotated[CurrentUser, Depends(get_current_user)],
+        job_id: Annotated[str, Path(description="moose 작업 id")],
+        async_mealday_service: AsyncMealDayService = Depends(Provide[Container.async_mealday_service])
+):
+    """
+    moose 작업 조회 (polling)
+     - 출력 : status 가 DONE 이면 file_path, food_info, image_url / FAILED 면 error
+    """
+    job = await async_mealday_service.get_moose_job(current_user.id, job_id)
+    return MooseJobResponse(**job.to_dict())
+
+
+@mealday_router.get("/moose/jobs/{job_id}/events")
+@inject
+async def stream_moose_job(
+        current_user: Annotated[CurrentUser, Depends(get_current_user)],
+        job_id: Annotated[str, Path(description="moose 작업 id")],
+        async_mealday_service: AsyncMealDayService = Depends(Provide[Container.async_mealday_service])
+):
+    """
+    moose 작업 상태 스트림 (Server-Sent Events)
+     - 상태가 바뀔 때마다 event: status (data: 작업 json), DONE/FAILED 이면 종료
+    """
+    events = await async_mealday_service.stream_moose_job(current_user.id, job_id)
+    return StreamingResponse(events, media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+@mealday_router.post("/remove-moose")  ##식단게시 취소시 임시파일삭제(임시저장사진명 필요:file_path)
+@inject
+def remove_moose(
+        file_path: Annotated[str, Form(..., description="moose로 얻은 file_path")],
+        mealday_service: MealDayService = Depends(Provide[Container.mealday_service])
+):
+    """
+    moose 확인후 해당 사진 삭제
+     - 입력예시 : file_path (moose api로 얻은 임시 파일경로)
+     - 기능명세서 :
+    """
+    return mealday_service.remove_moose(file_path)
+
+
+######################################## 식단일 ########################################
+
 @mealday_router.post("/date/{daytime}", response_model=MealdayResponseDate)
 @inject
 def create_mealday_by_date(
@@ -43,6 +142,21 @@ def create_mealday_by_track_id(
     return APIResponse(status_code=status.HTTP_200_OK, message=f"{created_count} mealday created")
 
 
+@mealday_router.post("/{track_id}/participants", response_model=APIResponse)
+@inject
+def create_mealday_by_track_participants(
+        track_id: Annotated[str, Path(description="트랙 id (형식: dasfdsafads)")],
+        current_user: Annotated[CurrentUser, Depends(get_current_user)],
+        mealday_service: MealDayService = Depends(Provide[Container.mealday_service])):
+    """
+    트랙 참여자 전원의 트랙 사용기간 MealDay db 일괄생성 (트랙 생성자만)
+     - 이미 있는 날짜는 건너뜀
+     - 입력예시 : track_id = dasfdsf
+    """
+    created_count = mealday_service.create_mealday_by_track_participants(current_user.id, track_id)
+    return APIResponse(status_code=status.HTTP_200_OK, message=f"{created_count} mealday created")
+
+
 @mealday_router.get("/{daytime}", response_model=MealdayResponseFull)
 @inject
 def get_mealday_by_date(
@@ -76,38 +190,6 @@ def update_mealday(
     return APIResponse(status_code=status.HTTP_200_OK, message="MealDay Update Success")
 
 
-######################################## 무스 ########################################
-
-@mealday_router.post("/moose")
-@inject
-async def moose(
-        current_user: Annotated[CurrentUser, Depends(get_current_user)],
-        file: Annotated[UploadFile, File((...), description="사진파일")],
-        mealday_service: MealDayService = Depends(Provide[Container.mealday_service])
-):
-    """
-    사진입력시 해당 사진 moose 제공
-     - 입력예시 : 사진파일
-     - 출력 : file_path, food_info, image_url
-     - 기능명세서 :
-    """
-    return mealday_service.moose(current_user.id, file)
-
-
-@mealday_router.post("/remove-moose")  ##식단게시 취소시 임시파일삭제(임시저장사진명 필요:file_path)
-@inject
-async def remove_moose(
-        file_path: Annotated[str, Form(..., description="moose로 얻은 file_path")],
-        mealday_service: MealDayService = Depends(Provide[Container.mealday_service])
-):
-    """
-    moose 확인후 해당 사진 삭제
-     - 입력예시 : file_path (moose api로 얻은 임시 파일경로)
-     - 기능명세서 :
-    """
-    return mealday_service.remove_moose(file_path)
-
-
 ################################### Dish #########################################
 
 dish_router = APIRouter(prefix="/api/v1/dishes", tags=["Dish"])
@@ -119,13 +201,13 @@ async def register_v1(
         current_user: Annotated[CurrentUser, Depends(get_current_user)],
         daytime: Annotated[str, Path(description="기록일자 (형식: 2024-06-01)")],
         routine_id: Annotated[str, Path(..., description="트랙루틴id")],
-        mealday_service: MealDayService = Depends(Provide[Container.mealday_service])
+        async_mealday_service: AsyncMealDayService = Depends(Provide[Container.async_mealday_service])
 ):
     """
     식단등록 v1(체크 표시로 음식 일괄등록)
      - 입력예시 : daytime = 2024-06-01, routine_id = fdasfewaerwq
     """
-    mealday_service.register_dish_v1(current_user.id, daytime, routine_id)
+    await async_mealday_service.register_dish_v1(current_user.id, daytime, routine_id)
     return APIResponse(status_code=status.HTTP_200_OK, message="Dish Post Success")
 
 
@@ -136,13 +218,30 @@ async def register_v2(
         daytime: Annotated[str, Path(description="기록일자 (형식: 2024-06-01)")],
         routine_food_id: Annotated[str, Path(..., description="루틴푸드id")],
         picture: Annotated[UploadFile, File(..., description="사진1개")],
-        mealday_service: MealDayService = Depends(Provide[Container.mealday_service])
+        async_mealday_service: AsyncMealDayService = Depends(Provide[Container.async_mealday_service])
 ):
     """
     식단등록 v2(계획된 트랙중 이미지가 없는 트랙의 이미지를 등록하기용
      - 입력예시 : daytime = 2024-06-01, routin_food_id = fdasfewaerwq, picture=사진파일1개
     """
-    mealday_service.register_dish_v2(current_user.id, daytime, routine_food_id, picture)
+    await async_mealday_service.register_dish_v2(current_user.id, daytime, routine_food_id, picture)
+    return APIResponse(status_code=status.HTTP_200_OK, message="Dish Post Success")
+
+
+@dish_router.post("/r-v2/{daytime}/{routine_food_id}/uploads/{upload_id}", response_model=APIResponse)
+@inject
+async def register_v2_upload(
+        current_user: Annotated[CurrentUser, Depends(get_current_user)],
+        daytime: Annotated[str, Path(description="기록일자 (형식: 2024-06-01)")],
+        routine_food_id: Annotated[str, Path(..., description="루틴푸드id")],
+        upload_id: Annotated[str, Path(..., description="POST /api/v1/uploads (purpose=DISH) 로 받은 upload_id")],
+        async_mealday_service: AsyncMealDayService = Depends(Provide[Container.async_mealday_service])
+):
+    """
+    식단등록 v2 (사진은 업로드 url 로 storage 에 직접 올린 파일 사용)
+     - 입력예시 : daytime = 2024-06-01, routin_food_id = fdasfewaerwq, upload_id = 01J...
+    """
+    await async_mealday_service.register_dish_v2_upload(current_user.id, daytime, routine_food_id, upload_id)
     return APIResponse(status_code=status.HTTP_200_OK, message="Dish Post Success")
 
 
@@ -152,13 +251,13 @@ async def register_v3(
         current_user: Annotated[CurrentUser, Depends(get_current_user)],
         daytime: Annotated[str, Path(description="기록일자 (형식: 2024-06-01)")],
         routine_food_ids: Annotated[List[str], Form(..., description="루틴푸드id")],
-        mealday_service: MealDayService = Depends(Provide[Container.mealday_service])
+        async_mealday_service: AsyncMealDayService = Depends(Provide[Container.async_mealday_service])
 ):
     """
     식단등록 v3(계획된 트랙중 특정 루틴푸드만 선택
      - 입력예시 : daytime = 2024-06-01, routin_food_ids = [fdasfewaerwq,dfas fdsa f], picture=사진파일1개
     """
-    mealday_service.register_dish_v3(current_user.id, daytime, routine_food_ids)
+    await async_mealday_service.register_dish_v3(current_user.id, daytime, routine_food_ids)
     return APIResponse(status_code=status.HTTP_200_OK, message="Dish Post Success")
 
 
@@ -168,13 +267,13 @@ async def register_v4(
         current_user: Annotated[CurrentUser, Depends(get_current_user)],
         daytime: Annotated[str, Path(description="기록일자 (형식: 2024-06-01)")],
         body: CreateDishBody,
-        mealday_service: MealDayService = Depends(Provide[Container.mealday_service])
+        async_mealday_service: AsyncMealDayService = Depends(Provide[Container.async_mealday_service])
 ):
     """
     식단등록 v4(계획하지 않은 식단 등록
      - 입력예시 : daytime = 2024-06-01, body ={mealtime = 아침, days=3, name= "이름", label = 숫자 or None
     """
-    mealday_service.register_dish_v4(current_user.id, daytime, body)
+    await async_mealday_service.register_dish_v4(current_user.id, daytime, body)
     return APIResponse(status_code=status.HTTP_200_OK, message="Dish Post Success")
 
 
@@ -183,14 +282,14 @@ async def register_v4(
 async def get_dish(
         current_user: Annotated[CurrentUser, Depends(get_current_user)],
         dish_id: Annotated[str, Path(description=" (형식: dasfsdrewarq)")],
-        mealday_service: MealDayService = Depends(Provide[Container.mealday_service])
+        async_mealday_service: AsyncMealDayService = Depends(Provide[Container.async_mealday_service])
 ):
     """
     Dish 조회
      - 입력예시 : dish_id = dasfawerwreqw
 
     """
-    return mealday_service.find_dish(current_user.id, dish_id)
+    return await async_mealday_service.find_dish(current_user.id, dish_id)
 
 
 @dish_router.get("/group/{track_id}", response_model=List[DishGroupResponse])
@@ -198,14 +297,14 @@ async def get_dish(
 async def get_dish_not_routine(
         current_user: Annotated[CurrentUser, Depends(get_current_user)],
         track_id: Annotated[str, Path(description=" (형식: dasfsdrewarq)")],
-        mealday_service: MealDayService = Depends(Provide[Container.mealday_service])
+        async_mealday_service: AsyncMealDayService = Depends(Provide[Container.async_mealday_service])
 ):
     """
     Dish 조회
      - 입력예시 : track_id = dasfawerwreqw
 
     """
-    return mealday_service.get_dish_not_routine(current_user.id, track_id)
+    return await async_mealday_service.get_dish_not_routine(current_user.id, track_id)
 
 
 @dish_router.delete("/{dish_id}", response_model=APIResponse)  ## 등록한 Dish 삭제
@@ -213,12 +312,12 @@ async def get_dish_not_routine(
 async def remove_dish(
         current_user: Annotated[CurrentUser, Depends(get_current_user)],
         dish_id: Annotated[str, Path(description=" (형식: dasfsdrewarq)")],
-        mealday_service: MealDayService = Depends(Provide[Container.mealday_service])
+        async_mealday_service: AsyncMealDayService = Depends(Provide[Container.async_mealday_service])
 ):
     """
     Dish 삭제
     """
-    mealday_service.remove_dish(current_user.id, dish_id)
+    await async_mealday_service.remove_dish(current_user.id, dish_id)
     return APIResponse(status_code=status.HTTP_200_OK, message="Dish Delete Success")
 
 
@@ -251,3 +350,18 @@ def update_dish_image(
     update dish 후 나온 dish_id를 활용하여 image_url을 변경한다
     """
     return mealday_service.update_dish_image(current_user.id, dish_id)
+
+
+@dish_router.patch("/{dish_id}/image-upload/{upload_id}", response_model=DishImageUrl)
+@inject
+def update_dish_image_upload(
+        current_user: Annotated[CurrentUser, Depends(get_current_user)],
+        dish_id: Annotated[str, Path(description=" (형식: dasfsdrewarq)")],
+        upload_id: Annotated[str, Path(description="POST /api/v1/uploads (purpose=DISH) 로 받은 upload_id")],
+        mealday_service: MealDayService = Depends(Provide[Container.mealday_service])
+):
+    """
+    storage 에 직접 올린 사진을 확인 후 dish 사진으로 교체
+     - 출력 : 새 사진의 image_url
+    """
+    return mealday_service.update_dish_image_upload(current_user.id, dish_id, upload_id)
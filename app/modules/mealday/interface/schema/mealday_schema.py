@@ -84,6 +84,8 @@ class DishFull(BaseModel):
     name: Optional[str] = None
     quantity: Optional[int] = None
     image_url: Optional[str] = None
+    image_small_url: Optional[str] = Field(default=None, description="작은 사진 (없으면 image_url 사용)")
+    image_medium_url: Optional[str] = Field(default=None, description="중간 크기 사진 (없으면 image_url 사용)")
     text: Optional[str] = None
     record_datetime: datetime
     update_datetime: datetime
@@ -126,8 +128,21 @@ class DishResponse(BaseModel):
     quantity: int
     calorie: float
     image_url: str | None = None
+    image_small_url: str | None = Field(default=None, description="목록용 작은 사진 (없으면 image_url 사용)")
+    image_medium_url: str | None = None
 class DishGroupResponse(BaseModel):
     record_date: date
     days: int
     total_calorie: float
-    dishes: Optional[List[DishResponse]]
\ No newline at end of file
+    dishes: Optional[List[DishResponse]]
+
+
+class MooseJobResponse(BaseModel):
+    id: str
+    status: str = Field(description="PENDING / RUNNING / DONE / FAILED")
+    file_path: Optional[str] = Field(default=None, description="임시 저장 사진 경로 (DONE)")
+    image_url: Optional[str] = None
+    food_info: Optional[dict] = Field(default=None, description="YOLO 인식 결과 (DONE)")
+    error: Optional[dict] = Field(default=None, description="실패 사유 (FAILED)")
+    created_at: datetime
+    updated_at: datetime
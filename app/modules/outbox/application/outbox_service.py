@@ -0,0 +1,30 @@
+from dependency_injector.wiring import inject
+from ulid import ULID
+
+from app.modules.outbox.domain.outbox import OutboxEvent, OutboxKind
+from app.modules.outbox.domain.repository.outbox_repo import IOutboxRepository
+
+
+class OutboxService:
+    """
+    storage / FCM 작업을 바로 실행하지 않고 outbox 테이블에 기록 (실행은 OutboxWorker)
+     - 도메인 변경과 같은 트랜잭션에 저장되므로 commit 된 변경의 작업만 실행되고, 요청은 INSERT 한번만 기다림
+     - 요청이 실패(rollback)해도 실행해야 하는 정리 작업은 detached=True
+    """
+    @inject
+    def __init__(self, outbox_repo: IOutboxRepository):
+        self.outbox_repo = outbox_repo
+
+    def enqueue(self, kind: OutboxKind, payload: dict, detached: bool = False) -> OutboxEvent:
+        event = OutboxEvent(id=str(ULID()), kind=kind, payload=payload)
+        self.outbox_repo.save_event(event, detached=detached)
+        return event
+
+    def delete_blob(self, path: str, detached: bool = False) -> OutboxEvent:
+        return self.enqueue(OutboxKind.BLOB_DELETE, {"path": path}, detached=detached)
+
+    def copy_blob(self, source: str, destination: str) -> OutboxEvent:
+        return self.enqueue(OutboxKind.BLOB_COPY, {"source": source, "destination": destination})
+
+    def send_fcm(self, token: str, title: str, body: str, data: dict = None) -> OutboxEvent:
+        return self.enqueue(OutboxKind.FCM_SEND, {"token": token, "title": title, "body": body, "data": data})
@@ -0,0 +1,123 @@
+import logging
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable
+
+from app.modules.outbox.domain.outbox import OutboxEvent
+from app.modules.outbox.domain.repository.outbox_repo import IOutboxRepository
+from app.utils.metrics import Counter
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxWorker:
+    """
+    outbox 이벤트를 batch 단위로 가져와서 실행
+     - batch 안의 이벤트는 스레드풀에서 동시에 실행, 성공한 이벤트는 한번에 삭제
+     - 실패하면 지수 backoff(+jitter) 후 재시도, max_attempts 를 넘으면 DEAD
+     - 앱 프로세스 안(start/stop, 백그라운드 스레드) 혹은 별도 프로세스(python -m app.scripts.outbox_worker)로 실행
+    """
+
+    def __init__(
+            self,
+            outbox_repo: IOutboxRepository,
+            handler: Callable[[OutboxEvent], None],
+            batch_size: int = 100,
+            max_workers: int = 8,
+            poll_interval: float = 1.0,
+            lease: float = 60,
+            max_attempts: int = 8,
+            backoff_base: float = 2.0,
+            backoff_max: float = 600,
+    ):
+        self.outbox_repo = outbox_repo
+        self.handler = handler
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.poll_interval = poll_interval
+        self.lease = timedelta(seconds=lease)
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._executor: ThreadPoolExecutor | None = None
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self.processed = Counter()
+        self.failed = Counter()
+        self.dead = Counter()
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="outbox")
+        return self._executor
+
+    def backoff(self, attempts: int) -> float:
+        delay = min(self.backoff_max, self.backoff_base * 2 ** (attempts - 1))
+        return delay * random.uniform(0.5, 1.0)
+
+    def run_once(self) -> int:
+        """batch 하나 처리, 가져온 이벤트 개수 반환"""
+        events = self.outbox_repo.claim_events(limit=self.batch_size, lease_until=datetime.utcnow() + self.lease)
+        if not events:
+            return 0
+
+        def run(event: OutboxEvent):
+            try:
+                self.handler(event)
+                return None
+            except Exception as e:
+                return e
+
+        done = []
+        for event, error in zip(events, self.executor.map(run, events)):
+            if error is None:
+                done.append(event.id)
+                continue
+            self.failed.inc()
+            dead = event.attempts >= self.max_attempts
+            logger.warning("outbox %s %s 실패 (%d회)%s: %s", event.kind.value, event.payload, event.attempts,
+                           " -> DEAD" if dead else "", error)
+            if dead:
+                self.dead.inc()
+            self.outbox_repo.retry_event(
+                event_id=event.id,
+                available_at=datetime.utcnow() + timedelta(seconds=self.backoff(event.attempts)),
+                error=repr(error),
+                dead=dead,
+            )
+        self.outbox_repo.delete_events(done)
+        self.processed.inc(len(done))
+        return len(events)
+
+    def run_forever(self):
+        """stop() 할 때까지 반복, batch 가 가득 차면 쉬지 않고 다음 batch"""
+        while not self._stop.is_set():
+            try:
+                claimed = self.run_once()
+            except Exception as e:
+                logger.warning("outbox 처리 실패: %s", e)
+                claimed = 0
+            if claimed < self.batch_size:
+                self._stop.wait(self.poll_interval)
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run_forever, name="outbox-worker", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def stats(self) -> dict:
+        return {"processed": self.processed.value, "failed": self.failed.value, "dead": self.dead.value}
@@ -0,0 +1,27 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+
+
+class OutboxKind(Enum):
+    BLOB_DELETE = "BLOB_DELETE"  # {"path"}
+    BLOB_COPY = "BLOB_COPY"  # {"source", "destination"}
+    FCM_SEND = "FCM_SEND"  # {"token", "title", "body", "data"}
+
+
+class OutboxStatus(Enum):
+    PENDING = "PENDING"  # 처리 대기 (실패시 available_at 이후 재시도)
+    DEAD = "DEAD"  # 최대 시도 횟수 초과, 확인 필요
+
+
+@dataclass
+class OutboxEvent:
+    id: str
+    kind: OutboxKind
+    payload: dict
+    status: OutboxStatus = field(default=OutboxStatus.PENDING)
+    attempts: int = field(default=0)
+    available_at: datetime = field(default_factory=datetime.utcnow)  # 이 시각 이후 처리 가능
+    last_error: Optional[str] = field(default=None)
+    created_at: datetime = field(default_factory=datetime.utcnow)
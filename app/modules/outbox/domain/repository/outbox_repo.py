@@ -0,0 +1,28 @@
+from abc import ABCMeta, abstractmethod
+from datetime import datetime
+from typing import List
+
+from app.modules.outbox.domain.outbox import OutboxEvent
+
+
+class IOutboxRepository(metaclass=ABCMeta):
+
+    @abstractmethod
+    def save_event(self, event: OutboxEvent, detached: bool = False):
+        raise NotImplementedError
+
+    @abstractmethod
+    def claim_events(self, limit: int, lease_until: datetime) -> List[OutboxEvent]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete_events(self, event_ids: List[str]):
+        raise NotImplementedError
+
+    @abstractmethod
+    def retry_event(self, event_id: str, available_at: datetime, error: str, dead: bool = False):
+        raise NotImplementedError
+
+    @abstractmethod
+    def count_events(self) -> dict:
+        raise NotImplementedError
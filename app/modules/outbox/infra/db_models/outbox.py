@@ -0,0 +1,25 @@
+from datetime import datetime
+
+import ulid
+from sqlalchemy import String, Integer, DateTime, Enum, Text, JSON, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+from app.modules.outbox.domain.outbox import OutboxKind, OutboxStatus
+
+
+class OutboxEvent(Base):
+    __tablename__ = "OutboxEvent"
+
+    id: Mapped[str] = mapped_column(String(length=26), primary_key=True, nullable=False, default=lambda: str(ulid.ULID()))
+    kind: Mapped[OutboxKind] = mapped_column(Enum(OutboxKind), nullable=False)
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+    status: Mapped[OutboxStatus] = mapped_column(Enum(OutboxStatus), nullable=False, default=OutboxStatus.PENDING)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    available_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    last_error: Mapped[str] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index('_outbox_status_available_index', 'status', 'available_at'),  ## worker 가 처리할 이벤트 조회용
+    )
@@ -0,0 +1,45 @@
+import logging
+
+from app.modules.outbox.domain.outbox import OutboxEvent, OutboxKind
+
+logger = logging.getLogger(__name__)
+
+
+class FirebaseOutboxHandler:
+    """
+    outbox 이벤트를 firebase storage / FCM 으로 실행, 실패하면 예외 (worker 가 재시도)
+     - 같은 이벤트가 두번 실행될 수 있으므로(at-least-once) 이미 없는 blob 삭제는 성공으로 처리
+    """
+
+    def __init__(self, bucket=None):
+        self._bucket = bucket
+
+    @property
+    def bucket(self):
+        if self._bucket is not None:
+            return self._bucket
+        from app.core import fcm  # firebase 초기화는 실제로 사용할 때
+        return fcm.bucket
+
+    def __call__(self, event: OutboxEvent):
+        if event.kind == OutboxKind.BLOB_DELETE:
+            self.delete_blob(event.payload["path"])
+        elif event.kind == OutboxKind.BLOB_COPY:
+            self.copy_blob(event.payload["source"], event.payload["destination"])
+        elif event.kind == OutboxKind.FCM_SEND:
+            from app.core import fcm
+            fcm.send_fcm_message(event.payload["token"], event.payload["title"], event.payload["body"],
+                                 event.payload.get("data"))
+        else:
+            raise ValueError(f"unknown outbox kind: {event.kind}")
+
+    def delete_blob(self, path: str):
+        from google.api_core.exceptions import NotFound
+        try:
+            self.bucket.blob(path).delete()
+        except NotFound:
+            logger.info("이미 삭제된 blob %s", path)
+
+    def copy_blob(self, source: str, destination: str):
+        bucket = self.bucket
+        bucket.copy_blob(bucket.blob(source), bucket, destination)
@@ -0,0 +1,87 @@
+from abc import ABC
+from datetime import datetime
+from typing import List
+
+from sqlalchemy import select, update, delete, func
+
+from app.database import session_scope, SessionLocal
+from app.modules.outbox.domain.outbox import OutboxEvent as OutboxEventVO, OutboxStatus
+from app.modules.outbox.domain.repository.outbox_repo import IOutboxRepository
+from app.modules.outbox.infra.db_models.outbox import OutboxEvent
+from app.utils.db_utils import row_to_dict
+
+
+class OutboxRepository(IOutboxRepository, ABC):
+
+    def __init__(self, session_factory=SessionLocal):
+        self.session_factory = session_factory  # detached 저장용 (요청 트랜잭션과 별도)
+
+    def save_event(self, event: OutboxEventVO, detached: bool = False):
+        """
+        detached=False : 현재 요청 트랜잭션에 함께 저장 (도메인 변경과 같이 commit/rollback)
+        detached=True  : 별도 트랜잭션으로 바로 저장 (요청이 실패해도 남아야 하는 정리 작업)
+        """
+        if detached:
+            with self.session_factory() as db:
+                db.add(OutboxEvent(**event.__dict__))
+                db.commit()
+            return
+        with session_scope() as db:
+            db.add(OutboxEvent(**event.__dict__))
+            db.commit()
+
+    def claim_events(self, limit: int, lease_until: datetime) -> List[OutboxEventVO]:
+        """
+        처리할 이벤트를 가져오고 lease_until 까지 다른 worker 가 가져가지 않도록 표시
+         - postgres 는 FOR UPDATE SKIP LOCKED 로 worker 여러개가 겹치지 않음
+         - 처리 도중 worker 가 죽으면 lease 가 끝난 뒤 다시 처리됨 (at-least-once)
+        """
+        with session_scope() as db:
+            now = datetime.utcnow()
+            ids = db.scalars(
+                select(OutboxEvent.id)
+                .where(OutboxEvent.status == OutboxStatus.PENDING, OutboxEvent.available_at <= now)
+                .order_by(OutboxEvent.available_at)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            ).all()
+            if not ids:
+                db.commit()
+                return []
+            db.execute(
+                update(OutboxEvent)
+                .where(OutboxEvent.id.in_(ids))
+                .values(available_at=lease_until, attempts=OutboxEvent.attempts + 1)
+                .execution_options(synchronize_session=False)
+            )
+            events = [OutboxEventVO(**row_to_dict(row))
+                      for row in db.scalars(select(OutboxEvent).where(OutboxEvent.id.in_(ids))
+                                            .execution_options(populate_existing=True))]
+            db.commit()
+            return events
+
+    def delete_events(self, event_ids: List[str]):
+        """처리 완료된 이벤트 삭제"""
+        if not event_ids:
+            return
+        with session_scope() as db:
+            db.execute(delete(OutboxEvent).where(OutboxEvent.id.in_(event_ids))
+                       .execution_options(synchronize_session=False))
+            db.commit()
+
+    def retry_event(self, event_id: str, available_at: datetime, error: str, dead: bool = False):
+        with session_scope() as db:
+            db.execute(
+                update(OutboxEvent)
+                .where(OutboxEvent.id == event_id)
+                .values(available_at=available_at, last_error=error[:1000],
+                        status=OutboxStatus.DEAD if dead else OutboxStatus.PENDING)
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+
+    def count_events(self) -> dict:
+        """상태별 이벤트 개수"""
+        with session_scope() as db:
+            rows = db.execute(select(OutboxEvent.status, func.count()).group_by(OutboxEvent.status)).all()
+            return {status.value: count for status, count in rows}
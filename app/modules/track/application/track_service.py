@@ -11,7 +11,7 @@ from app.modules.track.domain.repository.track_repo import ITrackRepository
 from ulid import ULID
 
 from app.modules.track.domain.track import Track, TrackRoutine, RoutineCheck
-from app.modules.track.domain.track_routine_food import RoutineFood
+from app.modules.track.domain.track_routine_food import RoutineFood, RoutineFoodCheck
 from app.modules.track.interface.schema.track_schema import CreateTrackRoutineBody, UpdateRoutineBody, \
     TrackResponse, UpdateTrackBody, TrackUpdateResponse, TrackStartBody, CreateTrackBody, RoutineFoodRequest, \
     RoutineGroupResponse, RoutineFoodResponse, TrackRoutineResponse, RoutineFoodGroupResponse, MealTime, FlagStatus
@@ -73,24 +73,31 @@ class TrackService:
         user = self.user_service.get_user_by_id(user_id)
         routine_list = []
         routine_food_body = []
-        calories = 0
 
+        used_labels = {body_food.food_label for body_food in body.foods if body_food.food_label is not None}
         for body_food in body.foods:
-            food = self.food_service.get_food_data(food_label=body_food.food_label)
-            if food is None and body_food.food_name is None:
-                raise_error(ErrorCode.NO_FOOD_NO_NAME)
+            food_name = body_food.food_name
+            if not food_name:  # 이름은 카탈로그에서, 칼로리는 아래에서 영양성분 행렬로 한번에
+                food = self.food_service.get_food_data(food_label=body_food.food_label)
+                if food is None:
+                    raise_error(ErrorCode.NO_FOOD_NO_NAME)
+                food_name = food.name
+            food_label = body_food.food_label
+            if food_label is None:
+                food_label = self.resolve_food_label(food_name, used_labels)
 
             routine_food = RoutineFood(
                 id="",
                 routine_id="",
-                food_label=body_food.food_label,
+                food_label=food_label,
                 quantity=body_food.quantity,
-                food_name=body_food.food_name or food.name
+                food_name=food_name
             )
             routine_food_body.append(routine_food)
-            food_calories = 750 if food is None else food.calorie
-            calories += (food_calories * routine_food.quantity)
-            # food_label 이 없으면 750칼로리 자동으로 계산하기 !!!!
+        # food_label 이 없으면 750칼로리 자동으로 계산하기 !!!!
+        calories = self.food_service.get_total_calorie([food.food_label for food in routine_food_body],
+                                                       [food.quantity for food in routine_food_body],
+                                                       default_calorie=750)
 
         for day in body.days.split(","):
             _day = int(day)
@@ -123,9 +130,25 @@ class TrackService:
 
         return sorted_routines
 
+    def resolve_food_label(self, food_name: str | None, used_labels: set) -> int | None:
+        """
+        label 없이 이름만 입력한 음식을 카탈로그 음식 label 로 대응
+         - 같은 루틴에 이미 있는 label(used_labels) 이면 None (루틴-음식 중복 불가), 대응한 label 은 used_labels 에 추가
+        """
+        food = self.food_service.resolve_food(food_name)
+        if food is None or food.label in used_labels:
+            return None
+        used_labels.add(food.label)
+        return food.label
+
     def create_routine_food(self, routine_id: str, body: RoutineFoodRequest, user_id: str):
         routine = self.validate_routine(routine_id, user_id)
         food_label = body.food_label if body.food_label is not None else None
+        if food_label is None:
+            resolved = self.resolve_food_label(body.food_name, set())
+            if resolved is not None and self.track_repo.find_routine_food_by_routine_id_label_name(
+                    routine_id=routine.id, label=resolved, name=None) is None:
+                food_label = resolved
         new_routine_food = RoutineFood(
             id=str(ULID()),
             routine_id=routine.id,
@@ -201,10 +224,11 @@ class TrackService:
     def get_tracks(self, user_id: str):
         return self.track_repo.find_tracks_by_id(user_id)
 
-    def routine_food_check_list(self, user_id: str, routine_foods: List[RoutineFood], routine: TrackRoutine):
+    def routine_food_check_list(self, routine_foods: List[RoutineFood], routine: TrackRoutine,
+                                routine_food_checks: dict[str, RoutineFoodCheck]):
         routine_foods_list = []
         for routine_food in routine_foods:
-            routine_food_check = self.track_repo.find_routine_food_check_by_routine_food_id(routine_food.id, user_id)
+            routine_food_check = routine_food_checks.get(routine_food.id)
             status = False
             if routine_food_check is not None:
                 status = routine_food_check.is_complete
@@ -223,9 +247,12 @@ class TrackService:
 
     def routine_grouping(self, routines: List[TrackRoutine], track: Track, user_id: str):
         days_grouped = [[] for _ in range(track.duration + 1)]
+        # 체크 상태는 트랙 단위로 한번에 조회 (루틴/루틴푸드마다 조회하지 않음)
+        routine_checks = self.track_repo.find_routine_checks_by_track(track.id, user_id)
+        routine_food_checks = self.track_repo.find_routine_food_checks_by_track(track.id, user_id)
 
-        for routine in track.routines:
-            clear_routine = self.track_repo.find_routine_check(routine.id, user_id)
+        for routine in routines:
+            clear_routine = routine_checks.get(routine.id)
             status = False
             if clear_routine is not None:
                 status = clear_routine.is_complete
@@ -241,14 +268,12 @@ class TrackService:
                     days=routine.days,
                     clock=routine.clock,
                     delete=routine.delete,
-                    routine_foods=self.routine_food_check_list(routine.id, routine.routine_foods, clear_routine),
+                    routine_foods=self.routine_food_check_list(routine.routine_foods, routine, routine_food_checks),
                     is_clear=status,
                 )
             )
-        idx = 0
-        for day in days_grouped:
+        for idx, day in enumerate(days_grouped):
             days_grouped[idx] = sorted(day, key=lambda day: mealtime_parse(day.mealtime))
-            idx += 1
 
         return days_grouped
 
@@ -404,3 +429,6 @@ class TrackService:
 
     def get_track_part_all(self, user_id: str):
         return self.track_repo.find_all_participant(user_id=user_id)
+
+    def get_track_participants(self, track_id: str, status: FlagStatus | None = None):
+        return self.track_repo.find_participants_by_track_id(track_id=track_id, status=status)
@@ -7,7 +7,7 @@ from app.modules.track.domain.track_participant import TrackParticipant as Track
 from app.modules.track.domain.track import Track, TrackRoutine, RoutineCheck
 from app.modules.track.domain.track_routine_food import RoutineFood, RoutineFoodCheck
 from app.modules.track.interface.schema.track_schema import UpdateTrackBody
-from app.modules.track.interface.schema.track_schema import MealTime
+from app.modules.track.interface.schema.track_schema import MealTime, FlagStatus
 
 
 class ITrackRepository(metaclass=ABCMeta):
@@ -139,6 +139,18 @@ class ITrackRepository(metaclass=ABCMeta):
     def update_participant(self, track_part_vo: TrackParticipantVO):
         raise NotImplementedError
 
+    @abstractmethod
+    def find_routine_checks_by_track(self, track_id: str, user_id: str) -> dict[str, RoutineCheck]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_routine_food_checks_by_track(self, track_id: str, user_id: str) -> dict[str, RoutineFoodCheck]:
+        raise NotImplementedError
+
     @abstractmethod
     def find_all_participant(self, user_id: str):
         raise NotImplementedError
+
+    @abstractmethod
+    def find_participants_by_track_id(self, track_id: str, status: FlagStatus | None = None):
+        raise NotImplementedError
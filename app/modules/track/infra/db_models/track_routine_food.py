@@ -42,7 +42,7 @@ class RoutineFoodCheck(Base):
         ForeignKey("RoutineFood.id", ondelete="CASCADE"), nullable=False,
     )
     dish_id: Mapped[str] = mapped_column(
-        ForeignKey("Dish.id", ondelete="CASCADE"), nullable=False
+        ForeignKey("Dish.id", ondelete="CASCADE"), nullable=False, index=True
     )
     user_id: Mapped[str] = mapped_column(
         ForeignKey("User.id", ondelete="CASCADE"), nullable=False
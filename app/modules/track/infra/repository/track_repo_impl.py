@@ -8,7 +8,7 @@ from fastapi import HTTPException
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import or_, and_
 
-from app.database import SessionLocal
+from app.database import session_scope
 from app.modules.track.interface.schema.track_schema import MealTime
 from app.modules.track.domain.repository.track_repo import ITrackRepository
 from app.modules.track.domain.track import Track as TrackVO
@@ -29,7 +29,7 @@ from app.utils.exceptions.handlers import raise_error
 class TrackRepository(ITrackRepository, ABC):
 
     def save(self, track_vo: TrackVO):
-        with SessionLocal() as db:
+        with session_scope() as db:
             track_dict = asdict(track_vo)
             track = Track(**track_dict)
             db.add(track)
@@ -37,7 +37,7 @@ class TrackRepository(ITrackRepository, ABC):
             return TrackVO(**row_to_dict(track))
 
     def routines_save(self, routine_list_vo: List[TrackRoutineVO], track_vo: TrackVO):
-        with SessionLocal() as db:
+        with session_scope() as db:
 
             track = db.query(Track).filter(Track.id == track_vo.id).first()
 
@@ -80,7 +80,7 @@ class TrackRepository(ITrackRepository, ABC):
             return routines
 
     def routine_food_save(self, routine_food_vo: RoutineFood, routine_vo: TrackRoutineVO):
-        with SessionLocal() as db:
+        with session_scope() as db:
             routine_food = RoutineFood(
                 id=routine_food_vo.id,
                 routine_id=routine_food_vo.routine_id,
@@ -96,7 +96,7 @@ class TrackRepository(ITrackRepository, ABC):
             return RoutineFood(**row_to_dict(routine_food))
 
     def routine_check_save(self, routine_check_vo: RoutineCheck):
-        with SessionLocal() as db:
+        with session_scope() as db:
             routine_check = RoutineCheck(
                 id=routine_check_vo.id,
                 routine_id=routine_check_vo.routine_id,
@@ -108,7 +108,7 @@ class TrackRepository(ITrackRepository, ABC):
             return RoutineCheckVO(**row_to_dict(routine_check))
 
     def find_by_id(self, track_id: str):
-        with (SessionLocal() as db):
+        with session_scope() as db:
             track = db.query(Track).options(
                 joinedload(Track.routines).joinedload(TrackRoutine.routine_foods)
             ).filter(Track.id == track_id).first()
@@ -118,14 +118,14 @@ class TrackRepository(ITrackRepository, ABC):
             return TrackVO(**row_to_dict(track))
 
     def find_routine_by_id(self, routine_id: str):
-        with SessionLocal() as db:
+        with session_scope() as db:
             routine = db.query(TrackRoutine).filter(TrackRoutine.id == routine_id).first()
             if routine is None:
                 return None
             return TrackRoutineVO(**row_to_dict(routine))
 
     def find_all_routine_by_track_id(self, track_id: str):
-        with SessionLocal() as db:
+        with session_scope() as db:
             routines = db.query(TrackRoutine).filter(TrackRoutine.track_id == track_id).all()
             if routines is None:
                 return None
@@ -136,14 +136,14 @@ class TrackRepository(ITrackRepository, ABC):
             return routine_list
 
     def find_routine_food_by_id(self, routine_food_id: str):
-        with SessionLocal() as db:
+        with session_scope() as db:
             routine_food = db.query(RoutineFood).filter(RoutineFood.id == routine_food_id).first()
             if routine_food is None:
                 return None
             return RoutineFoodVO(**row_to_dict(routine_food))
 
     def find_routine_food_check_by_routine_food_id(self, routine_food_id: str, user_id: str):
-        with SessionLocal() as db:
+        with session_scope() as db:
             routine_food_check = db.query(RoutineFoodCheck).filter(
                 RoutineFoodCheck.routine_food_id == routine_food_id,
                 RoutineFoodCheck.user_id == user_id).first()
@@ -152,7 +152,7 @@ class TrackRepository(ITrackRepository, ABC):
             return RoutineFoodCheckVO(**row_to_dict(routine_food_check))
 
     def update_track(self, track_id: str, user_id: str, body: UpdateTrackBody):
-        with SessionLocal() as db:
+        with session_scope() as db:
             track = db.query(Track
                              ).options(joinedload(Track.routines)
                                        ).filter(Track.id == track_id
@@ -169,7 +169,7 @@ class TrackRepository(ITrackRepository, ABC):
             return TrackVO(**row_to_dict(track))
 
     def update_routine(self, routine_vo: TrackRoutineVO):
-        with SessionLocal() as db:
+        with session_scope() as db:
             routine = db.query(TrackRoutine).filter(TrackRoutine.id == routine_vo.id).first()
             if routine is None:
                 return None
@@ -182,7 +182,7 @@ class TrackRepository(ITrackRepository, ABC):
         return TrackRoutineVO(**row_to_dict(routine))
 
     def update_routine_food(self, routine_id: str, routine_food_vo: RoutineFood, calories: float):
-        with SessionLocal() as db:
+        with session_scope() as db:
             routine = db.query(TrackRoutine).filter(TrackRoutine.id == routine_id).first()
             if routine is None:
                 return None
@@ -196,7 +196,7 @@ class TrackRepository(ITrackRepository, ABC):
             return RoutineFood(**row_to_dict(routine_food))
 
     def delete_track(self, track_id: str, user_id: str):
-        with SessionLocal() as db:
+        with session_scope() as db:
             track = db.query(Track).filter(Track.id == track_id).first()
             if track is None:
                 raise_error(ErrorCode.TRACK_NOT_FOUND)
@@ -205,7 +205,7 @@ class TrackRepository(ITrackRepository, ABC):
             db.commit()
 
     def delete_routine(self, routine_id: str, user_id: str):
-        with SessionLocal() as db:
+        with session_scope() as db:
             routine = db.query(TrackRoutine).filter(TrackRoutine.id == routine_id).first()
             if routine is None:
                 raise_error(ErrorCode.TRACK_ROUTINE_NOT_FOUND)
@@ -217,7 +217,7 @@ class TrackRepository(ITrackRepository, ABC):
             db.commit()
 
     def delete_routine_food(self, routine_id: str, routine_food_id: str, calories: float):
-        with SessionLocal() as db:
+        with session_scope() as db:
             routine = db.query(TrackRoutine).filter(TrackRoutine.id == routine_id).first()
             if routine is None:
                 raise_error(ErrorCode.TRACK_ROUTINE_NOT_FOUND)
@@ -232,7 +232,7 @@ class TrackRepository(ITrackRepository, ABC):
         return self.find_routine_by_id(routine_id)
 
     def find_tracks_by_id(self, user_id: str):
-        with SessionLocal() as db:
+        with session_scope() as db:
             tracks = db.query(Track).filter(Track.user_id == user_id).all()
 
             track_list = []
@@ -241,7 +241,7 @@ class TrackRepository(ITrackRepository, ABC):
         return track_list
 
     def start_track(self, track_participant_vo: TrackParticipantVO):
-        with SessionLocal() as db:
+        with session_scope() as db:
             track_participant = TrackParticipant(
                 id=track_participant_vo.id,
                 track_id=track_participant_vo.track_id,
@@ -254,7 +254,7 @@ class TrackRepository(ITrackRepository, ABC):
             return TrackParticipantVO(**row_to_dict(track_participant))
 
     def terminate_track(self, user_id: str, track_id: str):
-        with SessionLocal() as db:
+        with session_scope() as db:
             track_participant = db.query(TrackParticipant).filter(TrackParticipant.user_id == user_id,
                                                                   TrackParticipant.track_id == track_id).first()
             if track_participant is None:
@@ -264,7 +264,7 @@ class TrackRepository(ITrackRepository, ABC):
             return TrackParticipantVO(**row_to_dict(track_participant))
 
     def update_start_date(self, track_id: str, user_id: str, start_date: datetime.date):
-        with SessionLocal() as db:
+        with session_scope() as db:
             track = db.query(Track).filter(Track.id == track_id).first()
 
             track.start_date = datetime.now().date() + (start_date - datetime.now().date())
@@ -272,7 +272,7 @@ class TrackRepository(ITrackRepository, ABC):
             db.commit()
 
     def find_track_part_by_user_track_id(self, user_id: str, track_id: str):
-        with SessionLocal() as db:
+        with session_scope() as db:
             track_part = db.query(TrackParticipant).filter(TrackParticipant.user_id == user_id,
                                                            TrackParticipant.track_id == track_id).first()
             if track_part is None:
@@ -280,16 +280,52 @@ class TrackRepository(ITrackRepository, ABC):
         return TrackParticipantVO(**row_to_dict(track_part))
 
     def find_routine_check(self, routine_id: str, user_id: str):
-        with SessionLocal() as db:
-            clear_routine = db.query(RoutineCheck).filter(RoutineCheck.routine_id == routine_id and
+        with session_scope() as db:
+            clear_routine = db.query(RoutineCheck).filter(RoutineCheck.routine_id == routine_id,
                                                           RoutineCheck.user_id == user_id
                                                           ).first()
             if clear_routine is None:
                 return None
             return RoutineCheckVO(**row_to_dict(clear_routine))
 
+    def find_routine_checks_by_track(self, track_id: str, user_id: str) -> dict[str, RoutineCheckVO]:
+        """
+        트랙의 모든 루틴에 대한 user 의 RoutineCheck 를 한번에 조회, routine_id 로 색인
+        """
+        with session_scope() as db:
+            routine_checks = (
+                db.query(RoutineCheck)
+                .join(TrackRoutine, TrackRoutine.id == RoutineCheck.routine_id)
+                .filter(TrackRoutine.track_id == track_id, RoutineCheck.user_id == user_id)
+                .all()
+            )
+            indexed = {}
+            for routine_check in routine_checks:
+                indexed.setdefault(routine_check.routine_id, RoutineCheckVO(**row_to_dict(routine_check)))
+            return indexed
+
+    def find_routine_food_checks_by_track(self, track_id: str, user_id: str) -> dict[str, RoutineFoodCheckVO]:
+        """
+        트랙의 모든 루틴푸드에 대한 user 의 RoutineFoodCheck 를 한번에 조회, routine_food_id 로 색인
+         - 한 루틴푸드에 여러 dish 가 체크된 경우 완료된 것을 우선
+        """
+        with session_scope() as db:
+            routine_food_checks = (
+                db.query(RoutineFoodCheck)
+                .join(RoutineFood, RoutineFood.id == RoutineFoodCheck.routine_food_id)
+                .join(TrackRoutine, TrackRoutine.id == RoutineFood.routine_id)
+                .filter(TrackRoutine.track_id == track_id, RoutineFoodCheck.user_id == user_id)
+                .all()
+            )
+            indexed = {}
+            for routine_food_check in routine_food_checks:
+                current = indexed.get(routine_food_check.routine_food_id)
+                if current is None or (routine_food_check.is_complete and not current.is_complete):
+                    indexed[routine_food_check.routine_food_id] = RoutineFoodCheckVO(**row_to_dict(routine_food_check))
+            return indexed
+
     def find_routine_food_all_by_routine_id(self, routine_id: str):
-        with SessionLocal() as db:
+        with session_scope() as db:
             track_routine_foods = (
                 db.query(TrackRoutine)
                 .options(
@@ -303,7 +339,7 @@ class TrackRepository(ITrackRepository, ABC):
             return track_routine_foods
 
     def create_routine_food_check(self, routine_food_id: str, dish_id: str, user_id: str):
-        with SessionLocal() as db:
+        with session_scope() as db:
             new_routine_food_check = RoutineFoodCheck(
                 id=str(ulid.ULID()),
                 routine_food_id=routine_food_id,
@@ -316,12 +352,12 @@ class TrackRepository(ITrackRepository, ABC):
             db.commit()
 
     def delete_routine_food_check(self, routine_food_check: RoutineFoodCheck):
-        with SessionLocal() as db:
+        with session_scope() as db:
             db.delete(routine_food_check)
             db.commit()
 
     def update_routine_check(self, user_id: str, routine_id: str, status: bool):
-        with SessionLocal() as db:
+        with session_scope() as db:
             routine_check=db.query(RoutineCheck).filter(RoutineCheck.user_id==user_id,RoutineCheck.routine_id==routine_id).first()
             if routine_check is None:
                 return None
@@ -332,7 +368,7 @@ class TrackRepository(ITrackRepository, ABC):
             return RoutineCheckVO(**row_to_dict(routine_check))
 
     def find_routine_food_with_food_by_id(self, routine_food_id: str):
-        with SessionLocal() as db:
+        with session_scope() as db:
             routine_food = db.query(RoutineFood).options(
                     joinedload(RoutineFood.food)
                 ).filter(RoutineFood.id == routine_food_id).first()
@@ -341,7 +377,7 @@ class TrackRepository(ITrackRepository, ABC):
             return RoutineFoodVO(**row_to_dict(routine_food))
 
     def find_routine_food_check_by_else(self, routine_food_id: str, dish_id: str,user_id: str):
-        with SessionLocal() as db:
+        with session_scope() as db:
             routine_food_check = db.query(RoutineFoodCheck).filter(RoutineFoodCheck.routine_food_id==routine_food_id,
                                                                    RoutineFoodCheck.dish_id==dish_id,
                                                                    RoutineFoodCheck.user_id==user_id).first()
@@ -350,14 +386,14 @@ class TrackRepository(ITrackRepository, ABC):
             return RoutineFoodCheckVO(**row_to_dict(routine_food_check))
 
     def find_routine_food_check_by_dish_id(self, dish_id: str, user_id: str):
-        with SessionLocal() as db:
+        with session_scope() as db:
             return db.query(RoutineFoodCheck).filter(
                     RoutineFoodCheck.dish_id == dish_id,
                     RoutineFoodCheck.user_id == user_id
                 ).first()
 
     def find_routine_by_days_mealtime(self, track_id: str, days: int, mealtime: MealTime):
-        with SessionLocal() as db:
+        with session_scope() as db:
             return db.query(TrackRoutine).filter(
                 TrackRoutine.track_id==track_id,
                 TrackRoutine.days==days,
@@ -365,7 +401,7 @@ class TrackRepository(ITrackRepository, ABC):
             ).first()
 
     def find_routine_food_by_routine_id_label_name(self, routine_id: str, label: int | None, name: str | None):
-        with SessionLocal() as db:
+        with session_scope() as db:
             query = db.query(RoutineFood).filter(RoutineFood.routine_id == routine_id)
             if label is not None:
                 query = query.filter(RoutineFood.food_label == label)
@@ -379,7 +415,7 @@ class TrackRepository(ITrackRepository, ABC):
             return query.first()
 
     def find_participate_track(self, user_id: str):
-        with SessionLocal() as db:
+        with session_scope() as db:
             track_part = db.query(TrackParticipant).filter(TrackParticipant.user_id == user_id,
                                                            TrackParticipant.status != FlagStatus.TERMINATED.value).first()
             if track_part is None:
@@ -387,7 +423,7 @@ class TrackRepository(ITrackRepository, ABC):
             return TrackParticipantVO(**row_to_dict(track_part))
 
     def update_participant(self, track_part_vo: TrackParticipantVO):
-        with SessionLocal() as db:
+        with session_scope() as db:
             track_part = db.query(TrackParticipant).filter(TrackParticipant.id == track_part_vo.id).first()
             if track_part is None:
                 return None
@@ -397,10 +433,17 @@ class TrackRepository(ITrackRepository, ABC):
             return TrackParticipantVO(**row_to_dict(track_part))
 
     def find_all_participant(self, user_id: str):
-        with SessionLocal() as db:
+        with session_scope() as db:
             track_part_list = db.query(TrackParticipant).filter(TrackParticipant.user_id == user_id).all()
             res = []
             for track_part_vo in track_part_list:
                 res.append(TrackParticipantVO(**row_to_dict(track_part_vo)))
 
-            return res
\ No newline at end of file
+            return res
+
+    def find_participants_by_track_id(self, track_id: str, status: FlagStatus | None = None):
+        with session_scope() as db:
+            query = db.query(TrackParticipant).filter(TrackParticipant.track_id == track_id)
+            if status is not None:
+                query = query.filter(TrackParticipant.status == status)
+            return [TrackParticipantVO(**row_to_dict(track_part)) for track_part in query.all()]
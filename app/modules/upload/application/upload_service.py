@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta
+
+from dependency_injector.wiring import inject
+from ulid import ULID
+
+from app.modules.outbox.application.outbox_service import OutboxService
+from app.modules.upload.domain.repository.upload_repo import IUploadRepository
+from app.modules.upload.domain.upload import PendingUpload, UploadPurpose, UploadStatus
+from app.utils.exceptions.error_code import ErrorCode
+from app.utils.exceptions.handlers import raise_error
+
+ALLOWED_CONTENT_TYPES = ("image/jpeg", "image/png", "image/webp", "image/heic")
+PATH_PREFIX = {UploadPurpose.DISH: "meal", UploadPurpose.MOOSE: "temp"}
+
+
+class UploadService:
+    """
+    클라이언트가 storage 에 직접 올리는 업로드 (api 서버는 사진 본문을 받지 않음)
+     1) create_upload : 서명된 PUT url 발급 (content-type, 최대 크기 고정)
+     2) 클라이언트가 url 로 업로드
+     3) finalize_upload : 파일이 올라왔는지, 크기/형식이 맞는지 확인 후 확정
+    """
+    @inject
+    def __init__(
+            self,
+            upload_repo: IUploadRepository,
+            outbox_service: OutboxService,
+            expiration: timedelta = timedelta(minutes=15),
+            max_bytes: int = 10 * 1024 * 1024,
+            finalize_grace: timedelta = timedelta(hours=1),
+            bucket=None,
+    ):
+        self.upload_repo = upload_repo
+        self.outbox_service = outbox_service
+        self.expiration = expiration
+        self.max_bytes = max_bytes
+        self.finalize_grace = finalize_grace  # 이 시간이 지나면 image GC 가 사진을 지울 수 있으므로 확정 불가
+        self._bucket = bucket
+
+    @property
+    def bucket(self):
+        if self._bucket is not None:
+            return self._bucket
+        from app.core import fcm  # firebase 초기화는 실제로 사용할 때
+        return fcm.bucket
+
+    def create_upload(self, user_id: str, purpose: UploadPurpose, content_type: str) -> tuple[PendingUpload, str, dict]:
+        """업로드 정보, 업로드 url, 업로드시 함께 보내야 하는 헤더 반환"""
+        if content_type not in ALLOWED_CONTENT_TYPES:
+            raise raise_error(ErrorCode.UPLOAD_INVALID_TYPE)
+        upload_id = str(ULID())
+        upload = PendingUpload(
+            id=upload_id,
+            user_id=user_id,
+            purpose=purpose,
+            file_path=f"{PATH_PREFIX[purpose]}/{user_id}_{upload_id}",
+            content_type=content_type,
+            expires_at=datetime.utcnow() + self.expiration,
+        )
+        headers = {
+            "Content-Type": content_type,
+            "x-goog-content-length-range": f"0,{self.max_bytes}",  # 크기 제한은 storage 에서 검사
+        }
+        url = self.bucket.blob(upload.file_path).generate_signed_url(
+            version="v4",
+            expiration=self.expiration,
+            method="PUT",
+            content_type=content_type,
+            headers={"x-goog-content-length-range": headers["x-goog-content-length-range"]},
+        )
+        self.upload_repo.save_upload(upload)
+        return upload, url, headers
+
+    def finalize_upload(self, user_id: str, upload_id: str, purpose: UploadPurpose) -> PendingUpload:
+        """
+        업로드된 파일 검증 후 확정, 검증에 실패한 파일은 삭제
+        """
+        upload = self.upload_repo.find_upload(user_id=user_id, upload_id=upload_id)
+        if upload is None or upload.purpose != purpose or upload.status != UploadStatus.PENDING:
+            raise raise_error(ErrorCode.UPLOAD_NOT_FOUND)
+        if upload.expires_at + self.finalize_grace < datetime.utcnow():
+            raise raise_error(ErrorCode.UPLOAD_EXPIRED)
+
+        blob = self.bucket.get_blob(upload.file_path)
+        if blob is None:
+            raise raise_error(ErrorCode.UPLOAD_NOT_COMPLETED)
+        if not blob.size or blob.size > self.max_bytes or blob.content_type != upload.content_type:
+            self.outbox_service.delete_blob(upload.file_path, detached=True)  # 요청은 rollback 되므로 별도 저장
+            raise raise_error(ErrorCode.UPLOAD_INVALID)
+
+        if not self.upload_repo.mark_finalized(upload_id=upload.id, size=blob.size):
+            raise raise_error(ErrorCode.UPLOAD_NOT_FOUND)  # 동시에 다른 요청이 확정
+        upload.status = UploadStatus.FINALIZED
+        upload.size = blob.size
+        return upload
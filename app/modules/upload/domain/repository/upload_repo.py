@@ -0,0 +1,24 @@
+from abc import ABCMeta, abstractmethod
+from datetime import datetime
+from typing import Optional, List
+
+from app.modules.upload.domain.upload import PendingUpload
+
+
+class IUploadRepository(metaclass=ABCMeta):
+
+    @abstractmethod
+    def save_upload(self, upload: PendingUpload):
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_upload(self, user_id: str, upload_id: str) -> Optional[PendingUpload]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def mark_finalized(self, upload_id: str, size: int) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_pending_paths(self, paths: List[str], expires_after: datetime) -> set[str]:
+        raise NotImplementedError
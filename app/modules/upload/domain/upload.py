@@ -0,0 +1,28 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+
+
+class UploadPurpose(Enum):
+    DISH = "DISH"  # dish 사진 (meal/)
+    MOOSE = "MOOSE"  # 음식인식용 임시 사진 (temp/)
+
+
+class UploadStatus(Enum):
+    PENDING = "PENDING"  # 업로드 url 발급, 클라이언트 업로드 대기
+    FINALIZED = "FINALIZED"  # 검증 후 dish/moose 에 사용됨
+
+
+@dataclass
+class PendingUpload:
+    id: str
+    user_id: str
+    purpose: UploadPurpose
+    file_path: str
+    content_type: str
+    expires_at: datetime  # 이 시각 이후 업로드 url 사용 불가
+    status: UploadStatus = field(default=UploadStatus.PENDING)
+    size: Optional[int] = field(default=None)  # 확정시 저장된 파일 크기(byte)
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    finalized_at: Optional[datetime] = field(default=None)
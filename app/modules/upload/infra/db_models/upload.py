@@ -0,0 +1,27 @@
+from datetime import datetime
+
+import ulid
+from sqlalchemy import String, Integer, DateTime, Enum, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+from app.modules.upload.domain.upload import UploadPurpose, UploadStatus
+
+
+class PendingUpload(Base):
+    __tablename__ = "PendingUpload"
+
+    id: Mapped[str] = mapped_column(String(length=26), primary_key=True, nullable=False, default=lambda: str(ulid.ULID()))
+    user_id: Mapped[str] = mapped_column(String(length=26), ForeignKey("User.id"), nullable=False)
+    purpose: Mapped[UploadPurpose] = mapped_column(Enum(UploadPurpose), nullable=False)
+    file_path: Mapped[str] = mapped_column(String(length=255), nullable=False, unique=True)  # storage 경로
+    content_type: Mapped[str] = mapped_column(String(length=50), nullable=False)
+    status: Mapped[UploadStatus] = mapped_column(Enum(UploadStatus), nullable=False, default=UploadStatus.PENDING)
+    size: Mapped[int] = mapped_column(Integer, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    finalized_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index('_upload_status_created_index', 'status', 'created_at'),  ## 방치된 업로드 정리용
+    )
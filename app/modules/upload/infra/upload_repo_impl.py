@@ -0,0 +1,48 @@
+from abc import ABC
+from datetime import datetime
+from typing import Optional, List
+
+from sqlalchemy import update, select
+
+from app.database import session_scope
+from app.modules.upload.domain.repository.upload_repo import IUploadRepository
+from app.modules.upload.domain.upload import PendingUpload as PendingUploadVO, UploadStatus
+from app.modules.upload.infra.db_models.upload import PendingUpload
+from app.utils.db_utils import row_to_dict
+
+
+class UploadRepository(IUploadRepository, ABC):
+
+    def save_upload(self, upload: PendingUploadVO):
+        with session_scope() as db:
+            db.add(PendingUpload(**upload.__dict__))
+            db.commit()
+
+    def find_upload(self, user_id: str, upload_id: str) -> Optional[PendingUploadVO]:
+        with session_scope() as db:
+            upload = db.query(PendingUpload).filter(PendingUpload.id == upload_id,
+                                                    PendingUpload.user_id == user_id).first()
+            if upload is None:
+                return None
+            return PendingUploadVO(**row_to_dict(upload))
+
+    def mark_finalized(self, upload_id: str, size: int) -> bool:
+        """PENDING 인 업로드만 확정 (동시에 두번 확정되지 않도록 조건부 UPDATE)"""
+        with session_scope() as db:
+            result = db.execute(
+                update(PendingUpload)
+                .where(PendingUpload.id == upload_id, PendingUpload.status == UploadStatus.PENDING)
+                .values(status=UploadStatus.FINALIZED, size=size, finalized_at=datetime.utcnow())
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+            return result.rowcount == 1
+
+    def find_pending_paths(self, paths: List[str], expires_after: datetime) -> set[str]:
+        """paths 중 아직 업로드 대기중인 경로 (orphan 사진 정리에서 제외), expires_after 이전에 만료된 업로드는 버려진 것으로 보고 제외"""
+        if not paths:
+            return set()
+        with session_scope() as db:
+            return set(db.scalars(select(PendingUpload.file_path).where(
+                PendingUpload.file_path.in_(paths), PendingUpload.status == UploadStatus.PENDING,
+                PendingUpload.expires_at > expires_after)))
@@ -0,0 +1,31 @@
+from typing import Annotated
+
+from dependency_injector.wiring import inject, Provide
+from fastapi import APIRouter, Depends
+from starlette import status
+
+from app.containers import Container
+from app.core.auth import CurrentUser, get_current_user
+from app.modules.upload.application.upload_service import UploadService
+from app.modules.upload.interface.schema.upload_schema import CreateUploadBody, UploadTicket
+
+router = APIRouter(prefix="/api/v1/uploads", tags=["Upload"])
+
+
+@router.post("", response_model=UploadTicket, status_code=status.HTTP_201_CREATED)
+@inject
+def create_upload(
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    body: CreateUploadBody,
+    upload_service: UploadService = Depends(Provide[Container.upload_service]),
+):
+    """
+    사진 직접 업로드 url 발급
+     - 입력예시 : purpose = DISH, content_type = image/jpeg
+     - 출력 : upload_url 로 headers 를 포함해서 파일을 PUT 한 뒤 upload_id 로 확정
+       (DISH: PATCH /api/v1/dishes/{dish_id}/image-upload/{upload_id}, POST /api/v1/dishes/r-v2/{daytime}/{routine_food_id}/uploads/{upload_id}
+        MOOSE: POST /api/v1/meal-days/moose/uploads/{upload_id})
+    """
+    upload, url, headers = upload_service.create_upload(current_user.id, body.purpose, body.content_type)
+    return UploadTicket(upload_id=upload.id, file_path=upload.file_path, upload_url=url, headers=headers,
+                        expires_at=upload.expires_at)
@@ -0,0 +1,20 @@
+from datetime import datetime
+from typing import Dict
+
+from pydantic import BaseModel, Field
+
+from app.modules.upload.domain.upload import UploadPurpose
+
+
+class CreateUploadBody(BaseModel):
+    purpose: UploadPurpose = Field(description="DISH: dish 사진, MOOSE: 음식인식용 사진")
+    content_type: str = Field(default="image/jpeg", description="업로드할 파일 형식 (image/jpeg, image/png, image/webp, image/heic)")
+
+
+class UploadTicket(BaseModel):
+    upload_id: str
+    file_path: str
+    upload_url: str = Field(description="이 url 로 파일 본문을 PUT")
+    method: str = "PUT"
+    headers: Dict[str, str] = Field(description="업로드 요청에 그대로 포함해야 하는 헤더")
+    expires_at: datetime
@@ -0,0 +1,111 @@
+"""
+meal/ 아래 중복 dish 사진 정리 (ImageRef 마이그레이션 이후 한번 실행)
+
+이전에는 dish 를 등록할 때마다 음식 카탈로그 사진을 meal/ 로 복사했기 때문에 같은 내용의 사진이 많다.
+storage 의 md5 로 meal/ 사진을 묶어서
+ - 카탈로그 사진과 같으면 dish 가 카탈로그 사진을 참조하도록 바꾸고 (pinned)
+ - 아니면 묶음에서 하나만 남기고 dish 참조를 그쪽으로 옮긴 뒤
+나머지 사진은 삭제한다. ImageRef 의 참조 수와 content_hash 도 다시 계산한다.
+
+실행 예시
+    python -m app.scripts.dedupe_meal_images --dry-run
+    python -m app.scripts.dedupe_meal_images --batch 100
+"""
+import argparse
+import logging
+from collections import defaultdict
+
+from sqlalchemy import select, update, delete, func
+
+from app.app_config import get_settings
+from app.core.blob_deleter import BlobDeleter
+from app.core.image_processor import base_image_path
+from app.database import SessionLocal
+from app.modules.food.infra.db_models.food import Food
+from app.modules.mealday.infra.db_models.mealday import Dish, ImageRef
+
+logger = logging.getLogger(__name__)
+
+
+def load_catalog(db, bucket) -> dict[str, str]:
+    """md5 -> 카탈로그 사진 경로"""
+    catalog = {}
+    for path in db.scalars(select(Food.image_url).where(Food.image_url.is_not(None)).distinct()):
+        blob = bucket.get_blob(path)
+        if blob is not None and blob.md5_hash:
+            catalog.setdefault(blob.md5_hash, path)
+    return catalog
+
+
+def group_meal_blobs(bucket, prefix: str = "meal/") -> tuple[dict[str, list], int]:
+    """md5 -> [(경로, 크기)], 전체 개수"""
+    groups, total = defaultdict(list), 0
+    for blob in bucket.list_blobs(prefix=prefix):
+        total += 1
+        if blob.md5_hash and base_image_path(blob.name) == blob.name:  # 작은/중간 크기 사진은 제외
+            groups[blob.md5_hash].append((blob.name, blob.size or 0))
+    return groups, total
+
+
+def dedupe_group(db, md5: str, blobs: list, catalog_path: str | None) -> tuple[str, list[str], int]:
+    """dish 참조를 대표 사진으로 옮기고 ImageRef 재계산, (대표 경로, 삭제할 경로, 옮긴 dish 수) 반환"""
+    paths = sorted(path for path, _ in blobs)
+    canonical = catalog_path or paths[0]
+    duplicates = [path for path in paths if path != canonical]
+    moved = 0
+    if duplicates:
+        moved = db.execute(update(Dish).where(Dish.image_url.in_(duplicates)).values(image_url=canonical)
+                           .execution_options(synchronize_session=False)).rowcount
+        db.execute(delete(ImageRef).where(ImageRef.path.in_(duplicates)).execution_options(synchronize_session=False))
+    ref_count = db.scalar(select(func.count()).select_from(Dish).where(Dish.image_url == canonical))
+    ref = db.get(ImageRef, canonical) or ImageRef(path=canonical)
+    ref.ref_count = ref_count
+    ref.pinned = ref.pinned or catalog_path is not None
+    ref.content_hash = md5
+    db.merge(ref)
+    return canonical, duplicates, moved
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dry-run", action="store_true", help="삭제/수정 없이 결과만 출력")
+    parser.add_argument("--batch", type=int, default=100, help="commit 단위 (md5 묶음 개수)")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    from app.core.fcm import bucket
+    deleter = BlobDeleter(max_workers=get_settings().BLOB_DELETE_WORKERS, bucket=bucket)
+
+    with SessionLocal() as db:
+        catalog = load_catalog(db, bucket)
+        groups, total = group_meal_blobs(bucket)
+        logger.info("meal/ 사진 %d개, 서로 다른 내용 %d개, 카탈로그 사진 %d개", total, len(groups), len(catalog))
+
+        deleted, reclaimed, moved, pending = 0, 0, 0, []
+        for i, (md5, blobs) in enumerate(groups.items(), start=1):
+            catalog_path = catalog.get(md5)
+            if len(blobs) == 1 and catalog_path is None:
+                continue  # 중복 아님
+            if args.dry_run:
+                deleted += len(blobs) - (0 if catalog_path else 1)
+                reclaimed += sum(size for _, size in blobs) - (0 if catalog_path else blobs[0][1])
+                continue
+            canonical, duplicates, count = dedupe_group(db, md5, blobs, catalog_path)
+            moved += count
+            pending.extend(duplicates)
+            reclaimed += sum(size for path, size in blobs if path in duplicates)
+            if i % args.batch == 0:
+                db.commit()  # dish 참조를 먼저 옮긴 뒤 사진 삭제
+                deleter.delete_many(pending)
+                deleted, pending = deleted + len(pending), []
+        if not args.dry_run:
+            db.commit()
+            deleter.delete_many(pending)
+            deleted += len(pending)
+
+    logger.info("%s삭제 %d개, 확보 %.1fMB, dish 참조 변경 %d개", "(dry-run) " if args.dry_run else "",
+                deleted, reclaimed / 1024 / 1024, moved)
+
+
+if __name__ == "__main__":
+    main()
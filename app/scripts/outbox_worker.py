@@ -0,0 +1,27 @@
+"""
+outbox worker 를 별도 프로세스로 실행 (이 경우 앱은 OUTBOX_WORKER_ENABLED=false)
+
+실행 예시
+    python -m app.scripts.outbox_worker
+"""
+import logging
+import signal
+import threading
+
+from app.containers import Container
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    worker = Container().outbox_worker()
+    stopped = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stopped.set())
+    signal.signal(signal.SIGINT, lambda *_: stopped.set())
+    worker.start()
+    stopped.wait()
+    worker.stop()  # 처리중인 batch 가 끝날 때까지 대기
+    logging.getLogger(__name__).info("outbox worker 종료 %s", worker.stats())
+
+
+if __name__ == "__main__":
+    main()
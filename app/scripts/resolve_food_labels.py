@@ -0,0 +1,105 @@
+"""
+이름만 입력된 루틴 음식(RoutineFood.food_name), dish(Dish.name) 를 카탈로그 음식 label 로 대응
+
+label 이 없는 행의 이름을 종류별로 한번씩 FoodSearchIndex.match 로 카탈로그 전체와 비교해서
+threshold 이상 비슷한 음식이 있으면 label 을 채운다.
+ - 루틴에 같은 label 의 음식이 이미 있으면 (uq_routine_food_pair) 그 루틴 음식은 그대로 둠
+ - dish 는 label 만 채우고 기록된 영양성분은 바꾸지 않음
+
+실행 예시
+    python -m app.scripts.resolve_food_labels --dry-run
+    python -m app.scripts.resolve_food_labels --threshold 0.9
+"""
+import argparse
+import logging
+from collections import defaultdict
+
+from sqlalchemy import select, update, func
+
+import app.database_model  # noqa: F401  (relationship 이 참조하는 모델 등록)
+from app.app_config import get_settings
+from app.database import SessionLocal
+from app.modules.food.domain.food import Food as FoodVO
+from app.modules.food.infra.db_models.food import Food
+from app.modules.food.infra.food_catalog import FoodCatalogSnapshot
+from app.modules.food.infra.food_search_index import FoodSearchIndex
+from app.modules.mealday.infra.db_models.mealday import Dish
+from app.modules.track.infra.db_models.track_routine_food import RoutineFood
+from app.utils.db_utils import row_to_dict
+
+logger = logging.getLogger(__name__)
+
+
+def load_index(db) -> FoodSearchIndex:
+    foods = tuple(FoodVO(**row_to_dict(food)) for food in db.scalars(select(Food)))
+    index = FoodSearchIndex()
+    index.on_catalog_reload(FoodCatalogSnapshot(foods=foods), None)
+    return index
+
+
+def resolve_names(index: FoodSearchIndex, names, threshold: float) -> dict[str, int]:
+    """이름 -> label (threshold 이상 비슷한 음식이 있는 이름만)"""
+    resolved = {}
+    for name in names:
+        matches = index.match(name, k=1, threshold=threshold)
+        if matches:
+            resolved[name] = matches[0][0].label
+    return resolved
+
+
+def resolve_routine_foods(db, index: FoodSearchIndex, threshold: float, dry_run: bool) -> int:
+    rows = db.execute(select(RoutineFood.id, RoutineFood.routine_id, RoutineFood.food_name)
+                      .where(RoutineFood.food_label.is_(None))).all()
+    resolved = resolve_names(index, {row.food_name for row in rows}, threshold)
+    used = defaultdict(set)  # 루틴별 이미 있는 label
+    routine_ids = {row.routine_id for row in rows if row.food_name in resolved}
+    for routine_id, label in db.execute(select(RoutineFood.routine_id, RoutineFood.food_label)
+                                        .where(RoutineFood.routine_id.in_(routine_ids),
+                                               RoutineFood.food_label.is_not(None))):
+        used[routine_id].add(label)
+
+    count = 0
+    for row in rows:
+        label = resolved.get(row.food_name)
+        if label is None or label in used[row.routine_id]:
+            continue
+        used[row.routine_id].add(label)
+        count += 1
+        if not dry_run:
+            db.execute(update(RoutineFood).where(RoutineFood.id == row.id).values(food_label=label)
+                       .execution_options(synchronize_session=False))
+    return count
+
+
+def resolve_dishes(db, index: FoodSearchIndex, threshold: float, dry_run: bool) -> int:
+    names = db.scalars(select(Dish.name).where(Dish.label.is_(None)).distinct()).all()
+    count = 0
+    for name, label in resolve_names(index, names, threshold).items():
+        where = (Dish.label.is_(None), Dish.name == name)
+        if dry_run:
+            count += db.scalar(select(func.count()).select_from(Dish).where(*where))
+        else:
+            count += db.execute(update(Dish).where(*where).values(label=label)
+                                .execution_options(synchronize_session=False)).rowcount
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dry-run", action="store_true", help="수정 없이 결과만 출력")
+    parser.add_argument("--threshold", type=float, default=get_settings().FOOD_MATCH_THRESHOLD, help="최소 유사도")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    with SessionLocal() as db:
+        index = load_index(db)
+        routine_foods = resolve_routine_foods(db, index, args.threshold, args.dry_run)
+        dishes = resolve_dishes(db, index, args.threshold, args.dry_run)
+        if not args.dry_run:
+            db.commit()
+
+    logger.info("%s루틴 음식 %d개, dish %d개 label 대응", "(dry-run) " if args.dry_run else "", routine_foods, dishes)
+
+
+if __name__ == "__main__":
+    main()
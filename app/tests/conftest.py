@@ -1,10 +1,20 @@
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
 import pytest
+from dependency_injector import providers
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
-from app.database import Base, get_db
+from app.database import Base, get_db, UnitOfWork, engine as app_engine, async_engine as app_async_engine
 from app.main import app
+from app.modules.outbox.domain.outbox import OutboxStatus
+from app.modules.outbox.domain.repository.outbox_repo import IOutboxRepository
+from app.modules.upload.domain.repository.upload_repo import IUploadRepository
+from app.modules.upload.domain.upload import UploadStatus
 from fastapi.testclient import TestClient
 from app.app_config import get_settings
+from app.utils.query_stats import count_all_queries
 
 settings = get_settings()
 
@@ -25,11 +35,186 @@ def db():
         Base.metadata.drop_all(bind=engine)
 
 
+@pytest.fixture
+def unit_of_work(db):
+    """
+    repository 테스트용, 테스트 DB 에 묶인 요청 트랜잭션
+        with unit_of_work() as uow:
+            repo.save(...)
+            uow.commit()  # commit 하지 않으면 rollback
+    """
+    @contextmanager
+    def scope():
+        uow = UnitOfWork(bind=engine)
+        try:
+            with uow.bind_scope():
+                yield uow
+        finally:
+            uow.rollback()
+            uow.close()
+
+    return scope
+
+
 @pytest.fixture(scope="function")
 def client(db):
     def override_get_db():
         yield db
 
     app.dependency_overrides[get_db] = override_get_db
-    with TestClient(app) as c:
-        yield c
+    # 요청 트랜잭션(repository 의 session_scope)도 테스트 DB 사용
+    app.container.unit_of_work.override(providers.Factory(UnitOfWork, bind=engine))
+    try:
+        with TestClient(app) as c:
+            yield c
+    finally:
+        app.container.unit_of_work.reset_override()
+        app.dependency_overrides.pop(get_db, None)
+
+
+@pytest.fixture
+def query_budget():
+    """
+    엔드포인트 SQL 개수 상한 검사
+        with query_budget(5):
+            client.get(...)
+    """
+    engines = [engine, app_engine] + ([app_async_engine.sync_engine] if app_async_engine is not None else [])
+
+    @contextmanager
+    def budget(max_queries: int):
+        with count_all_queries(*engines) as stats:
+            yield stats
+        if stats.count > max_queries:
+            repeated = "\n".join(f"  {n}회: {shape[:200]}" for shape, n in stats.repeated(2))
+            pytest.fail(f"SQL {stats.count}개 실행 (허용 {max_queries}개)\n{repeated}")
+
+    return budget
+
+
+class FakeBlob:
+    """firebase storage blob 대역"""
+
+    def __init__(self, bucket, name):
+        self.bucket = bucket
+        self.name = name
+
+    @property
+    def size(self):
+        return len(self.bucket.store[self.name][0])
+
+    @property
+    def content_type(self):
+        return self.bucket.store[self.name][1]
+
+    @property
+    def time_created(self):
+        return self.bucket.store[self.name][2]
+
+    def generate_signed_url(self, method="GET", **kwargs):
+        self.bucket.signs += 1
+        return f"https://signed/{self.name}?method={method}&sig={self.bucket.signs}"
+
+    def delete(self):
+        if self.name in self.bucket.fail_on:
+            raise RuntimeError("delete failed")
+        self.bucket.store.pop(self.name, None)
+
+
+class FakeBucket:
+    """
+    firebase storage bucket 대역, store: 경로 -> (내용, content_type, 생성시각)
+     - fail_on 의 경로는 삭제 실패
+    """
+
+    def __init__(self):
+        self.store = {}
+        self.fail_on = set()
+        self.signs = 0
+
+    def put(self, name, data=b"", content_type="image/jpeg", time_created=None):
+        self.store[name] = (data, content_type, time_created or datetime.now(timezone.utc))
+
+    def blob(self, name):
+        return FakeBlob(self, name)
+
+    def get_blob(self, name):
+        return FakeBlob(self, name) if name in self.store else None
+
+    def list_blobs(self, prefix, page_size):
+        names = sorted(name for name in self.store if name.startswith(prefix))
+        return SimpleNamespace(pages=[[self.blob(name) for name in names[i:i + page_size]]
+                                      for i in range(0, len(names), page_size)])
+
+
+class FakeOutboxRepository(IOutboxRepository):
+    """메모리 outbox, detached 로 저장된 event id 는 detached 에 기록"""
+
+    def __init__(self):
+        self.events = {}
+        self.detached = set()
+
+    def save_event(self, event, detached=False):
+        self.events[event.id] = event
+        if detached:
+            self.detached.add(event.id)
+
+    def claim_events(self, limit, lease_until):
+        now = datetime.utcnow()
+        events = [e for e in self.events.values()
+                  if e.status == OutboxStatus.PENDING and e.available_at <= now][:limit]
+        for event in events:
+            event.available_at, event.attempts = lease_until, event.attempts + 1
+        return events
+
+    def delete_events(self, event_ids):
+        for event_id in event_ids:
+            self.events.pop(event_id)
+
+    def retry_event(self, event_id, available_at, error, dead=False):
+        event = self.events[event_id]
+        event.available_at, event.last_error = available_at, error
+        event.status = OutboxStatus.DEAD if dead else OutboxStatus.PENDING
+
+    def count_events(self):
+        return {}
+
+
+class FakeUploadRepository(IUploadRepository):
+    """메모리 업로드 저장소"""
+
+    def __init__(self):
+        self.uploads = {}
+
+    def save_upload(self, upload):
+        self.uploads[upload.id] = upload
+
+    def find_upload(self, user_id, upload_id):
+        upload = self.uploads.get(upload_id)
+        return upload if upload is not None and upload.user_id == user_id else None
+
+    def mark_finalized(self, upload_id, size):
+        upload = self.uploads[upload_id]
+        if upload.status != UploadStatus.PENDING:
+            return False
+        upload.status = UploadStatus.FINALIZED
+        return True
+
+    def find_pending_paths(self, paths, expires_after):
+        return {u.file_path for u in self.uploads.values()
+                if u.status == UploadStatus.PENDING and u.expires_at > expires_after} & set(paths)
+
+
+@pytest.fixture
+def fake_bucket():
+    return FakeBucket()
+
+
+@pytest.fixture
+def fake_outbox_repo():
+    return FakeOutboxRepository()
+
+
+@pytest.fixture
+def fake_upload_repo():
+    return FakeUploadRepository()
@@ -0,0 +1,9 @@
+from app.core.blob_deleter import BlobDeleter
+
+
+def test_delete_many_is_best_effort(fake_bucket):
+    for path in ("meal/a", "meal/b", "meal/c"):
+        fake_bucket.put(path)
+    fake_bucket.fail_on.add("meal/b")
+    BlobDeleter(max_workers=4, bucket=fake_bucket).delete_many(["meal/a", "meal/b", "meal/c"])
+    assert list(fake_bucket.store) == ["meal/b"]  # 하나가 실패해도 나머지는 삭제
@@ -0,0 +1,38 @@
+import io
+
+from PIL import Image
+
+from app.core.image_processor import ImageProcessor, base_image_path, variant_path
+
+
+def _jpeg_with_exif(width, height) -> bytes:
+    image = Image.new("RGB", (width, height), (200, 30, 30))
+    exif = Image.Exif()
+    exif[0x0112] = 6  # 시계방향 90도 회전
+    exif[0x010F] = "phone"
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", exif=exif)
+    return buffer.getvalue()
+
+
+def test_process_strips_exif_and_writes_variants():
+    processor = ImageProcessor(max_workers=1, max_dimension=1000, sizes={"small": 100, "medium": 400})
+    try:
+        variants = processor.process(_jpeg_with_exif(3000, 1500))
+        assert processor.process(b"not an image") is None
+    finally:
+        processor.shutdown()
+
+    sizes = {}
+    for variant, data in variants.items():
+        with Image.open(io.BytesIO(data)) as image:
+            assert image.format == "JPEG" and not image.getexif()
+            sizes[variant] = image.size
+    assert sizes == {"original": (500, 1000), "small": (50, 100), "medium": (200, 400)}  # 회전 반영
+
+
+def test_variant_paths():
+    assert variant_path("meal/U1_1/original.jpg", "small") == "meal/U1_1/small.jpg"
+    assert variant_path("food/1.jpg", "small") is None
+    assert base_image_path("meal/U1_1/medium.jpg") == "meal/U1_1/original.jpg"
+    assert base_image_path("meal/U1_1") == "meal/U1_1"
@@ -0,0 +1,43 @@
+from datetime import timedelta
+
+from app.core.signed_url import SignedUrlService
+
+
+def test_same_url_until_refresh_window(fake_bucket):
+    service = SignedUrlService(bucket=fake_bucket)
+
+    first = service.get("meal/a")
+    assert service.get("meal/a") == first
+    assert fake_bucket.signs == 1
+    assert service.stats()["hit_rate"] == 0.5
+
+
+def test_get_many_signs_only_misses_and_dedupes(fake_bucket):
+    service = SignedUrlService(bucket=fake_bucket)
+    service.get("meal/a")
+
+    urls = service.get_many(["meal/a", "meal/b", "meal/b", None])
+    assert set(urls) == {"meal/a", "meal/b"}
+    assert fake_bucket.signs == 2
+
+
+def test_refresh_window_and_invalidate_resign(fake_bucket):
+    # 만료 = 재서명 시점이므로 매번 새로 서명
+    service = SignedUrlService(expiration=timedelta(minutes=10), refresh_before=timedelta(minutes=10), bucket=fake_bucket)
+    assert service.get("meal/a") != service.get("meal/a")
+
+    service = SignedUrlService(bucket=fake_bucket)
+    url = service.get("meal/a")
+    service.invalidate("meal/a")
+    assert service.get("meal/a") != url
+
+
+def test_lru_eviction(fake_bucket):
+    service = SignedUrlService(max_entries=2, bucket=fake_bucket)
+    service.get_many(["a", "b"])
+    service.get("a")
+    service.get("c")
+    assert service.stats()["entries"] == 2
+    misses = service.misses.value
+    service.get("a")
+    assert service.misses.value == misses  # a 는 최근 사용되어 남아있음
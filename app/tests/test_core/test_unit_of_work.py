@@ -0,0 +1,47 @@
+from types import SimpleNamespace
+
+from fastapi import FastAPI, Depends
+from fastapi.testclient import TestClient
+
+from app.core.unit_of_work import request_unit_of_work
+from app.database import UnitOfWork, session_scope, after_commit, _session_provider
+from app.modules.food.infra.db_models.food import Food
+from app.tests.conftest import engine
+from app.utils.exceptions.error_code import ErrorCode
+from app.utils.exceptions.handlers import raise_error
+
+
+def _app():
+    app = FastAPI(dependencies=[Depends(request_unit_of_work)])
+    app.container = SimpleNamespace(unit_of_work=lambda: UnitOfWork(bind=engine))
+
+    @app.post("/foods/{label}")
+    def create(label: int, fail: bool = False):
+        with session_scope() as db:
+            db.add(Food(label=label, name=f"음식{label}"))
+            db.commit()  # 요청 트랜잭션 안에서는 flush 만
+        if fail:
+            raise raise_error(ErrorCode.DISH_NOT_FOUND)
+        return label
+
+    return app
+
+
+def test_request_commits_once_and_rolls_back_on_error(db):
+    client = TestClient(_app(), raise_server_exceptions=False)
+    assert client.post("/foods/1").status_code == 200
+    assert client.post("/foods/2", params={"fail": True}).status_code == 404
+    assert [food.label for food in db.query(Food).all()] == [1]
+
+
+def test_after_commit_runs_only_when_committed(unit_of_work):
+    ran = []
+    with unit_of_work():
+        after_commit(lambda: ran.append("rolled back"))
+    with unit_of_work() as uow:
+        after_commit(lambda: ran.append(_session_provider.get()))
+        assert ran == []
+        uow.commit()
+    assert ran == [None]  # 끝난 요청 세션은 넘기지 않음
+    after_commit(lambda: ran.append("no transaction"))
+    assert ran == [None, "no transaction"]
@@ -0,0 +1,42 @@
+from app.modules.food.domain.food import Food
+from app.modules.food.infra.food_autocomplete import FoodAutocomplete
+from app.modules.food.infra.food_catalog import FoodCatalogSnapshot
+
+
+def _snapshot(names: dict, version: int) -> FoodCatalogSnapshot:
+    foods = tuple(Food(label=label, name=name) for label, name in names.items())
+    return FoodCatalogSnapshot(foods=foods, by_label={food.label: food for food in foods}, version=version)
+
+
+NAMES = {1: "김치", 2: "김치찌개", 3: "김밥", 4: "닭갈비", 5: "돼지고기 김치찌개"}
+
+
+def _names(foods):
+    return [food.name for food in foods]
+
+
+def test_prefix_with_partial_syllable():
+    autocomplete = FoodAutocomplete()
+    autocomplete.on_catalog_reload(_snapshot(NAMES, 1), None)
+    assert _names(autocomplete.complete("김ㅊ")) == ["김치", "김치찌개", "돼지고기 김치찌개"]  # 띄어쓴 단어도 일치
+    assert _names(autocomplete.complete("김")) == ["김밥", "김치", "김치찌개", "돼지고기 김치찌개"]
+    assert _names(autocomplete.complete("닭갈ㅂ")) == ["닭갈비"]
+    assert _names(autocomplete.complete("달ㄱ")) == ["닭갈비"]  # 겹받침 입력 중
+    assert len(autocomplete.complete("김", limit=2)) == 2
+    assert autocomplete.complete("") == [] and autocomplete.complete("라") == []
+
+
+def test_incremental_reload_matches_full_build():
+    autocomplete = FoodAutocomplete()
+    first = _snapshot(NAMES, 1)
+    autocomplete.on_catalog_reload(first, None)
+    changed = {**NAMES, 3: "참치김밥", 6: "라면"}
+    del changed[1]
+    second = _snapshot(changed, 2)
+    autocomplete.on_catalog_reload(second, first)
+
+    full = FoodAutocomplete()
+    full.on_catalog_reload(second, None)
+    assert autocomplete._entries.keys == full._entries.keys and autocomplete._entries.labels == full._entries.labels
+    assert _names(autocomplete.complete("김")) == ["김치찌개", "돼지고기 김치찌개"]
+    assert _names(autocomplete.complete("ㄹ")) == ["라면"]
@@ -0,0 +1,67 @@
+import time
+
+from app.modules.food.domain.food import Food
+from app.modules.food.domain.repository.food_repo import IFoodRepository
+from app.modules.food.infra.catalog_food_repo_impl import CatalogFoodRepository
+from app.modules.food.infra.food_catalog import FoodCatalog
+from app.modules.food.infra.food_search_index import FoodSearchIndex
+
+
+class _DBRepo(IFoodRepository):
+    def __init__(self):
+        self.foods = [Food(label=1, name="김치"), Food(label=2, name="밥")]
+        self.loads = 0
+
+    def find_food_by_name(self, name, limit=20):
+        return [food for food in self.foods if name in food.name][:limit]
+
+    def find_food_by_label(self, label):
+        raise AssertionError("카탈로그에서 조회해야 함")
+
+    def find_all_foods(self):
+        self.loads += 1
+        return list(self.foods)
+
+    def insert_food_data(self, food_vo_list):
+        self.foods.extend(food_vo_list)
+
+
+def test_label_lookup_uses_catalog_and_reloads_on_insert():
+    db = _DBRepo()
+    repo = CatalogFoodRepository(db, FoodCatalog(db.find_all_foods, refresh_interval=0), FoodSearchIndex(), "pg_trgm")
+    assert [repo.find_food_by_label(label).name for label in (1, 2, 1)] == ["김치", "밥", "김치"]
+    assert repo.find_food_by_label(3) is None
+    assert db.loads == 1
+
+    old = repo.catalog.snapshot
+    repo.insert_food_data([Food(label=3, name="국")])
+    assert repo.find_food_by_label(3).name == "국" and db.loads == 2
+    assert 3 not in old.by_label  # 이전 snapshot 은 그대로 (교체만)
+
+
+def test_stale_catalog_refreshes_in_background_of_reads():
+    db = _DBRepo()
+    catalog = FoodCatalog(db.find_all_foods, refresh_interval=0.01)
+    assert catalog.get(1).name == "김치"
+    db.foods.append(Food(label=4, name="라면"))  # 다른 worker 가 넣은 데이터
+    assert catalog.get(4) is None
+    time.sleep(0.02)
+    assert catalog.get(4) is None  # 오래된 snapshot 을 바로 반환하고 갱신은 백그라운드에서
+    catalog._refresh_thread.join(timeout=1)
+    assert catalog.get(4).name == "라면" and catalog.stats()["version"] == 2
+
+
+def test_insert_reloads_catalog_only_after_commit(unit_of_work):
+    db = _DBRepo()
+    repo = CatalogFoodRepository(db, FoodCatalog(db.find_all_foods, refresh_interval=0), FoodSearchIndex(), "pg_trgm")
+    repo.find_food_by_label(1)
+    with unit_of_work():
+        repo.insert_food_data([Food(label=3, name="국")])
+        assert db.loads == 1  # 요청 실패(rollback), 카탈로그는 그대로
+    assert repo.find_food_by_label(3) is None and db.loads == 1
+
+    with unit_of_work() as uow:
+        repo.insert_food_data([Food(label=4, name="떡")])
+        assert db.loads == 1
+        uow.commit()
+    assert db.loads == 2
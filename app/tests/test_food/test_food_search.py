@@ -0,0 +1,43 @@
+from app.modules.food.domain.food import Food
+from app.modules.food.infra.food_catalog import FoodCatalogSnapshot
+from app.modules.food.infra.food_search_index import FoodSearchIndex
+
+FOODS = [Food(label=i, name=name) for i, name in enumerate(
+    ["김치찌개", "김치볶음밥", "돼지고기김치찌개", "된장찌개", "김밥", "닭갈비", "참치김밥"])]
+
+
+def _index(foods=FOODS):
+    index = FoodSearchIndex()
+    index.on_catalog_reload(FoodCatalogSnapshot(foods=tuple(foods), version=1), None)
+    return index
+
+
+def _names(foods):
+    return [food.name for food in foods]
+
+
+def test_substring_matches_first_shorter_name_first():
+    assert _names(_index().search("김치찌개")) == ["김치찌개", "돼지고기김치찌개"]
+    assert _names(_index().search("김밥")) == ["김밥", "참치김밥"]
+
+
+def test_partial_syllable_and_typo():
+    assert _names(_index().search("김ㅊ"))[:2] == ["김치찌개", "김치볶음밥"]
+    assert _names(_index().search("닭갈ㅂ")) == ["닭갈비"]
+    assert "김치찌개" in _names(_index().search("김치찌게"))  # 오타
+
+
+def test_limit_and_reload():
+    index = _index()
+    assert len(index.search("김", limit=2)) == 2
+    assert index.search("라면") == []
+    index.on_catalog_reload(FoodCatalogSnapshot(foods=tuple(FOODS + [Food(label=9, name="라면")]), version=2), None)
+    assert _names(index.search("라면")) == ["라면"]
+
+
+def test_match_scores_whole_catalog():
+    matches = _index().match("김치 찌게", k=3)
+    assert matches[0][0].name == "김치찌개" and 0.5 < matches[0][1] < 1
+    assert [score for _, score in matches] == sorted((score for _, score in matches), reverse=True)
+    assert _index().match("김치찌개", k=1)[0][1] == 1.0
+    assert _index().match("라면", threshold=0.5) == []
@@ -0,0 +1,43 @@
+import numpy as np
+
+from app.modules.food.domain.food import Food
+from app.modules.food.infra.nutrient_matrix import NutrientMatrix, COLUMN_INDEX
+
+
+def test_portions_and_total(tmp_path):
+    matrix = NutrientMatrix(str(tmp_path / "nutrients.npy"))
+    matrix.publish([Food(label=7, calorie=300, carb=40), Food(label=2, calorie=100, protein=5)])
+
+    portions = matrix.portions([2, 7, 99, None], [2, 1, 3, 1], default_calorie=750)
+    assert portions[:, COLUMN_INDEX["calorie"]].tolist() == [200, 300, 2250, 750]
+    assert portions[:, COLUMN_INDEX["carb"]].tolist() == [0, 40, 0, 0]
+    assert matrix.total([2, 7], [1, 2]) == 700
+    assert isinstance(matrix.matrix, np.memmap)
+
+
+def test_other_worker_sees_republished_file(tmp_path):
+    path = str(tmp_path / "nutrients.npy")
+    writer, reader = NutrientMatrix(path), NutrientMatrix(path, check_interval=0)
+    writer.publish([Food(label=1, calorie=100)])
+    assert reader.total([1], [1]) == 100
+
+    writer.publish([Food(label=1, calorie=150)])  # 카탈로그 다시 읽음
+    assert reader.total([1], [1]) == 150
+
+
+def test_total_has_no_float32_drift(tmp_path):
+    matrix = NutrientMatrix(str(tmp_path / "nutrients.npy"))
+    matrix.publish([Food(label=1, calorie=100.4), Food(label=2, calorie=262.2)])
+    assert matrix.total([1, 2], [1, 2]) == 100.4 * 1 + 262.2 * 2
+
+
+def test_unwritable_path_falls_back_to_memory(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    matrix = NutrientMatrix(str(blocker / "nutrients.npy"), check_interval=0)  # 디렉터리를 만들 수 없는 경로
+
+    class _Snapshot:
+        foods = (Food(label=1, calorie=120),)
+
+    matrix.on_catalog_reload(_Snapshot(), None)  # 예외 없이 로드
+    assert matrix.ready and matrix.total([1], [2]) == 240
@@ -0,0 +1,68 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.modules.mealday.application.async_mealday_service import AsyncMealDayService
+
+
+class _Processor:
+    def __init__(self):
+        self.calls = []
+
+    def process(self, data, variants=True):
+        raise AssertionError("이벤트 루프에서 변환 결과를 기다리면 안 됨")
+
+    async def aprocess(self, data, variants=True):
+        self.calls.append(data)
+        return {"original": b"o", "small": b"s", "medium": b"m"}
+
+
+class _MealDayService:
+    def __init__(self, fail=False):
+        self.image_processor = _Processor()
+        self.fail = fail
+        self.loop_thread = threading.get_ident()
+        self.stored, self.registered, self.discarded = [], [], []
+
+    def store_dish_image(self, user_id, data, content_type, variants):
+        assert threading.get_ident() != self.loop_thread  # storage 업로드는 스레드풀
+        self.stored.append(sorted(variants))
+        return "meal/U1_x/original.jpg"
+
+    def register_dish_v2_image(self, user_id, daytime, routine_food_id, image_path):
+        if self.fail:
+            raise ValueError("등록 실패")
+        self.registered.append(image_path)
+
+    def discard_dish_image(self, image_path):
+        self.discarded.append(image_path)
+
+
+class _Picture:
+    content_type = "image/jpeg"
+
+    async def read(self):
+        return b"jpeg"
+
+
+def _register(service):
+    async def run():
+        service.loop_thread = threading.get_ident()
+        await AsyncMealDayService(service, None, None, None).register_dish_v2("U1", "1", "RF1", _Picture())
+    asyncio.run(run())
+
+
+def test_register_dish_v2_processes_off_the_event_loop():
+    service = _MealDayService()
+    _register(service)
+    assert service.image_processor.calls == [b"jpeg"]
+    assert service.stored == [["medium", "original", "small"]]
+    assert service.registered == ["meal/U1_x/original.jpg"] and service.discarded == []
+
+
+def test_register_dish_v2_discards_image_on_failure():
+    service = _MealDayService(fail=True)
+    with pytest.raises(ValueError):
+        _register(service)
+    assert service.discarded == ["meal/U1_x/original.jpg"]
@@ -0,0 +1,33 @@
+from datetime import date, datetime, timedelta
+
+from app.core.auth import create_access_token, Role
+from app.modules.mealday.infra.db_models.mealday import MealDay, Dish
+from app.modules.track.infra.db_models.track import Track
+from app.modules.track.interface.schema.track_schema import MealTime
+
+START = date(2026, 10, 1)
+
+
+def _seed(db, days: int, dishes_per_day: int):
+    db.add(Track(id="T1", user_id="U1", name="t", duration=days, start_date=START,
+                 finish_date=START + timedelta(days=days - 1)))
+    for d in range(days):
+        mealday_id = f"M{d}"
+        db.add(MealDay(id=mealday_id, user_id="U1", record_date=START + timedelta(days=d),
+                       update_datetime=datetime.utcnow(), nowcalorie=700.0 * dishes_per_day))
+        for i in range(dishes_per_day):
+            db.add(Dish(id=f"D{d}-{i}", user_id="U1", mealday_id=mealday_id, mealtime=MealTime.LUNCH,
+                        days=d + 1, name="비빔밥", quantity=1, calorie=700.0))
+    db.commit()
+
+
+def test_dish_group_query_count_does_not_grow_with_dishes(client, db, query_budget):
+    _seed(db, days=3, dishes_per_day=4)
+    headers = {"Authorization": f"Bearer {create_access_token({'user_id': 'U1'}, Role.USER)}"}
+
+    with query_budget(4):  # 트랙 조회 + 기간 전체 dish 한번
+        response = client.get("/api/v1/dishes/group/T1", headers=headers)
+
+    assert response.status_code == 200, response.text
+    groups = response.json()
+    assert [(g["days"], len(g["dishes"]), g["total_calorie"]) for g in groups] == [(d, 4, 2800.0) for d in (1, 2, 3)]
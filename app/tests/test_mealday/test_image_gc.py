@@ -0,0 +1,73 @@
+from contextlib import nullcontext
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.core.blob_deleter import BlobDeleter
+from app.modules.mealday.application.image_gc_service import ImageGarbageCollector
+from app.modules.upload.domain.upload import PendingUpload, UploadPurpose
+
+
+class _Repo:
+    def __init__(self, referenced):
+        self.referenced = referenced
+        self.queries = 0
+
+    def find_referenced_images(self, paths):
+        self.queries += 1
+        return self.referenced & set(paths)
+
+
+@pytest.fixture
+def collector(fake_bucket, fake_upload_repo):
+    old = datetime.now(timezone.utc) - timedelta(days=10)
+    for name in ("temp/a", "meal/c", "meal/d", "meal/e", "food/1.jpg"):
+        fake_bucket.put(name, time_created=old)
+    fake_bucket.put("temp/b")
+    fake_upload_repo.save_upload(PendingUpload(id="UP1", user_id="U1", purpose=UploadPurpose.DISH, file_path="meal/e",
+                                               content_type="image/jpeg", expires_at=datetime.utcnow()))
+
+    def create(**kwargs):
+        repo = _Repo({"meal/c"})
+        gc = ImageGarbageCollector(repo, fake_upload_repo, BlobDeleter(bucket=fake_bucket), page_size=2,
+                                   bucket=fake_bucket, **kwargs)
+        return gc, fake_bucket, repo
+
+    return create
+
+
+def test_dry_run_reports_without_deleting(collector):
+    gc, bucket, repo = collector()
+    report = gc.sweep(dry_run=True)
+    temp, meal = report["prefixes"]
+    assert (temp["scanned"], temp["orphans"], temp["samples"]) == (2, 1, ["temp/a"])  # temp/b 는 ttl 전
+    assert (meal["pages"], meal["orphans"], meal["samples"]) == (2, 1, ["meal/d"])
+    assert len(bucket.store) == 6 and gc.stats()["deleted"] == 0
+    assert repo.queries == 3  # 오래된 사진이 있는 page 마다 한번
+
+
+def test_sweep_deletes_only_orphans(collector):
+    gc, bucket, _ = collector()
+    gc.sweep()
+    assert sorted(bucket.store) == ["food/1.jpg", "meal/c", "meal/e", "temp/b"]
+    assert gc.stats()["deleted"] == 2 and gc.stats()["runs"] == 1
+
+
+def test_overlapping_run_is_skipped(collector):
+    gc, bucket, repo = collector()
+    gc._lock.acquire()  # 첫 실행 진행중
+    report = gc.sweep()
+    assert report["skipped"] is True and report["prefixes"] == [] and repo.queries == 0
+
+    gc, bucket, repo = collector(run_guard=lambda: nullcontext(False))  # 다른 worker 가 실행중
+    assert gc.sweep()["skipped"] is True and len(bucket.store) == 6
+
+
+def test_abandoned_pending_upload_is_collected(collector, fake_upload_repo):
+    gc, bucket, _ = collector()
+    bucket.put("meal/f", time_created=datetime.now(timezone.utc) - timedelta(days=10))
+    fake_upload_repo.save_upload(PendingUpload(id="UP2", user_id="U1", purpose=UploadPurpose.DISH, file_path="meal/f",
+                                               content_type="image/jpeg",
+                                               expires_at=datetime.utcnow() - timedelta(days=3)))  # 확정되지 않고 만료
+    gc.sweep()
+    assert "meal/f" not in bucket.store and "meal/e" in bucket.store  # meal/e 는 아직 확정 기한 안
@@ -0,0 +1,88 @@
+from datetime import date, datetime
+from types import SimpleNamespace
+
+from sqlalchemy import select, update
+
+from app.modules.food.domain.food import Food
+from app.modules.mealday.domain.mealday import MealDay as MealDayVO
+from app.modules.mealday.infra.db_models.mealday import MealDay
+from app.modules.mealday.infra.mealday_repo_impl import MealDayRepository
+from app.modules.mealday.interface.schema.mealday_schema import CreateDishBody
+from app.modules.track.interface.schema.track_schema import MealTime
+
+USER_ID = "01J0000000000000000000USER"
+MEALDAY_ID = "01J000000000000000000MDAY1"
+KIMCHI = Food(label=1, name="김치찌개", size=300.0, calorie=200.0, carb=10.0, protein=8.0, fat=5.0)
+
+
+def _totals(uow):
+    row = uow.session.execute(
+        select(MealDay.nowcalorie, MealDay.carb, MealDay.protein, MealDay.fat).where(MealDay.id == MEALDAY_ID)
+    ).one()
+    return tuple(row)
+
+
+def _setup(uow, food=KIMCHI, name=None, quantity=1):
+    repo = MealDayRepository()
+    repo.save_mealday(MealDayVO(id=MEALDAY_ID, user_id=USER_ID, record_date=date(2026, 10, 18),
+                                update_datetime=datetime.utcnow()))
+    body = CreateDishBody(mealtime="LUNCH", days=1, name=name, quantity=quantity)
+    dish = repo.create_dish(USER_ID, MEALDAY_ID, body, None, MealTime.LUNCH, food, "meal/a.jpg")
+    return repo, dish
+
+
+def test_create_dish_adds_to_stored_totals(unit_of_work):
+    with unit_of_work() as uow:
+        repo, _ = _setup(uow)
+        # 다른 요청이 먼저 합계를 바꿔도 UPDATE 가 DB 값에 더하므로 유실되지 않음
+        uow.session.execute(update(MealDay).where(MealDay.id == MEALDAY_ID).values(nowcalorie=MealDay.nowcalorie + 50))
+        repo.create_dish(USER_ID, MEALDAY_ID, CreateDishBody(mealtime="LUNCH", days=1, quantity=2),
+                         None, MealTime.LUNCH, KIMCHI, None)
+        assert _totals(uow) == (650.0, 30.0, 24.0, 15.0)
+
+
+def test_delete_dish_returns_image_and_subtracts(unit_of_work):
+    with unit_of_work() as uow:
+        repo, dish = _setup(uow)
+        assert repo.delete_dish(USER_ID, dish.id) == "meal/a.jpg"
+        assert _totals(uow) == (0.0, 0.0, 0.0, 0.0)
+        assert repo.find_dish(USER_ID, dish.id) is None
+        assert repo.delete_dish(USER_ID, dish.id) is None  # 이미 삭제된 dish
+
+
+def test_update_dish_applies_difference_only_when_percent(unit_of_work):
+    with unit_of_work() as uow:
+        repo, dish = _setup(uow)
+        edited = SimpleNamespace(**{**vars(dish), "calorie": 100.0, "carb": 5.0, "protein": 4.0, "fat": 2.5})
+        repo.update_dish(edited, 50.0, dish.image_url)
+        assert _totals(uow) == (100.0, 5.0, 4.0, 2.5)
+
+        edited.heart = True
+        repo.update_dish(edited, 0, dish.image_url)
+        assert _totals(uow) == (100.0, 5.0, 4.0, 2.5)
+
+
+def test_update_dish_quantity_branches(unit_of_work):
+    with unit_of_work() as uow:
+        repo, dish = _setup(uow)
+        repo.update_dish_quantity(dish.id, 1, None, None)  # 라벨 -> 라벨, 수량 추가
+        assert _totals(uow) == (400.0, 20.0, 16.0, 10.0)
+
+        repo.update_dish_quantity(dish.id, 3, None, "비빔밥")  # 라벨 -> 이름
+        assert _totals(uow) == (2100.0, 0.0, 0.0, 0.0)
+
+        repo.update_dish_quantity(dish.id, 1, KIMCHI, None)  # 이름 -> 라벨
+        assert _totals(uow) == (200.0, 10.0, 8.0, 5.0)
+
+
+def test_update_dish_label_or_name(unit_of_work):
+    with unit_of_work() as uow:
+        repo, dish = _setup(uow, food=None, name="비빔밥", quantity=2)
+        assert _totals(uow) == (1400.0, 0.0, 0.0, 0.0)
+
+        updated = repo.update_dish_label_or_name(dish.id, None, 3, KIMCHI)
+        assert updated.name == "김치찌개" and updated.label == 1
+        assert _totals(uow) == (600.0, 30.0, 24.0, 15.0)
+
+        repo.update_dish_label_or_name(dish.id, "라면", 1, None)
+        assert _totals(uow) == (700.0, 0.0, 0.0, 0.0)
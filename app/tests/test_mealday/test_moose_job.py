@@ -0,0 +1,59 @@
+import asyncio
+
+from app.database import _session_provider
+from app.modules.mealday.application.moose_job_runner import MooseJobRunner
+from app.modules.mealday.domain.moose_job import MooseJob, MooseJobStatus
+from app.modules.mealday.infra.moose_job_store_impl import InMemoryMooseJobStore
+from app.utils.exceptions.error_code import ErrorCode
+from app.utils.exceptions.handlers import raise_error
+
+
+async def _run_jobs(works):
+    runner = MooseJobRunner(InMemoryMooseJobStore(), workers=2)
+    jobs = [MooseJob(id=f"job{i}", user_id="U1") for i in range(len(works))]
+    for job, work in zip(jobs, works):
+        await runner.submit(job, work)
+    await runner._queue.join()
+    found = [await runner.job_store.find(job.id) for job in jobs]
+    await runner.stop()
+    return found
+
+
+def test_runner_stores_result_and_error():
+    async def ok():
+        return {"file_path": "temp/a", "image_url": "https://signed/temp/a", "food_info": {"is_success": True}}
+
+    async def no_food():
+        raise_error(ErrorCode.NO_FOOD)
+
+    done, failed = asyncio.run(_run_jobs([ok, no_food]))
+    assert done.status == MooseJobStatus.DONE
+    assert done.food_info == {"is_success": True}
+    assert failed.status == MooseJobStatus.FAILED
+    assert failed.error["status_code"] == 404
+
+
+def test_in_memory_store_expires_jobs():
+    store = InMemoryMooseJobStore(ttl=0)
+    asyncio.run(store.save(MooseJob(id="job", user_id="U1")))
+    assert asyncio.run(store.find("job")) is None
+
+
+def test_workers_do_not_inherit_request_context():
+    async def run():
+        runner = MooseJobRunner(InMemoryMooseJobStore(), workers=1)
+        token = _session_provider.set(lambda: "request session")  # 요청 UnitOfWork 안에서 처음 submit
+        seen = []
+
+        async def work():
+            seen.append(_session_provider.get())
+            return {}
+        try:
+            await runner.submit(MooseJob(id="job", user_id="U1"), work)
+        finally:
+            _session_provider.reset(token)
+        await runner._queue.join()
+        await runner.stop()
+        return seen
+
+    assert asyncio.run(run()) == [None]
@@ -0,0 +1,29 @@
+from app.modules.mealday.infra.moose_result_cache import MooseResultCache
+
+
+def test_same_bytes_hit_per_user():
+    cache = MooseResultCache()
+    cache.put(cache.key("U1", b"img"), "temp/a", {"is_success": True})
+    assert cache.get(cache.key("U1", b"img")).file_path == "temp/a"
+    assert cache.get(cache.key("U2", b"img")) is None  # 다른 사용자의 임시 사진은 공유하지 않음
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_lru_eviction_and_invalidate():
+    cache = MooseResultCache(max_entries=2)
+    for name in (b"a", b"b"):
+        cache.put(cache.key("U1", name), f"temp/{name.decode()}", {})
+    cache.get(cache.key("U1", b"a"))
+    cache.put(cache.key("U1", b"c"), "temp/c", {})
+    assert cache.get(cache.key("U1", b"b")) is None
+    assert cache.stats()["evictions"] == 1
+
+    cache.invalidate_path("temp/a")
+    assert cache.get(cache.key("U1", b"a")) is None
+
+
+def test_expired_entry_is_miss():
+    cache = MooseResultCache(ttl=0)
+    cache.put(cache.key("U1", b"img"), "temp/a", {})
+    assert cache.get(cache.key("U1", b"img")) is None
+    assert cache.stats()["entries"] == 0
@@ -0,0 +1,17 @@
+from types import SimpleNamespace
+
+from app.modules.mealday.domain.mealday import Nutrition
+
+
+def test_nutrition_of_treats_none_as_zero():
+    dish = SimpleNamespace(calorie=300.0, carb=None, protein=5.0, fat=None)
+    assert Nutrition.of(dish) == Nutrition(calorie=300.0, carb=0.0, protein=5.0, fat=0.0)
+
+
+def test_nutrition_delta_between_old_and_new_dish():
+    old = Nutrition(calorie=700.0, carb=0.0, protein=0.0, fat=0.0)
+    new = Nutrition(calorie=400.0, carb=40.0, protein=20.0, fat=8.0)
+    delta = new - old
+    assert delta == Nutrition(calorie=-300.0, carb=40.0, protein=20.0, fat=8.0)
+    assert (old + delta) == new
+    assert (delta - delta).is_zero()
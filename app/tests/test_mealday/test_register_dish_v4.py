@@ -0,0 +1,47 @@
+from types import SimpleNamespace
+
+from app.modules.food.domain.food import Food
+from app.modules.mealday.application.mealday_service import MealDayService
+from app.modules.mealday.interface.schema.mealday_schema import CreateDishBody
+
+KIMCHI_STEW = Food(label=7, name="김치찌개", calorie=200.0)
+
+
+class _MealDayRepo:
+    def __init__(self):
+        self.created = []
+
+    def find_by_date(self, user_id, record_date):
+        return SimpleNamespace(id="M1", track_id="T1")
+
+    def create_dish(self, **kwargs):
+        self.created.append(kwargs)
+
+    def acquire_image(self, path, count, pinned):
+        pass
+
+
+class _FoodService:
+    def resolve_food(self, name):
+        return KIMCHI_STEW if name and "김치" in name else None
+
+
+def _register(name):
+    repo = _MealDayRepo()
+    track_service = SimpleNamespace(get_track_part_by_user_track_id=lambda user_id, track_id: SimpleNamespace(id="P1"))
+    service = MealDayService(mealday_repo=repo, user_service=None, track_service=track_service,
+                             food_service=_FoodService(), crypto=None, signed_url_service=None,
+                             moose_result_cache=None, upload_service=None, outbox_service=None, image_processor=None)
+    service.register_dish_v4("U1", "2026-10-18", CreateDishBody(mealtime="점심", days=1, name=name, quantity=1))
+    return repo.created[0]
+
+
+def test_fuzzy_match_keeps_typed_name():
+    created = _register("엄마표 김치찌개")
+    assert created["food"] is KIMCHI_STEW  # label, 영양성분은 비슷한 카탈로그 음식
+    assert created["name"] == "엄마표 김치찌개"
+
+
+def test_exact_match_uses_catalog_name():
+    assert _register("김치 찌개")["name"] is None  # 공백만 다르면 카탈로그 이름 사용
+    assert _register("비빔밥")["food"] is None
@@ -0,0 +1,105 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from app.modules.mealday.infra.yolo_batcher import YoloBatcher
+from app.modules.mealday.infra.yolo_client import YoloClient
+from app.utils.circuit_breaker import CircuitBreaker
+
+
+def _client(handler, **kwargs) -> YoloClient:
+    yolo = YoloClient("http://yolo", backoff=0, **kwargs)
+    yolo._client = httpx.AsyncClient(base_url="http://yolo", transport=httpx.MockTransport(handler))
+    return yolo
+
+
+def test_infer_retries_server_error():
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.params["url"])
+        if len(calls) == 1:
+            return httpx.Response(503)
+        return httpx.Response(201, json={"is_success": True})
+
+    yolo = _client(handler, max_retries=2)
+    assert asyncio.run(yolo.infer("https://signed/temp/a")) == {"is_success": True}
+    assert calls == ["https://signed/temp/a"] * 2
+    assert yolo.breaker.state == CircuitBreaker.CLOSED
+
+
+def test_breaker_opens_and_fails_fast():
+    calls = []
+
+    def handler(request):
+        calls.append(1)
+        raise httpx.ConnectError("down")
+
+    yolo = _client(handler, max_retries=0, breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60))
+    for _ in range(3):
+        with pytest.raises(HTTPException) as e:
+            asyncio.run(yolo.infer("u"))
+        assert e.value.status_code == 502
+    assert len(calls) == 2  # 세번째는 서버에 요청하지 않음
+    assert yolo.breaker.state == CircuitBreaker.OPEN
+
+
+def test_breaker_half_open_allows_single_trial():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+    assert breaker.allow() is True
+    assert breaker.allow() is False  # 시험 요청 진행중
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_batcher_sends_one_batch_and_fans_out_results():
+    bodies = []
+
+    def handler(request):
+        urls = json.loads(request.content)["urls"]
+        bodies.append(urls)
+        return httpx.Response(201, json={"results": [{"url": url} for url in urls]})
+
+    batcher = YoloBatcher(_client(handler), window_ms=10, max_batch_size=8)
+
+    async def run():
+        return await asyncio.gather(*(batcher.infer(f"u{i}") for i in range(3)))
+
+    assert asyncio.run(run()) == [{"url": "u0"}, {"url": "u1"}, {"url": "u2"}]
+    assert bodies == [["u0", "u1", "u2"]]
+
+
+def test_cancelled_half_open_trial_does_not_block_breaker():
+    started = []
+
+    async def handler(request):
+        started.append(1)
+        await asyncio.sleep(10)
+        return httpx.Response(201, json={})
+
+    yolo = _client(handler, max_retries=0, breaker=CircuitBreaker(failure_threshold=1, reset_timeout=0))
+    yolo.breaker.record_failure()
+
+    async def run():
+        task = asyncio.create_task(yolo.infer("u"))
+        while not started:
+            await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+    assert yolo.breaker.allow() is True  # 취소된 시험 요청은 실패로 기록, 다음 시험 가능
+
+
+def test_invalid_json_on_trial_records_failure():
+    yolo = _client(lambda request: httpx.Response(201, content=b"not json"), max_retries=0,
+                   breaker=CircuitBreaker(failure_threshold=1, reset_timeout=0))
+    yolo.breaker.record_failure()
+    with pytest.raises(ValueError):
+        asyncio.run(yolo.infer("u"))
+    assert yolo.breaker.allow() is True
@@ -0,0 +1,59 @@
+from datetime import datetime, timedelta
+
+from app.modules.outbox.application.outbox_service import OutboxService
+from app.modules.outbox.application.outbox_worker import OutboxWorker
+from app.modules.outbox.infra.outbox_repo_impl import OutboxRepository
+from app.tests.conftest import TestingSessionLocal
+
+
+def _repo():
+    return OutboxRepository(session_factory=TestingSessionLocal)
+
+
+def test_rolled_back_request_schedules_nothing(unit_of_work):
+    repo = _repo()
+    with unit_of_work():
+        OutboxService(repo).delete_blob("meal/a")  # commit 하지 않고 요청 실패
+    with unit_of_work() as uow:
+        OutboxService(repo).delete_blob("meal/b")
+        uow.commit()
+    with unit_of_work():
+        assert repo.count_events() == {"PENDING": 1}
+        assert [e.payload["path"] for e in repo.claim_events(10, datetime.utcnow() + timedelta(minutes=1))] == ["meal/b"]
+
+
+def test_detached_event_survives_rollback(unit_of_work):
+    repo = _repo()
+    with unit_of_work():
+        OutboxService(repo).delete_blob("temp/a", detached=True)
+    with unit_of_work():
+        assert repo.count_events() == {"PENDING": 1}
+
+
+def test_claim_respects_lease_and_reclaims_expired(unit_of_work):
+    repo = _repo()
+    with unit_of_work():
+        OutboxService(repo).delete_blob("meal/a")
+        OutboxService(repo).delete_blob("meal/b")
+        now = datetime.utcnow()
+        assert [e.attempts for e in repo.claim_events(1, now + timedelta(minutes=1))] == [1]
+        claimed = repo.claim_events(10, now - timedelta(seconds=1))  # 나머지 하나, lease 는 이미 만료
+        assert [e.payload["path"] for e in claimed] == ["meal/b"]
+        reclaimed = repo.claim_events(10, now + timedelta(minutes=1))  # 처리 도중 worker 가 죽은 경우
+        assert [(e.payload["path"], e.attempts) for e in reclaimed] == [("meal/b", 2)]
+        assert repo.claim_events(10, now + timedelta(minutes=1)) == []
+
+
+def test_failing_event_becomes_dead_after_max_attempts(unit_of_work):
+    repo = _repo()
+
+    def handler(event):
+        raise RuntimeError("storage down")
+
+    with unit_of_work():
+        OutboxService(repo).copy_blob("food/1.jpg", "meal/a")
+        worker = OutboxWorker(repo, handler, backoff_base=0, max_attempts=2)
+        assert worker.run_once() == 1 and repo.count_events() == {"PENDING": 1}
+        assert worker.run_once() == 1 and repo.count_events() == {"DEAD": 1}
+        assert worker.run_once() == 0
+        worker.stop()
@@ -0,0 +1,27 @@
+from app.modules.outbox.application.outbox_service import OutboxService
+from app.modules.outbox.application.outbox_worker import OutboxWorker
+from app.modules.outbox.domain.outbox import OutboxKind, OutboxStatus
+
+
+def test_worker_runs_batch_and_retries_failures(fake_outbox_repo):
+    repo = fake_outbox_repo
+    outbox = OutboxService(repo)
+    ok = outbox.delete_blob("meal/a")
+    bad = outbox.copy_blob("food/1.jpg", "meal/b")
+    done = []
+
+    def handler(event):
+        if event.kind == OutboxKind.BLOB_COPY:
+            raise RuntimeError("storage down")
+        done.append(event.payload["path"])
+
+    worker = OutboxWorker(repo, handler, backoff_base=0, max_attempts=2)
+    assert worker.run_once() == 2
+    assert done == ["meal/a"] and ok.id not in repo.events
+    assert repo.events[bad.id].status == OutboxStatus.PENDING and "storage down" in repo.events[bad.id].last_error
+
+    assert worker.run_once() == 1  # backoff 후 재시도, 최대 횟수 초과
+    assert repo.events[bad.id].status == OutboxStatus.DEAD
+    assert worker.run_once() == 0
+    assert worker.stats() == {"processed": 1, "failed": 2, "dead": 1}
+    worker.stop()
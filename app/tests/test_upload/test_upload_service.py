@@ -0,0 +1,51 @@
+from datetime import timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from app.modules.outbox.application.outbox_service import OutboxService
+from app.modules.upload.application.upload_service import UploadService
+from app.modules.upload.domain.upload import UploadPurpose
+
+
+@pytest.fixture
+def service(fake_upload_repo, fake_outbox_repo, fake_bucket):
+    return UploadService(fake_upload_repo, OutboxService(fake_outbox_repo), max_bytes=10, bucket=fake_bucket)
+
+
+def test_finalize_after_upload(service, fake_bucket):
+    upload, url, headers = service.create_upload("U1", UploadPurpose.DISH, "image/png")
+    assert upload.file_path.startswith("meal/") and "method=PUT" in url
+    assert headers["x-goog-content-length-range"] == "0,10"
+
+    with pytest.raises(HTTPException) as e:
+        service.finalize_upload("U1", upload.id, UploadPurpose.DISH)
+    assert e.value.status_code == 409  # 아직 업로드 안됨
+
+    fake_bucket.put(upload.file_path, b"png", "image/png")
+    assert service.finalize_upload("U1", upload.id, UploadPurpose.DISH).size == 3
+    with pytest.raises(HTTPException):
+        service.finalize_upload("U1", upload.id, UploadPurpose.DISH)  # 두번 확정 불가
+
+
+def test_finalize_rejects_other_user_and_invalid_file(service, fake_bucket, fake_outbox_repo):
+    upload, _, _ = service.create_upload("U1", UploadPurpose.MOOSE, "image/jpeg")
+    fake_bucket.put(upload.file_path, b"x" * 11, "image/jpeg")
+    with pytest.raises(HTTPException) as e:
+        service.finalize_upload("U2", upload.id, UploadPurpose.MOOSE)
+    assert e.value.status_code == 404
+    with pytest.raises(HTTPException) as e:
+        service.finalize_upload("U1", upload.id, UploadPurpose.MOOSE)
+    assert e.value.status_code == 422
+    # 크기 초과 파일은 삭제 예약 (요청이 실패해도 남도록 detached)
+    assert [e.payload["path"] for e in fake_outbox_repo.events.values()] == [upload.file_path]
+    assert fake_outbox_repo.detached == set(fake_outbox_repo.events)
+
+
+def test_finalize_rejects_upload_past_grace(service, fake_bucket):
+    upload, _, _ = service.create_upload("U1", UploadPurpose.DISH, "image/png")
+    fake_bucket.put(upload.file_path, b"png", "image/png")
+    upload.expires_at -= service.expiration + service.finalize_grace + timedelta(seconds=1)
+    with pytest.raises(HTTPException) as e:
+        service.finalize_upload("U1", upload.id, UploadPurpose.DISH)  # image GC 가 지웠을 수 있음
+    assert e.value.status_code == 410
@@ -0,0 +1,21 @@
+from sqlalchemy import create_engine, text
+
+from app.utils.query_stats import statement_shape, count_all_queries
+
+
+def test_statement_shape_ignores_in_list_size_and_whitespace():
+    a = statement_shape('SELECT * FROM "Dish"\n WHERE id IN (?, ?, ?)')
+    b = statement_shape('SELECT * FROM "Dish" WHERE id IN (?, ?)')
+    assert a == b == 'SELECT * FROM "Dish" WHERE id IN (?...)'
+
+
+def test_count_all_queries_flags_repeated_statements():
+    engine = create_engine("sqlite://")
+    with count_all_queries(engine) as stats:
+        with engine.connect() as conn:
+            for i in range(3):
+                conn.execute(text("SELECT :x"), {"x": i})
+            conn.execute(text("SELECT 1"))
+
+    assert stats.count == 4
+    assert stats.repeated(3) == [("SELECT ?", 3)]
@@ -0,0 +1,27 @@
+import zlib
+from contextlib import contextmanager
+
+from sqlalchemy import text
+
+from app.database import engine
+
+
+@contextmanager
+def try_advisory_lock(name: str):
+    """
+    여러 프로세스(uvicorn worker) 중 하나만 실행할 작업용 postgres advisory lock, 획득 여부를 yield
+     - 기다리지 않음 (다른 프로세스가 실행중이면 False)
+     - postgres 가 아니면(sqlite 개발 환경, 프로세스 하나) 항상 True
+    """
+    if engine.dialect.name != "postgresql":
+        yield True
+        return
+    key = zlib.crc32(name.encode())
+    with engine.connect() as connection:
+        acquired = connection.scalar(text("SELECT pg_try_advisory_lock(:key)"), {"key": key})
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": key})
+                connection.commit()
@@ -0,0 +1,69 @@
+import threading
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool
+
+from app.utils.metrics import Counter, WindowedHistogram
+
+
+class PoolMetrics:
+    """
+    커넥션 풀 지표
+     - checkout_wait_ms: 풀에서 커넥션을 얻기까지 기다린 시간 (ms)
+     - checked_out: checkout 시점에 사용중인 커넥션 수
+     - timeouts: pool_timeout 초과로 실패한 횟수
+    """
+
+    def __init__(self):
+        self.checkout_wait_ms = WindowedHistogram()
+        self.checked_out = WindowedHistogram()
+        self.checkouts = Counter()
+        self.timeouts = Counter()
+
+
+pool_metrics = PoolMetrics()
+
+
+class MeteredQueuePool(QueuePool):
+    """
+    checkout 대기시간을 pool_metrics 에 기록하는 QueuePool
+    """
+    _local = threading.local()
+
+    def _do_get(self):
+        # QueuePool._do_get 은 내부적으로 재귀 호출하므로 가장 바깥 호출만 측정
+        if getattr(self._local, "measuring", False):
+            return super()._do_get()
+
+        self._local.measuring = True
+        start = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except exc.TimeoutError:
+            pool_metrics.timeouts.inc()
+            raise
+        finally:
+            self._local.measuring = False
+            pool_metrics.checkout_wait_ms.observe((time.perf_counter() - start) * 1000)
+
+        pool_metrics.checkouts.inc()
+        pool_metrics.checked_out.observe(self.checkedout())
+        return conn
+
+
+def pool_status(pool) -> dict:
+    """
+    현재 풀 상태 (QueuePool 계열이 아니면 알 수 있는 값만)
+    """
+    status = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),  # pool_size 를 넘어 추가로 연 커넥션 수
+            max_overflow=pool._max_overflow,
+            timeout=pool.timeout(),
+        )
+    return status
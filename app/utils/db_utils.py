@@ -1,5 +1,3 @@
-from difflib import SequenceMatcher
-
 from sqlalchemy import inspect
 from typing import Type, TypeVar, Union, List, Any
 from dataclasses import dataclass, asdict, fields, is_dataclass
@@ -7,6 +5,8 @@ from pydantic.dataclasses import dataclass as pydantic_dataclass
 from pydantic import BaseModel
 from sqlalchemy.orm.base import instance_dict
 
+from app.utils.hangul import similarity
+
 # Generic 타입 변수
 T = TypeVar("T", bound=BaseModel)
 D = TypeVar("D")
@@ -80,8 +80,9 @@ def pydantic_to_dataclass(pydantic_instance: BaseModel, dataclass_model: Type[D]
 def is_similar(str1: str, str2: str, threshold: float = 0.8) -> bool:
     """
     str1 과 str2 비교해서 threshold 이상 유사하면 가져옴
+     - 여러 음식과 비교할 때는 FoodSearchIndex.match 사용
     """
-    return SequenceMatcher(None, str1, str2).ratio() >= threshold
+    return similarity(str1, str2) >= threshold
 
 
 def row_to_dict(row) -> dict:
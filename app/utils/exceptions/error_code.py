@@ -48,6 +48,13 @@ class ErrorCode(Enum):
     NO_PICTURE = (status.HTTP_404_NOT_FOUND, "DISH의 사진이 존재하지 않습니다.")
     YOLO_FAILED = (status.HTTP_502_BAD_GATEWAY, "YOLO_SERVER연결에 실패했습니다.")
     DISH_ALREADY_EXIST = (status.HTTP_409_CONFLICT, "DISH가 이미 존재합니다.")
+    MOOSE_JOB_NOT_FOUND = (status.HTTP_404_NOT_FOUND, "음식인식 작업이 존재하지 않습니다.")
+    UPLOAD_NOT_FOUND = (status.HTTP_404_NOT_FOUND, "업로드 정보가 존재하지 않습니다.")
+    UPLOAD_NOT_COMPLETED = (status.HTTP_409_CONFLICT, "파일 업로드가 완료되지 않았습니다.")
+    UPLOAD_INVALID = (status.HTTP_422_UNPROCESSABLE_ENTITY, "업로드한 파일이 유효하지 않습니다.")
+    UPLOAD_EXPIRED = (status.HTTP_410_GONE, "업로드 기한이 지났습니다.")
+    UPLOAD_INVALID_TYPE = (status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, "지원하지 않는 파일 형식입니다.")
+    MOOSE_QUEUE_FULL = (status.HTTP_503_SERVICE_UNAVAILABLE, "음식인식 요청이 많습니다. 잠시후 다시 시도해주세요.")
 
     ## FOOD 관련 에러코드
     NO_FOOD = (status.HTTP_404_NOT_FOUND, "음식데이터가 존재하지 않습니다.")
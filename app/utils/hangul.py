@@ -0,0 +1,61 @@
+"""
+한글 음절 분해 (검색/자동완성용)
+
+'김치' -> 'ㄱㅣㅁㅊㅣ' 처럼 완성형 음절을 호환용 자모로 풀어서,
+입력 중인 글자('김ㅊ', '김치찌')도 부분 일치로 찾을 수 있게 한다.
+"""
+import re
+
+HANGUL_BASE = 0xAC00
+HANGUL_END = 0xD7A3
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = ("", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ", "ㅁ", "ㅂ", "ㅄ",
+             "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ")
+# 겹받침/겹모음은 입력 순서대로 풀어서 '닭' 입력 중인 '달ㄱ' 도 같은 자모열이 되도록
+COMPOUND = {
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ", "ㄾ": "ㄹㅌ",
+    "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ", "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ",
+    "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+}
+_SPACES = re.compile(r"\s+")
+
+
+def normalize(text: str) -> str:
+    """소문자, 공백 제거"""
+    return _SPACES.sub("", text or "").lower()
+
+
+def decompose(text: str) -> str:
+    """완성형 한글을 자모열로, 그 외 문자는 그대로"""
+    result = []
+    for char in text:
+        code = ord(char)
+        if HANGUL_BASE <= code <= HANGUL_END:
+            offset = code - HANGUL_BASE
+            jamo = CHOSEONG[offset // 588] + JUNGSEONG[offset % 588 // 28] + JONGSEONG[offset % 28]
+        else:
+            jamo = char
+        result.append("".join(COMPOUND.get(j, j) for j in jamo))
+    return "".join(result)
+
+
+def ngrams(text: str, n: int) -> set[str]:
+    """n 글자 조각 집합 (text 가 n 보다 짧으면 text 자체)"""
+    if len(text) <= n:
+        return {text} if text else set()
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def grams(text: str) -> set[str]:
+    """음절 2-gram + 자모 3-gram (오타/입력 중인 음절도 일부 일치)"""
+    text = normalize(text)
+    return {f"s{gram}" for gram in ngrams(text, 2)} | {f"j{gram}" for gram in ngrams(decompose(text), 3)}
+
+
+def similarity(str1: str, str2: str) -> float:
+    """gram 집합의 dice 계수 (0~1, SequenceMatcher.ratio 와 같은 2*M/T 꼴)"""
+    grams1, grams2 = grams(str1), grams(str2)
+    if not grams1 or not grams2:
+        return 0.0
+    return 2 * len(grams1 & grams2) / (len(grams1) + len(grams2))
@@ -0,0 +1,147 @@
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Iterable, List
+
+
+def percentile(sorted_values: List[float], p: float) -> float | None:
+    """
+    정렬된 리스트에서 p(0~100) 백분위 값 (nearest-rank)
+    """
+    if not sorted_values:
+        return None
+    rank = max(int(round(p / 100 * len(sorted_values) + 0.5)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+class Counter:
+    """
+    스레드 안전한 누적 카운터
+    """
+
+    def __init__(self):
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1):
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+
+class _Bucket:
+    __slots__ = ("start", "count", "total", "max", "samples")
+
+    def __init__(self, start: int):
+        self.start = start
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples: List[float] = []
+
+
+class WindowedHistogram:
+    """
+    시간 bucket 단위로 값을 모아서 백분위를 계산
+     - bucket_seconds 마다 새 bucket, 최근 max_buckets 개만 보관
+     - bucket 당 샘플은 max_samples 개까지 reservoir sampling 으로 보관 (메모리 고정)
+    """
+
+    def __init__(self, bucket_seconds: int = 60, max_buckets: int = 60, max_samples: int = 1024):
+        self.bucket_seconds = bucket_seconds
+        self.max_samples = max_samples
+        self._buckets: deque[_Bucket] = deque(maxlen=max_buckets)
+        self._lock = threading.Lock()
+
+    def _current_bucket(self, now: float) -> _Bucket:
+        start = int(now // self.bucket_seconds * self.bucket_seconds)
+        if not self._buckets or self._buckets[-1].start != start:
+            self._buckets.append(_Bucket(start))
+        return self._buckets[-1]
+
+    def observe(self, value: float):
+        with self._lock:
+            bucket = self._current_bucket(time.time())
+            bucket.count += 1
+            bucket.total += value
+            bucket.max = max(bucket.max, value)
+            if len(bucket.samples) < self.max_samples:
+                bucket.samples.append(value)
+            else:
+                idx = random.randrange(bucket.count)
+                if idx < self.max_samples:
+                    bucket.samples[idx] = value
+
+    def summary(self, percentiles: Iterable[float] = (50, 90, 99)) -> dict:
+        """보관중인 전체 구간의 요약"""
+        with self._lock:
+            buckets = list(self._buckets)
+        return self._summarize(buckets, percentiles)
+
+    def history(self, percentiles: Iterable[float] = (50, 90, 99)) -> List[dict]:
+        """bucket 별 요약 (오래된 순)"""
+        with self._lock:
+            buckets = list(self._buckets)
+        return [dict(start=b.start, **self._summarize([b], percentiles)) for b in buckets]
+
+    @staticmethod
+    def _summarize(buckets: List[_Bucket], percentiles: Iterable[float]) -> dict:
+        count = sum(b.count for b in buckets)
+        values = sorted(v for b in buckets for v in b.samples)
+        result = {
+            "count": count,
+            "avg": (sum(b.total for b in buckets) / count) if count else None,
+            "max": max((b.max for b in buckets), default=None) if count else None,
+        }
+        for p in percentiles:
+            result[f"p{p:g}"] = percentile(values, p)
+        return result
+
+
+class StageMetrics:
+    """
+    단계(stage)별 소요시간과 성공/실패 횟수
+     - with metrics.measure("upload"): ... 처럼 사용, 예외가 나면 실패로 집계
+    """
+
+    def __init__(self):
+        self._latency: dict[str, WindowedHistogram] = {}
+        self._errors: dict[str, Counter] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, stage: str) -> tuple[WindowedHistogram, Counter]:
+        with self._lock:
+            if stage not in self._latency:
+                self._latency[stage] = WindowedHistogram()
+                self._errors[stage] = Counter()
+            return self._latency[stage], self._errors[stage]
+
+    def observe(self, stage: str, elapsed_ms: float, ok: bool = True):
+        latency, errors = self._get(stage)
+        latency.observe(elapsed_ms)
+        if not ok:
+            errors.inc()
+
+    @contextmanager
+    def measure(self, stage: str):
+        start = time.perf_counter()
+        ok = False
+        try:
+            yield
+            ok = True
+        finally:
+            self.observe(stage, (time.perf_counter() - start) * 1000, ok)
+
+    def summary(self) -> dict:
+        with self._lock:
+            stages = list(self._latency)
+        result = {}
+        for stage in stages:
+            latency, errors = self._get(stage)
+            result[stage] = dict(latency.summary(), errors=errors.value)
+        return result
@@ -47,19 +47,20 @@ def time_parse(_time: str):
     )
 
 
+# 하루 안에서 식사시간 정렬 순서
+MEALTIME_ORDER = {
+    MealTime.BREAKFAST: 0,
+    MealTime.BRUNCH: 1,
+    MealTime.LUNCH: 2,
+    MealTime.LINNER: 3,
+    MealTime.DINNER: 4,
+    MealTime.SNACK: 5,
+}
+
+
 def mealtime_parse(_time: MealTime):
-    if _time == MealTime.BREAKFAST:
-        return 0
-    if _time == MealTime.BRUNCH:
-        return 1
-    if _time == MealTime.LUNCH:
-        return 2
-    if _time == MealTime.LINNER:
-        return 3
-    if _time == MealTime.DINNER:
-        return 4
-    if _time == MealTime.SNACK:
-        return 5
+    if _time in MEALTIME_ORDER:
+        return MEALTIME_ORDER[_time]
     raise HTTPException(
         status_code=HTTPStatus.BAD_REQUEST,
         detail="invalid mealtime"
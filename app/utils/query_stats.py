@@ -0,0 +1,120 @@
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+_IN_LIST = re.compile(r"\((?:\s*(?:\?|%\(\w+\)s|\$\d+|:\w+)\s*,)+\s*(?:\?|%\(\w+\)s|\$\d+|:\w+)\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """
+    파라미터 개수와 공백 차이를 무시한 SQL 모양
+     - IN (?, ?, ?) -> IN (?...)
+    """
+    shape = _WHITESPACE.sub(" ", statement).strip()
+    return _IN_LIST.sub("(?...)", shape)
+
+
+@dataclass
+class QueryStats:
+    """
+    하나의 실행 흐름(요청)에서 실행된 SQL 통계
+    """
+    route: str | None = None
+    count: int = 0
+    total_ms: float = 0.0
+    shapes: Counter = field(default_factory=Counter)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, statement: str, elapsed_ms: float):
+        with self._lock:
+            self.count += 1
+            self.total_ms += elapsed_ms
+            self.shapes[statement_shape(statement)] += 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """threshold 번 이상 반복된 SQL (N+1 의심)"""
+        return [(shape, n) for shape, n in self.shapes.most_common() if n >= threshold]
+
+
+_query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def current_query_stats() -> QueryStats | None:
+    return _query_stats.get()
+
+
+@contextmanager
+def track_queries(route: str | None = None):
+    """
+    with 블록 안에서 실행된 SQL 을 QueryStats 로 수집
+     - 스레드풀/run_sync 로 넘어간 작업도 context 가 복사되므로 함께 집계됨
+    """
+    stats = QueryStats(route=route)
+    token = _query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _query_stats.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _query_stats.get() is not None and context is not None:
+        context._query_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _query_stats.get()
+    start = getattr(context, "_query_start", None)
+    if stats is None or start is None:
+        return
+    stats.record(statement, (time.perf_counter() - start) * 1000)
+
+
+def install_query_listeners(engine):
+    """
+    engine(동기 Engine 또는 AsyncEngine.sync_engine)에 SQL 집계 이벤트 등록
+    """
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+@contextmanager
+def count_all_queries(*engines):
+    """
+    with 블록 동안 engines 에서 실행된 모든 SQL 을 실행 흐름과 상관없이 수집 (테스트용)
+    """
+    stats = QueryStats()
+
+    def before(conn, cursor, statement, parameters, context, executemany):
+        conn.info["count_all_start"] = time.perf_counter()
+
+    def after(conn, cursor, statement, parameters, context, executemany):
+        start = conn.info.pop("count_all_start", time.perf_counter())
+        stats.record(statement, (time.perf_counter() - start) * 1000)
+
+    for engine in engines:
+        event.listen(engine, "before_cursor_execute", before)
+        event.listen(engine, "after_cursor_execute", after)
+    try:
+        yield stats
+    finally:
+        for engine in engines:
+            event.remove(engine, "before_cursor_execute", before)
+            event.remove(engine, "after_cursor_execute", after)
+
+
+def log_n_plus_one(stats: QueryStats, threshold: int, where: str = ""):
+    for shape, n in stats.repeated(threshold):
+        logger.warning("N+1 의심 %s: 같은 SQL %d회 실행 - %s", where, n, shape[:300])
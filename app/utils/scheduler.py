@@ -26,3 +26,9 @@ def start_track_scheduler():
     scheduler = BackgroundScheduler()
     scheduler.add_job(check_and_end_tracks, 'cron', hour=0, minute=0)  # ⏰ 매일 0시 실행
     scheduler.start()
+
+
+def start_image_gc_scheduler(image_gc, hour: int, dry_run: bool = False):
+    scheduler = BackgroundScheduler()
+    scheduler.add_job(image_gc.sweep, 'cron', hour=hour, minute=0, kwargs={"dry_run": dry_run})  # storage orphan 사진 정리
+    scheduler.start()
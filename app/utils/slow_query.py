@@ -0,0 +1,121 @@
+import json
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+from datetime import datetime
+
+from sqlalchemy import event
+
+from app.utils.query_stats import current_query_stats
+
+logger = logging.getLogger(__name__)
+
+_NO_LOG = "slow_query_log"  # execution_options 키, False 면 기록하지 않음 (EXPLAIN 자체 등)
+
+
+def find_repository_caller(marker: str = "_repo_impl") -> str | None:
+    """
+    호출 스택에서 repository 구현(…_repo_impl.py)의 메서드 위치를 찾음
+    """
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if marker in filename:
+            module = os.path.splitext(os.path.basename(filename))[0]
+            return f"{module}.{frame.f_code.co_name}:{frame.f_lineno}"
+        frame = frame.f_back
+    return None
+
+
+class ExplainWorker:
+    """
+    느린 SELECT 의 EXPLAIN (ANALYZE, BUFFERS) 결과를 백그라운드 스레드에서 수집해 파일(json lines)에 기록
+     - 요청 처리 흐름을 막지 않도록 큐가 가득 차면 버림
+    """
+
+    def __init__(self, engine, path: str, max_queue: int = 100):
+        self.engine = engine
+        self.path = path
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._thread: threading.Thread | None = None
+
+    def submit(self, record: dict, statement: str, parameters):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="explain-worker", daemon=True)
+            self._thread.start()
+        try:
+            self._queue.put_nowait((record, statement, parameters))
+        except queue.Full:
+            logger.debug("EXPLAIN 큐가 가득 차서 건너뜀")
+
+    def _run(self):
+        while True:
+            record, statement, parameters = self._queue.get()
+            try:
+                record["plan"] = self._explain(statement, parameters)
+            except Exception as e:
+                record["plan_error"] = str(e)
+            self._write(record)
+
+    def _explain(self, statement: str, parameters) -> str:
+        with self.engine.connect() as conn:
+            conn = conn.execution_options(**{_NO_LOG: False})
+            try:
+                rows = conn.exec_driver_sql("EXPLAIN (ANALYZE, BUFFERS) " + statement, parameters)
+                return "\n".join(row[0] for row in rows)
+            finally:
+                conn.rollback()
+
+    def _write(self, record: dict):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+
+
+class SlowQueryLogger:
+    """
+    threshold_ms 이상 걸린 SQL 을 파라미터, 호출한 repository 메서드, 요청 경로와 함께 로그
+     - explain_worker 가 있으면 (postgres) SELECT 문의 실행계획도 비동기로 수집
+    """
+
+    def __init__(self, threshold_ms: float, explain_worker: ExplainWorker | None = None):
+        self.threshold_ms = threshold_ms
+        self.explain_worker = explain_worker
+
+    def install(self, engine):
+        event.listen(engine, "before_cursor_execute", self._before)
+        event.listen(engine, "after_cursor_execute", self._after)
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._slow_query_start = time.perf_counter()
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        start = getattr(context, "_slow_query_start", None)
+        if start is None or not context.execution_options.get(_NO_LOG, True):
+            return
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if elapsed_ms < self.threshold_ms:
+            return
+
+        stats = current_query_stats()
+        record = {
+            "time": datetime.now().isoformat(timespec="seconds"),
+            "elapsed_ms": round(elapsed_ms, 2),
+            "route": stats.route if stats is not None else None,
+            "caller": find_repository_caller(),
+            "statement": statement,
+            "parameters": repr(parameters)[:500],
+        }
+        logger.warning("slow query %.1fms %s [%s] %s params=%s", elapsed_ms, record["route"], record["caller"],
+                       " ".join(statement.split())[:300], record["parameters"])
+
+        # ANALYZE 는 실제로 실행하므로 SELECT 만
+        if self.explain_worker is not None and not executemany \
+                and statement.lstrip().upper().startswith("SELECT"):
+            self.explain_worker.submit(record, statement, parameters)
@@ -0,0 +1,123 @@
+"""
+sync 스택 vs async 스택 초당 처리량(requests/sec) 비교 벤치마크
+
+ - sync  : async 라우트에서 동기 repository 를 그대로 호출 (이벤트 루프가 DB 응답을 기다리며 멈춤)
+ - async : run_db_bound 로 AsyncSession(asyncpg/aiosqlite) 위에서 같은 repository 를 실행
+
+실행 예시
+    python -m benchmarks.bench_async_db --requests 500 --concurrency 100 --latency-ms 5
+    BENCH_DATABASE_URL=postgresql://user:pw@localhost/bench python -m benchmarks.bench_async_db
+
+--latency-ms 는 DB 왕복 지연을 흉내내기 위해 조회 전에 sleep 쿼리를 한번 더 실행한다.
+(sqlite: 사용자 정의 함수 bench_sleep, postgres: pg_sleep)
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime
+
+# Settings 필수 값 채우기 (벤치마크 전용)
+os.environ.setdefault("SQLALCHEMY_DATABASE_URL", os.environ.get("BENCH_DATABASE_URL", "sqlite:///./bench_async_db.sqlite3"))
+os.environ["DB_ASYNC_MODE"] = "true"
+for _key in ["POSTGRES_USER", "POSTGRES_PASSWORD", "POSTGRES_DB", "JWT_SECRET_KEY", "KAKAO_CLIENT_ID",
+             "KAKAO_CLIENT_SECRET", "KAKAO_REDIRECT_URI", "REDIRECT_URI", "FIREBASE_FCM_API_KEY", "FIREBASE_PATH",
+             "FIREBASE_BUCKET", "SID", "AUTH_TOKEN", "PHONE_NUMBER", "SMS_KEY", "SMS_SECRET_KEY", "MY_PHONE_NUMBER",
+             "FERNET_KEY", "TEST_SQLALCHEMY_DATABASE_URL"]:
+    os.environ.setdefault(_key, "bench")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "60")
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import event, text
+
+from app.core.auth import Role
+from app.database import engine, async_engine, session_scope, run_db_bound, SQLALCHEMY_DATABASE_URL
+from app.modules.user.infra.db_models.user import User
+from app.modules.user.infra.user_repo_impl import UserRepository
+from app.modules.user.interface.schema.user_schema import Rank
+
+BENCH_USER_ID = "01BENCHUSER000000000000000"
+IS_SQLITE = SQLALCHEMY_DATABASE_URL.startswith("sqlite")
+
+
+def _register_sqlite_sleep(dbapi_connection, connection_record):
+    dbapi_connection.create_function("bench_sleep", 1, lambda ms: time.sleep(ms / 1000) or 0)
+
+
+if IS_SQLITE:
+    event.listen(engine, "connect", _register_sqlite_sleep)
+    event.listen(async_engine.sync_engine, "connect", _register_sqlite_sleep)
+
+
+def seed():
+    User.__table__.create(engine, checkfirst=True)
+    with session_scope() as db:
+        if db.get(User, BENCH_USER_ID) is None:
+            now = datetime.now()
+            db.add(User(id=BENCH_USER_ID, username="bench", name="bench", cellphone="01000000000",
+                        nickname="bench", rank=Rank.BRONZE, email="bench@example.com", password="x",
+                        role=Role.USER, create_date=now, update_date=now))
+            db.commit()
+
+
+def build_app(latency_ms: float) -> FastAPI:
+    latency_sql = "SELECT bench_sleep(:ms)" if IS_SQLITE else "SELECT pg_sleep(:ms / 1000.0)"
+    repo = UserRepository()
+
+    def lookup(user_id: str):
+        with session_scope() as db:
+            if latency_ms > 0:
+                db.execute(text(latency_sql), {"ms": latency_ms})
+            return repo.find_by_id(user_id).id
+
+    bench_app = FastAPI()
+
+    @bench_app.get("/sync/{user_id}")
+    async def sync_lookup(user_id: str):
+        return lookup(user_id)
+
+    @bench_app.get("/async/{user_id}")
+    async def async_lookup(user_id: str):
+        return await run_db_bound(lookup, user_id)
+
+    return bench_app
+
+
+async def run_load(bench_app: FastAPI, stack: str, total: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=bench_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def one():
+            async with semaphore:
+                response = await client.get(f"/{stack}/{BENCH_USER_ID}")
+                response.raise_for_status()
+
+        await one()  # 워밍업 (커넥션 풀 생성)
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(total)))
+        elapsed = time.perf_counter() - started
+    return total / elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    args = parser.parse_args(argv)
+
+    seed()
+    bench_app = build_app(args.latency_ms)
+    print(f"database={SQLALCHEMY_DATABASE_URL} requests={args.requests} "
+          f"concurrency={args.concurrency} latency_ms={args.latency_ms}")
+    results = {}
+    for stack in ("sync", "async"):
+        results[stack] = asyncio.run(run_load(bench_app, stack, args.requests, args.concurrency))
+        print(f"{stack:>6}: {results[stack]:10.1f} req/s")
+    print(f"speedup: {results['async'] / results['sync']:.2f}x")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+"""
+YOLO 추론 요청 개별 전송 vs micro-batching(YoloBatcher) 처리량 비교
+
+ - single : 요청마다 YoloClient.infer (POST /yolo/)
+ - batch  : YoloBatcher 가 window 동안 모아서 YoloClient.infer_batch (POST /yolo/batch)
+
+기본값은 benchmarks.fake_yolo_server 를 프로세스 안에서(ASGI transport) 띄워서 측정한다.
+--url 을 주면 따로 띄운 서버에 요청한다.
+
+실행 예시
+    python -m benchmarks.bench_yolo_batching --requests 200 --concurrency 100 --window-ms 20 --max-batch 16
+    python -m benchmarks.bench_yolo_batching --url http://localhost:8100
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+import httpx
+
+for _key in ["POSTGRES_USER", "POSTGRES_PASSWORD", "POSTGRES_DB", "JWT_SECRET_KEY", "KAKAO_CLIENT_ID",
+             "KAKAO_CLIENT_SECRET", "KAKAO_REDIRECT_URI", "REDIRECT_URI", "FIREBASE_FCM_API_KEY", "FIREBASE_PATH",
+             "FIREBASE_BUCKET", "SID", "AUTH_TOKEN", "PHONE_NUMBER", "SMS_KEY", "SMS_SECRET_KEY", "MY_PHONE_NUMBER",
+             "FERNET_KEY", "TEST_SQLALCHEMY_DATABASE_URL", "SQLALCHEMY_DATABASE_URL"]:
+    os.environ.setdefault(_key, "bench")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "60")
+
+from app.modules.mealday.infra.yolo_batcher import YoloBatcher  # noqa: E402
+from app.modules.mealday.infra.yolo_client import YoloClient  # noqa: E402
+from benchmarks.fake_yolo_server import create_app  # noqa: E402
+
+
+def make_client(args) -> YoloClient:
+    client = YoloClient(args.url or "http://fake-yolo", max_concurrency=args.concurrency, read_timeout=120)
+    if not args.url:
+        fake = create_app(args.overhead_ms, args.per_image_ms)
+        client._client = httpx.AsyncClient(base_url="http://fake-yolo", transport=httpx.ASGITransport(app=fake),
+                                           timeout=client.timeout)
+    return client
+
+
+async def run(infer, n_requests: int, concurrency: int) -> tuple[float, list[float]]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one(i):
+        async with semaphore:
+            start = time.perf_counter()
+            await infer(f"https://signed/temp/bench-{i}")
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(n_requests)))
+    return time.perf_counter() - start, sorted(latencies)
+
+
+async def main_async(args):
+    print(f"requests={args.requests} concurrency={args.concurrency} window={args.window_ms}ms "
+          f"max_batch={args.max_batch} (model: {args.overhead_ms}ms + {args.per_image_ms}ms/image)")
+    print(f"{'mode':>6} {'req/s':>8} {'p50(ms)':>9} {'p99(ms)':>9}")
+
+    client = make_client(args)
+    elapsed, lat = await run(client.infer, args.requests, args.concurrency)
+    print(f"{'single':>6} {args.requests / elapsed:>8.1f} {statistics.median(lat):>9.1f} "
+          f"{lat[int(len(lat) * 0.99) - 1]:>9.1f}")
+    await client.aclose()
+
+    batcher = YoloBatcher(make_client(args), window_ms=args.window_ms, max_batch_size=args.max_batch)
+    elapsed, lat = await run(batcher.infer, args.requests, args.concurrency)
+    print(f"{'batch':>6} {args.requests / elapsed:>8.1f} {statistics.median(lat):>9.1f} "
+          f"{lat[int(len(lat) * 0.99) - 1]:>9.1f}  (batches={batcher.stats()['batches']}, "
+          f"avg size={batcher.stats()['batch_size']['avg']:.1f})")
+    await batcher.aclose()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default=None, help="따로 띄운 fake_yolo_server 주소 (없으면 프로세스 안에서 실행)")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--window-ms", type=float, default=20)
+    parser.add_argument("--max-batch", type=int, default=16)
+    parser.add_argument("--overhead-ms", type=float, default=40)
+    parser.add_argument("--per-image-ms", type=float, default=5)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
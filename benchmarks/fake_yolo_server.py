@@ -0,0 +1,58 @@
+"""
+GPU 없이 쓰는 가짜 YOLO 추론 서버 (POST /yolo/, POST /yolo/batch)
+
+GPU 하나를 흉내내기 위해 추론은 한번에 하나씩(lock) 실행되고,
+호출 한번에 --overhead-ms(모델 호출/전처리 고정비용) + 사진당 --per-image-ms 가 걸린다.
+
+실행 예시
+    python -m benchmarks.fake_yolo_server --port 8100 --overhead-ms 40 --per-image-ms 5
+    YOLO_SERVER_URL=http://localhost:8100 YOLO_BATCH_ENABLED=true uvicorn app.main:app
+"""
+import argparse
+import asyncio
+
+from fastapi import FastAPI, Query
+from pydantic import BaseModel
+
+
+class BatchBody(BaseModel):
+    urls: list[str]
+
+
+def create_app(overhead_ms: float = 40, per_image_ms: float = 5) -> FastAPI:
+    app = FastAPI()
+    gpu = asyncio.Lock()
+    app.state.calls = 0
+
+    async def run_model(urls: list[str]) -> list[dict]:
+        async with gpu:
+            app.state.calls += 1
+            await asyncio.sleep((overhead_ms + per_image_ms * len(urls)) / 1000)
+        return [{"is_success": True, "url": url, "foods": [{"label": 1, "name": "음식1", "confidence": 0.9}]}
+                for url in urls]
+
+    @app.post("/yolo/", status_code=201)
+    async def infer(url: str = Query(...)):
+        return (await run_model([url]))[0]
+
+    @app.post("/yolo/batch", status_code=201)
+    async def infer_batch(body: BatchBody):
+        return {"results": await run_model(body.urls)}
+
+    return app
+
+
+def main():
+    import uvicorn
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--overhead-ms", type=float, default=40)
+    parser.add_argument("--per-image-ms", type=float, default=5)
+    args = parser.parse_args()
+    uvicorn.run(create_app(args.overhead_ms, args.per_image_ms), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
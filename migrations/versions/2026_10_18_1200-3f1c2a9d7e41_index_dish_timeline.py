@@ -0,0 +1,28 @@
+"""index dish timeline
+
+Revision ID: 3f1c2a9d7e41
+Revises: 6b9cc2f3ce8d
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c2a9d7e41'
+down_revision: Union[str, None] = '6b9cc2f3ce8d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f('ix_Dish_mealday_id'), 'Dish', ['mealday_id'], unique=False)
+    op.create_index(op.f('ix_RoutineFoodCheck_dish_id'), 'RoutineFoodCheck', ['dish_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_RoutineFoodCheck_dish_id'), table_name='RoutineFoodCheck')
+    op.drop_index(op.f('ix_Dish_mealday_id'), table_name='Dish')
@@ -0,0 +1,44 @@
+"""add pending upload
+
+Revision ID: 8d2e4b6a1c57
+Revises: 3f1c2a9d7e41
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d2e4b6a1c57'
+down_revision: Union[str, None] = '3f1c2a9d7e41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('PendingUpload',
+    sa.Column('id', sa.String(length=26), nullable=False),
+    sa.Column('user_id', sa.String(length=26), nullable=False),
+    sa.Column('purpose', sa.Enum('DISH', 'MOOSE', name='uploadpurpose'), nullable=False),
+    sa.Column('file_path', sa.String(length=255), nullable=False),
+    sa.Column('content_type', sa.String(length=50), nullable=False),
+    sa.Column('status', sa.Enum('PENDING', 'FINALIZED', name='uploadstatus'), nullable=False),
+    sa.Column('size', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('expires_at', sa.DateTime(), nullable=False),
+    sa.Column('finalized_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['User.id'], name=op.f('fk_PendingUpload_user_id_User')),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_PendingUpload')),
+    sa.UniqueConstraint('file_path', name=op.f('uq_PendingUpload_file_path'))
+    )
+    op.create_index('_upload_status_created_index', 'PendingUpload', ['status', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('_upload_status_created_index', table_name='PendingUpload')
+    op.drop_table('PendingUpload')
+    sa.Enum(name='uploadstatus').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='uploadpurpose').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,44 @@
+"""add image ref
+
+Revision ID: 5a7c9e1b3d24
+Revises: 8d2e4b6a1c57
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a7c9e1b3d24'
+down_revision: Union[str, None] = '8d2e4b6a1c57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('ImageRef',
+    sa.Column('path', sa.String(length=255), nullable=False),
+    sa.Column('content_hash', sa.String(length=64), nullable=True),
+    sa.Column('ref_count', sa.Integer(), nullable=False),
+    sa.Column('pinned', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('path', name=op.f('pk_ImageRef'))
+    )
+    op.create_index(op.f('ix_ImageRef_content_hash'), 'ImageRef', ['content_hash'], unique=False)
+
+    # 기존 dish 사진 참조 수 채우기, 음식 카탈로그 사진은 pinned
+    op.execute(
+        'INSERT INTO "ImageRef" (path, ref_count, pinned, created_at) '
+        'SELECT image_url, count(*), false, CURRENT_TIMESTAMP FROM "Dish" '
+        'WHERE image_url IS NOT NULL GROUP BY image_url'
+    )
+    op.execute('UPDATE "ImageRef" SET pinned = true WHERE path IN (SELECT image_url FROM "Food")')
+    # meal/ 중복 사진 정리는 storage 작업이라 별도 실행: python -m app.scripts.dedupe_meal_images
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_ImageRef_content_hash'), table_name='ImageRef')
+    op.drop_table('ImageRef')
@@ -0,0 +1,40 @@
+"""add outbox event
+
+Revision ID: c2f8a4d6e913
+Revises: 5a7c9e1b3d24
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2f8a4d6e913'
+down_revision: Union[str, None] = '5a7c9e1b3d24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('OutboxEvent',
+    sa.Column('id', sa.String(length=26), nullable=False),
+    sa.Column('kind', sa.Enum('BLOB_DELETE', 'BLOB_COPY', 'FCM_SEND', name='outboxkind'), nullable=False),
+    sa.Column('payload', sa.JSON(), nullable=False),
+    sa.Column('status', sa.Enum('PENDING', 'DEAD', name='outboxstatus'), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('available_at', sa.DateTime(), nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_OutboxEvent'))
+    )
+    op.create_index('_outbox_status_available_index', 'OutboxEvent', ['status', 'available_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('_outbox_status_available_index', table_name='OutboxEvent')
+    op.drop_table('OutboxEvent')
+    sa.Enum(name='outboxstatus').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='outboxkind').drop(op.get_bind(), checkfirst=True)